@@ -0,0 +1,104 @@
+-- ============================================
+-- BOOKING RPC MIGRATION
+-- ChurchEase V.2 - create a reservation in one round trip
+-- ============================================
+-- POST /api/reservations used to make five requests in a row: insert the
+-- client, pick a user for created_by, look up the priest, insert the
+-- reservation, insert the payment. A failure after the first insert left an
+-- orphaned client. book_reservation() does all of it in one transaction.
+--
+-- The app passes p_created_by (the signed-in user, or its cached system
+-- user); without it the oldest user is used, or a 'system' user is created.
+--
+-- Keys left out of the JSON objects get the column default, as with a
+-- PostgREST insert. Like before, a payment that cannot be saved does not
+-- block the booking: only the payment is rolled back, and the reason is
+-- returned in payment_error.
+--
+-- When p_client carries a client_key (add_client_dedup.sql), a returning
+-- client's row is reused as it is on file: p_client only fills in the
+-- details that are still blank there, so a booking from the public form
+-- cannot rewrite another client's email or phone.
+
+-- Earlier version of this migration, without p_created_by
+DROP FUNCTION IF EXISTS book_reservation(JSONB, JSONB, JSONB, TEXT);
+
+CREATE OR REPLACE FUNCTION book_reservation(
+    p_client JSONB,
+    p_reservation JSONB,
+    p_payment JSONB DEFAULT NULL,
+    p_priest_id TEXT DEFAULT NULL,
+    p_created_by UUID DEFAULT NULL
+)
+RETURNS TABLE (client JSONB, reservation JSONB, payment JSONB, payment_error TEXT, priest JSONB) AS $$
+DECLARE
+    v_priest JSONB;
+    v_priest_id UUID;
+    v_created_by UUID := p_created_by;
+    v_client JSONB;
+    v_reservation JSONB;
+    v_payment JSONB;
+    v_payment_error TEXT;
+BEGIN
+    IF p_priest_id IS NOT NULL AND p_priest_id <> '' THEN
+        SELECT to_jsonb(p.*), p.id INTO v_priest, v_priest_id
+        FROM priests p WHERE p.id::text = p_priest_id;
+    END IF;
+
+    IF v_created_by IS NULL THEN
+        SELECT u.id INTO v_created_by FROM users u ORDER BY u.created_at LIMIT 1;
+    END IF;
+    IF v_created_by IS NULL THEN
+        INSERT INTO users (username, email, password_hash, role)
+        VALUES ('system', 'system@churchease.com', 'system_hash', 'secretary')
+        RETURNING id INTO v_created_by;
+    END IF;
+
+    EXECUTE format(
+        'INSERT INTO clients (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::clients, $1) %2$s '
+        'RETURNING to_jsonb(clients.*)',
+        (SELECT string_agg(quote_ident(key), ', ') FROM jsonb_object_keys(p_client) AS key),
+        CASE WHEN p_client->>'client_key' IS NULL THEN '' ELSE
+            'ON CONFLICT (client_key) DO UPDATE SET ' || (
+                SELECT string_agg(format('%1$I = COALESCE(NULLIF(clients.%1$I, %2$L), EXCLUDED.%1$I)', key, ''), ', ')
+                FROM jsonb_object_keys(p_client) AS key
+            )
+        END
+    ) INTO v_client USING p_client;
+
+    p_reservation := p_reservation || jsonb_build_object(
+        'client_id', v_client->>'id',
+        'created_by', v_created_by,
+        'priest_id', v_priest_id,
+        'status', CASE WHEN v_priest_id IS NULL THEN 'pending' ELSE 'waiting_priest_approval' END
+    );
+    EXECUTE format(
+        'INSERT INTO reservations (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::reservations, $1) '
+        'RETURNING to_jsonb(reservations.*)',
+        (SELECT string_agg(quote_ident(key), ', ') FROM jsonb_object_keys(p_reservation) AS key)
+    ) INTO v_reservation USING p_reservation;
+
+    IF p_payment IS NOT NULL THEN
+        p_payment := p_payment || jsonb_build_object('reservation_id', v_reservation->>'id');
+        BEGIN
+            EXECUTE format(
+                'INSERT INTO payments (%1$s) SELECT %1$s FROM jsonb_populate_record(NULL::payments, $1) '
+                'RETURNING to_jsonb(payments.*)',
+                (SELECT string_agg(quote_ident(key), ', ') FROM jsonb_object_keys(p_payment) AS key)
+            ) INTO v_payment USING p_payment;
+        EXCEPTION WHEN OTHERS THEN
+            v_payment_error := SQLERRM;
+        END;
+    END IF;
+
+    RETURN QUERY SELECT v_client, v_reservation, v_payment, v_payment_error, v_priest;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Make the function callable through the REST API right away
+NOTIFY pgrst, 'reload schema';
+
+-- Verify
+SELECT proname, pg_get_function_arguments(oid) AS arguments
+FROM pg_proc
+WHERE proname = 'book_reservation';
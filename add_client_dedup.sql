@@ -0,0 +1,71 @@
+-- ============================================
+-- CLIENT DEDUPLICATION MIGRATION
+-- ChurchEase V.2 - one clients row per family
+-- ============================================
+-- Every booking used to insert a new clients row, so a family that booked a
+-- baptism and later a confirmation had two. client_key is the app's
+-- normalized identity of a client (name plus phone digits, or name plus
+-- email when there is no phone); with the unique index below, bookings
+-- upsert on it and a returning family keeps its row.
+--
+-- Rows created before this migration have no client_key (NULLs never
+-- conflict) until the merge job has folded the duplicates together and
+-- keyed what is left:
+--   flask --app app dedupe-clients --dry-run
+--   flask --app app dedupe-clients
+--
+-- Afterwards run add_book_reservation_rpc.sql again, so book_reservation()
+-- upserts the client as well.
+--
+-- The merge job hands its work to merge_clients() a batch at a time. Each
+-- call moves the duplicates' reservations to the kept row, deletes the
+-- duplicates and saves the kept row's merged details and key in one
+-- transaction, so a run that fails leaves every batch either fully merged or
+-- untouched, and running the job again finishes the rest. (Deleting a client
+-- cascades to its reservations, which is why they move first.)
+
+ALTER TABLE clients ADD COLUMN IF NOT EXISTS client_key TEXT;
+
+CREATE UNIQUE INDEX IF NOT EXISTS clients_client_key_key ON clients (client_key);
+
+-- p_groups: [{"keep": {clients row with merged details and client_key},
+--             "duplicate_ids": [ids of the rows merged into it]}, ...]
+-- Returns the number of rows deleted.
+CREATE OR REPLACE FUNCTION merge_clients(p_groups JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    v_group JSONB;
+    v_keep JSONB;
+    v_keep_id UUID;
+    v_duplicate_ids UUID[];
+    v_merged INTEGER := 0;
+BEGIN
+    FOR v_group IN SELECT * FROM jsonb_array_elements(p_groups) LOOP
+        v_keep := v_group->'keep';
+        v_keep_id := (v_keep->>'id')::UUID;
+        v_duplicate_ids := ARRAY(
+            SELECT jsonb_array_elements_text(COALESCE(v_group->'duplicate_ids', '[]'::JSONB))::UUID
+        );
+
+        IF COALESCE(array_length(v_duplicate_ids, 1), 0) > 0 THEN
+            UPDATE reservations SET client_id = v_keep_id WHERE client_id = ANY(v_duplicate_ids);
+            DELETE FROM clients WHERE id = ANY(v_duplicate_ids) AND id <> v_keep_id;
+            v_merged := v_merged + array_length(v_duplicate_ids, 1);
+        END IF;
+
+        UPDATE clients SET
+            first_name = COALESCE(v_keep->>'first_name', first_name),
+            last_name = COALESCE(v_keep->>'last_name', last_name),
+            phone = COALESCE(v_keep->>'phone', phone),
+            email = v_keep->>'email',
+            address = v_keep->>'address',
+            client_key = v_keep->>'client_key'
+        WHERE id = v_keep_id;
+    END LOOP;
+
+    RETURN v_merged;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Verify
+SELECT COUNT(*) AS clients, COUNT(client_key) AS keyed_clients FROM clients;
@@ -0,0 +1,23 @@
+-- ============================================
+-- LIVE NOTIFICATIONS MIGRATION
+-- ChurchEase V.2 - /api/stream cross-worker fan-out
+-- ============================================
+-- Only needed with LIVE_UPDATES_BACKEND=supabase (more than one gunicorn
+-- worker). Write handlers insert a small row here; each worker with open
+-- /api/stream connections polls for rows newer than the last id it saw.
+
+CREATE TABLE IF NOT EXISTS live_notifications (
+    id BIGSERIAL PRIMARY KEY,
+    change_type VARCHAR(50) NOT NULL,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_live_notifications_created_at ON live_notifications(created_at);
+
+-- Notifications are only useful for a few seconds; clients that were away
+-- catch up through /api/sync. Run periodically (or from pg_cron):
+-- DELETE FROM live_notifications WHERE created_at < NOW() - INTERVAL '1 hour';
+
+-- Verify
+SELECT COUNT(*) AS live_notifications FROM live_notifications;
@@ -0,0 +1,40 @@
+-- ============================================
+-- OTP CODES MIGRATION
+-- ChurchEase V.2 - sign-up and password reset codes shared by all workers
+-- ============================================
+-- Only needed with OTP_STORAGE_BACKEND=supabase (more than one gunicorn
+-- worker). A code sent by one worker is checked by whichever worker gets the
+-- verify request, so the pending codes cannot live in process memory.
+--
+-- The payload holds a keyed hash of the code (HMAC with SECRET_KEY), never
+-- the code itself. Row level security is on and only the service role has a
+-- policy: with the public anon key the table can be neither read nor
+-- written, so SUPABASE_KEY must be the service_role key for this backend.
+
+CREATE TABLE IF NOT EXISTS otp_codes (
+    email VARCHAR(255) PRIMARY KEY,
+    payload JSONB NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_otp_codes_expires_at ON otp_codes(expires_at);
+
+-- Enable Row Level Security (RLS)
+ALTER TABLE otp_codes ENABLE ROW LEVEL SECURITY;
+
+-- RLS Policies
+-- Only the app, signed in with the service_role key
+DROP POLICY IF EXISTS otp_codes_service_role ON otp_codes;
+CREATE POLICY otp_codes_service_role
+    ON otp_codes
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+-- Codes expire after 10 minutes; run periodically (or from pg_cron):
+-- DELETE FROM otp_codes WHERE expires_at < NOW();
+
+-- Verify
+SELECT COUNT(*) AS otp_codes FROM otp_codes;
@@ -0,0 +1,22 @@
+-- ============================================
+-- REPORT SNAPSHOTS MIGRATION
+-- ChurchEase V.2 - frozen monthly figures for /print-reports
+-- ============================================
+-- /print-reports renders one section per month from these figures. Once a
+-- month has ended its snapshot is computed once and stored here, so printing
+-- the annual report reads one row per month instead of re-running every
+-- aggregate query. The current month is never stored; it is recomputed when
+-- printed.
+--
+-- Without this table the snapshots are only kept in each worker's memory.
+-- To recompute a month after late edits:
+--   flask --app app report-snapshots --year 2025 --month 5 --refresh
+
+CREATE TABLE IF NOT EXISTS report_snapshots (
+    month_start DATE PRIMARY KEY CHECK (EXTRACT(DAY FROM month_start) = 1),
+    data JSONB NOT NULL,
+    generated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Verify
+SELECT month_start, generated_at FROM report_snapshots ORDER BY month_start;
@@ -0,0 +1,47 @@
+-- ============================================
+-- STIPENDIUM LEDGER MIGRATION
+-- ChurchEase V.2 - paginated payments ledger with totals
+-- ============================================
+-- /api/stipendium/payments used to download every payment, reservation and
+-- client and join them in the app. It now returns one page at a time, sorted
+-- and filtered in the database. The indexes below cover its sort columns
+-- (created_at, amount_paid, amount_due) and its filters (service type,
+-- payment status, payment method), each filter together with the default
+-- newest-first order.
+--
+-- stipendium_totals() adds up every payment that matches the same filters,
+-- so the totals above the ledger are one aggregate query instead of reading
+-- all the matching rows. Each filter takes the spellings to match
+-- ('paid', 'Paid'), because older rows use both; NULL means no filter.
+-- Without the function the app sums the matching rows itself.
+
+CREATE INDEX IF NOT EXISTS idx_payments_created_at ON payments(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_payments_amount_paid ON payments(amount_paid, id);
+CREATE INDEX IF NOT EXISTS idx_payments_amount_due ON payments(amount_due, id);
+CREATE INDEX IF NOT EXISTS idx_payments_service_type ON payments(service_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_payments_status ON payments(payment_status, created_at);
+CREATE INDEX IF NOT EXISTS idx_payments_method ON payments(payment_method, created_at);
+CREATE INDEX IF NOT EXISTS idx_payments_reservation_id ON payments(reservation_id);
+
+CREATE OR REPLACE FUNCTION stipendium_totals(
+    p_start_date DATE DEFAULT NULL,
+    p_end_date DATE DEFAULT NULL,
+    p_service_type TEXT[] DEFAULT NULL,
+    p_payment_status TEXT[] DEFAULT NULL,
+    p_payment_method TEXT[] DEFAULT NULL
+)
+RETURNS TABLE (payments BIGINT, amount_due NUMERIC, amount_paid NUMERIC, outstanding NUMERIC) AS $$
+    SELECT COUNT(*),
+           COALESCE(SUM(p.amount_due), 0),
+           COALESCE(SUM(p.amount_paid), 0),
+           COALESCE(SUM(GREATEST(COALESCE(p.amount_due, 0) - COALESCE(p.amount_paid, 0), 0)), 0)
+    FROM payments p
+    WHERE (p_start_date IS NULL OR p.created_at >= p_start_date)
+      AND (p_end_date IS NULL OR p.created_at < p_end_date + 1)
+      AND (p_service_type IS NULL OR p.service_type = ANY(p_service_type))
+      AND (p_payment_status IS NULL OR p.payment_status = ANY(p_payment_status))
+      AND (p_payment_method IS NULL OR p.payment_method = ANY(p_payment_method));
+$$ LANGUAGE sql STABLE;
+
+-- Verify
+SELECT * FROM stipendium_totals();
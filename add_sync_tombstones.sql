@@ -0,0 +1,80 @@
+-- ============================================
+-- DELTA SYNC MIGRATION
+-- ChurchEase V.2 - /api/sync support
+-- ============================================
+-- /api/sync?since=<cursor> returns only rows whose updated_at is newer than
+-- the cursor, plus the ids of rows deleted since then. This needs:
+--   1. updated_at kept current on reservations, payments and events
+--   2. indexes on updated_at so the delta queries are cheap
+--   3. a tombstone table filled by a delete trigger
+
+-- STEP 1: Make sure payments has updated_at
+ALTER TABLE payments
+ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+
+-- STEP 2: updated_at triggers (reservations and events already have one from supabase_setup.sql)
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_payments_updated_at ON payments;
+CREATE TRIGGER update_payments_updated_at
+    BEFORE UPDATE ON payments
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- STEP 3: Indexes for the delta queries
+CREATE INDEX IF NOT EXISTS idx_reservations_updated_at ON reservations(updated_at);
+CREATE INDEX IF NOT EXISTS idx_payments_updated_at ON payments(updated_at);
+CREATE INDEX IF NOT EXISTS idx_events_updated_at ON events(updated_at);
+
+-- STEP 4: Tombstones for deleted rows
+CREATE TABLE IF NOT EXISTS sync_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    table_name VARCHAR(50) NOT NULL,
+    record_id TEXT NOT NULL,
+    deleted_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_sync_tombstones_deleted_at ON sync_tombstones(deleted_at);
+
+CREATE OR REPLACE FUNCTION record_sync_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO sync_tombstones (table_name, record_id)
+    VALUES (TG_TABLE_NAME, OLD.id::text);
+    RETURN OLD;
+END;
+$$ language 'plpgsql';
+
+-- Catches every delete path: delete_event, cascades from users/clients,
+-- and rows removed by hand in the Supabase dashboard
+DROP TRIGGER IF EXISTS reservations_sync_tombstone ON reservations;
+CREATE TRIGGER reservations_sync_tombstone
+    AFTER DELETE ON reservations
+    FOR EACH ROW
+    EXECUTE FUNCTION record_sync_tombstone();
+
+DROP TRIGGER IF EXISTS payments_sync_tombstone ON payments;
+CREATE TRIGGER payments_sync_tombstone
+    AFTER DELETE ON payments
+    FOR EACH ROW
+    EXECUTE FUNCTION record_sync_tombstone();
+
+DROP TRIGGER IF EXISTS events_sync_tombstone ON events;
+CREATE TRIGGER events_sync_tombstone
+    AFTER DELETE ON events
+    FOR EACH ROW
+    EXECUTE FUNCTION record_sync_tombstone();
+
+-- STEP 5: Optional housekeeping - clients older than this do a full resync anyway
+-- DELETE FROM sync_tombstones WHERE deleted_at < NOW() - INTERVAL '30 days';
+
+-- STEP 6: Verify
+SELECT trigger_name, event_object_table
+FROM information_schema.triggers
+WHERE trigger_name LIKE '%sync_tombstone%' OR trigger_name = 'update_payments_updated_at';
@@ -0,0 +1,128 @@
+// Time to interactive of the admin dashboard landing page, in headless Chrome.
+//
+//     npm install puppeteer          # once, anywhere on the module path
+//     python app.py                  # in another terminal
+//     node benchmarks/admin_dashboard_tti.js [base-url] [runs]
+//
+// Logs in as admin (BENCH_USERNAME / BENCH_PASSWORD, default admin/admin123),
+// then loads /admin-dashboard `runs` times (default 5), each in a fresh
+// browser context so nothing comes from the HTTP cache, and prints the median
+// of each metric.
+//
+// TTI is approximated the way Lighthouse does it: the end of the last long
+// task (>50 ms main-thread work) after First Contentful Paint, or
+// DOMContentLoaded if that is later. Check out the commit before and after a
+// change and run both against the same data to compare.
+const puppeteer = require('puppeteer');
+
+const BASE_URL = (process.argv[2] || 'http://127.0.0.1:5000').replace(/\/$/, '');
+const RUNS = parseInt(process.argv[3] || '5', 10);
+const USERNAME = process.env.BENCH_USERNAME || 'admin';
+const PASSWORD = process.env.BENCH_PASSWORD || 'admin123';
+
+// Collects long tasks from the very start of the navigation
+function observeLongTasks() {
+    window.__longTasks = [];
+    new PerformanceObserver(list => {
+        list.getEntries().forEach(entry => {
+            window.__longTasks.push({ start: entry.startTime, end: entry.startTime + entry.duration });
+        });
+    }).observe({ type: 'longtask', buffered: true });
+}
+
+function collectMetrics() {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    const fcpTime = fcp ? fcp.startTime : 0;
+    const lastLongTask = window.__longTasks
+        .filter(task => task.end > fcpTime)
+        .reduce((latest, task) => Math.max(latest, task.end), 0);
+    const mainThreadBlocked = window.__longTasks
+        .reduce((total, task) => total + Math.max(0, task.end - task.start - 50), 0);
+    const scripts = Array.from(document.scripts);
+
+    return {
+        fcp: fcpTime,
+        domContentLoaded: navigation.domContentLoadedEventEnd,
+        load: navigation.loadEventEnd,
+        tti: Math.max(navigation.domContentLoadedEventEnd, lastLongTask),
+        totalBlockingTime: mainThreadBlocked,
+        htmlBytes: navigation.transferSize,
+        htmlDecodedBytes: navigation.decodedBodySize,
+        inlineScriptBytes: scripts.filter(s => !s.src).reduce((total, s) => total + s.text.length, 0),
+        domNodes: document.getElementsByTagName('*').length
+    };
+}
+
+async function login(browser) {
+    const page = await browser.newPage();
+    await page.goto(`${BASE_URL}/login`);
+    const result = await page.evaluate(async (username, password) => {
+        const response = await fetch('/login', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ username, password })
+        });
+        return response.json();
+    }, USERNAME, PASSWORD);
+    if (!result.success) {
+        throw new Error(`Login failed for ${USERNAME}: ${JSON.stringify(result)}`);
+    }
+    const cookies = await page.cookies();
+    await page.close();
+    return cookies;
+}
+
+async function measure(browser, cookies) {
+    const context = await browser.createBrowserContext();
+    const page = await context.newPage();
+    await page.setCookie(...cookies);
+    await page.evaluateOnNewDocument(observeLongTasks);
+    await page.goto(`${BASE_URL}/admin-dashboard`, { waitUntil: 'networkidle0', timeout: 120000 });
+    // Give trailing long tasks (chart setup, AOS) a moment to be reported
+    await new Promise(resolve => setTimeout(resolve, 1000));
+    const metrics = await page.evaluate(collectMetrics);
+    await context.close();
+    return metrics;
+}
+
+function median(values) {
+    const sorted = [...values].sort((a, b) => a - b);
+    const middle = Math.floor(sorted.length / 2);
+    return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+}
+
+(async () => {
+    const browser = await puppeteer.launch({ headless: true, args: ['--no-sandbox'] });
+    try {
+        const cookies = await login(browser);
+        const runs = [];
+        for (let i = 0; i < RUNS; i++) {
+            const metrics = await measure(browser, cookies);
+            console.log(`run ${i + 1}: TTI ${metrics.tti.toFixed(0)} ms, TBT ${metrics.totalBlockingTime.toFixed(0)} ms`);
+            runs.push(metrics);
+        }
+
+        console.log(`\n/admin-dashboard, median of ${RUNS} cold loads`);
+        const rows = [
+            ['First Contentful Paint', 'fcp', 'ms'],
+            ['DOMContentLoaded', 'domContentLoaded', 'ms'],
+            ['Load', 'load', 'ms'],
+            ['Time to interactive', 'tti', 'ms'],
+            ['Total blocking time', 'totalBlockingTime', 'ms'],
+            ['HTML transferred', 'htmlBytes', 'bytes'],
+            ['HTML decoded', 'htmlDecodedBytes', 'bytes'],
+            ['Inline script', 'inlineScriptBytes', 'bytes'],
+            ['DOM elements', 'domNodes', '']
+        ];
+        rows.forEach(([label, key, unit]) => {
+            const value = median(runs.map(run => run[key]));
+            console.log(`${label.padEnd(24)} ${Math.round(value).toLocaleString().padStart(10)} ${unit}`);
+        });
+    } finally {
+        await browser.close();
+    }
+})().catch(error => {
+    console.error('❌ Benchmark failed:', error.message);
+    process.exit(1);
+});
@@ -0,0 +1,141 @@
+"""Bulk reservation import vs booking the same rows one at a time.
+
+Serves local_supabase.py in-process with hosted-database latency, builds a
+CSV of --rows bookings (about 1% of them invalid on purpose) and times
+
+  - POST /api/reservations/import with the whole file, and
+  - POST /api/reservations for the first --baseline rows, extrapolated to
+    --rows.
+
+Priest emails are suppressed (MAIL_SUPPRESS_SEND), so the one-at-a-time
+figure leaves out the SMTP time the real form pays per booking.
+
+    python benchmarks/bulk_import.py
+    python benchmarks/bulk_import.py --rows 10000 --latency-ms 40 --batch-size 500
+"""
+import argparse
+import contextlib
+import csv
+import io
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from local_supabase import LocalSupabase
+from synthetic_data import FIRST_NAMES, LAST_NAMES
+
+COLUMNS = ['service_type', 'date', 'time_slot', 'contact_first_name', 'contact_last_name', 'contact_phone',
+           'contact_email', 'assigned_priest', 'child_full_name', 'father_name', 'mother_name', 'bride_name',
+           'groom_name', 'deceased_name', 'candidate_name', 'payment_method', 'amount_due', 'amount_paid', 'balance',
+           'payment_status']
+TIMES = ['8:00 AM', '9:00 AM', '10:00 AM', '1:00 PM', '2:00 PM', '3:00 PM', '15:30']
+
+
+def build_rows(count, priest_ids, seed):
+    rng = random.Random(seed)
+    first_day = date.today() + timedelta(days=7)
+    for number in range(count):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        service = rng.choice(['baptism', 'baptism', 'confirmation', 'wedding', 'funeral'])
+        row = {
+            'service_type': service,
+            'date': (first_day + timedelta(days=rng.randrange(365))).isoformat(),
+            'time_slot': rng.choice(TIMES),
+            'contact_first_name': first,
+            'contact_last_name': last,
+            'contact_phone': f'0917-{rng.randrange(10_000_000):07d}',
+            'contact_email': f'{first}.{last}{number}@mail.test'.lower().replace(' ', ''),
+            'assigned_priest': rng.choice(priest_ids) if rng.random() < 0.5 else '',
+            'child_full_name': f'Baby {last}' if service == 'baptism' else '',
+            'father_name': f'{rng.choice(FIRST_NAMES)} {last}' if service == 'baptism' else '',
+            'mother_name': f'{rng.choice(FIRST_NAMES)} {last}' if service == 'baptism' else '',
+            'bride_name': f'{first} {last}' if service == 'wedding' else '',
+            'groom_name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}' if service == 'wedding' else '',
+            'deceased_name': f'{rng.choice(FIRST_NAMES)} {last}' if service == 'funeral' else '',
+            'candidate_name': f'{rng.choice(FIRST_NAMES)} {last}' if service == 'confirmation' else '',
+        }
+        if rng.random() < 0.7:
+            row.update(payment_method='Cash', amount_due='3000', amount_paid='3000', balance='0',
+                       payment_status='paid')
+        if rng.random() < 0.01:
+            row[rng.choice(['date', 'time_slot', 'service_type'])] = 'not-a-value'
+        yield row
+
+
+def to_csv(rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue().encode()
+
+
+def quiet(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the bulk reservation import against one-at-a-time booking')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--baseline', type=int, default=30, help='rows to book one at a time')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--latency-ms', type=float, default=40, help='stand-in latency per Supabase request')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    stand_in = LocalSupabase(latency_ms=args.latency_ms)
+    os.environ['SUPABASE_URL'] = stand_in.start()
+    import app as churchease
+    app = churchease.create_app({'MAIL_SUPPRESS_SEND': True})
+
+    user_id = str(uuid.uuid4())
+    priest_ids = [str(uuid.uuid4()) for _ in range(3)]
+    stand_in.bulk_insert('users', [{'id': user_id, 'username': 'bench.secretary', 'email': 'bench@mail.test',
+                                    'password_hash': 'x', 'role': 'secretary'}])
+    stand_in.bulk_insert('priests', [{'id': priest_id, 'first_name': 'Priest', 'last_name': str(n),
+                                      'email': f'priest{n}@mail.test'} for n, priest_id in enumerate(priest_ids)])
+    rows = list(build_rows(args.rows, priest_ids, args.seed))
+    body = to_csv(rows)
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess.update(user_id=user_id, user_uuid=user_id, role='secretary', full_name='Bench Secretary',
+                    email='bench@mail.test')
+    quiet(churchease.warm_up, app)
+
+    print(f"⏱️  {args.rows:,} rows ({len(body) / 1024:.0f} KiB CSV), batch size {args.batch_size}, "
+          f"stand-in latency {args.latency_ms:g} ms\n")
+
+    stand_in.reset_calls()
+    started = time.perf_counter()
+    response = quiet(client.post, f'/api/reservations/import?batch_size={args.batch_size}', data=body,
+                     content_type='text/csv')
+    import_seconds = time.perf_counter() - started
+    report = response.get_json()['data']
+    print(f"{'bulk import:':<24} {import_seconds:8.2f} s   {stand_in.total_calls:6,} Supabase requests   "
+          f"{report['totals']}")
+
+    stand_in.reset_calls()
+    started = time.perf_counter()
+    for row in rows[:args.baseline]:
+        form = {key: value for key, value in row.items() if value and not key.startswith(('payment', 'amount'))}
+        if row.get('payment_method'):
+            form['payment'] = {key: row[key] for key in ('payment_method', 'amount_due', 'amount_paid', 'balance',
+                                                         'payment_status')}
+        quiet(client.post, '/api/reservations', json=form)
+    per_row = (time.perf_counter() - started) / args.baseline
+    calls_per_row = stand_in.total_calls / args.baseline
+    print(f"{'one at a time:':<24} {per_row * args.rows:8.2f} s   {calls_per_row * args.rows:6,.0f} Supabase requests   "
+          f"(extrapolated from {args.baseline} rows)")
+    return 0 if response.status_code == 200 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Bytes on the wire before and after response compression.
+
+Runs the app in-process with the Flask test client and fetches each
+dashboard template, the heaviest API responses and the largest static files
+with Accept-Encoding: identity, gzip and br.
+
+    python benchmarks/compression_bytes.py
+
+API sizes depend on the data behind SUPABASE_URL.
+"""
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as churchease
+
+ENCODINGS = ['identity', 'gzip', 'br']
+
+# (path, session role) - role None means no login needed
+TEMPLATES = [
+    ('/login', None),
+    ('/admin-dashboard', 'admin'),
+    ('/dashboard', 'secretary'),
+    ('/priest-dashboard', 'priest'),
+]
+
+today = date.today()
+API_ENDPOINTS = [
+    '/api/reservations/all',
+    '/api/events',
+    f'/api/calendar/{today.year}/{today.month}',
+    '/api/sync',
+    '/api/priests',
+    '/api/admin/dashboard-stats',
+]
+
+STATIC_FILE_COUNT = 6
+
+def largest_static_files(count):
+    """Largest compressible files in static/, biggest first"""
+    candidates = []
+    for root, _, files in os.walk(churchease.app.static_folder):
+        for name in files:
+            if name.endswith(('.gz', '.br', '.tmp')):
+                continue
+            if churchease.mimetypes.guess_type(name)[0] not in churchease.COMPRESSION_LEVELS:
+                continue
+            full_path = os.path.join(root, name)
+            relative = os.path.relpath(full_path, churchease.app.static_folder).replace(os.sep, '/')
+            candidates.append((os.path.getsize(full_path), f'/static/{relative}'))
+    return [path for _, path in sorted(candidates, reverse=True)[:count]]
+
+def measure(client, path):
+    """Body size per encoding (None when the request did not return 200)"""
+    sizes = {}
+    for encoding in ENCODINGS:
+        response = client.get(path, headers={'Accept-Encoding': encoding})
+        sizes[encoding] = len(response.get_data()) if response.status_code == 200 else None
+        response.close()
+    return sizes
+
+def login_as(client, role):
+    with client.session_transaction() as sess:
+        sess.clear()
+        if role:
+            sess['user_id'] = f'bench-{role}'
+            sess['username'] = f'bench.{role}'
+            sess['role'] = role
+
+def format_size(size):
+    return '-' if size is None else f'{size:,}'
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"{'path':<42} {'identity':>12} {'gzip':>12} {'br':>12} {'saved':>7}")
+    for path, sizes in rows:
+        original = sizes['identity']
+        smallest = min((s for s in sizes.values() if s is not None), default=None)
+        saved = f"{100 - smallest * 100 / original:.0f}%" if original and smallest is not None else '-'
+        print(f"{path:<42} {format_size(sizes['identity']):>12} {format_size(sizes['gzip']):>12} "
+              f"{format_size(sizes['br']):>12} {saved:>7}")
+
+def main():
+    if churchease.brotli is None:
+        print("⚠️ brotli is not installed - 'br' requests fall back to gzip")
+
+    client = churchease.app.test_client()
+
+    template_rows = []
+    for path, role in TEMPLATES:
+        login_as(client, role)
+        template_rows.append((path, measure(client, path)))
+
+    login_as(client, 'admin')
+    api_rows = [(path, measure(client, path)) for path in API_ENDPOINTS]
+    static_rows = [(path, measure(client, path)) for path in largest_static_files(STATIC_FILE_COUNT)]
+
+    print_table('Templates', template_rows)
+    print_table('API responses', api_rows)
+    print_table('Static files (precompressed variants)', static_rows)
+
+    totals = {encoding: sum(sizes[encoding] or 0 for _, sizes in template_rows + api_rows + static_rows)
+              for encoding in ENCODINGS}
+    print(f"\nTotal: {totals['identity']:,} bytes uncompressed, "
+          f"{totals['gzip']:,} gzip, {totals['br']:,} br")
+
+if __name__ == '__main__':
+    main()
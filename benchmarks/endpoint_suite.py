@@ -0,0 +1,558 @@
+"""Per-route latency, query counts, response size and memory for every /api/* route.
+
+Loads a synthetic dataset (synthetic_data.py) into the local stand-in
+(local_supabase.py) for each size, drives every /api/* route through the Flask
+test client and writes a JSON report. Exits non-zero when a route goes over
+its query budget or a route is neither benchmarked nor listed in SKIPPED.
+
+    python benchmarks/endpoint_suite.py
+    python benchmarks/endpoint_suite.py --sizes 1k,10k,100k --latency-ms 40 --output /tmp/after.json
+    python benchmarks/endpoint_suite.py --compare /tmp/before.json
+
+Query counts don't depend on timing, so budgets are exact at any latency.
+Wall times are only comparable between reports with the same sizes, seed and
+latency, which are recorded in the report along with the commit. The dataset
+is built around today's date, so date-driven routes (today's schedule, this
+month's reports) also shift a little from day to day.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from local_supabase import LocalSupabase
+from synthetic_data import DEFAULT_PASSWORD, ParishDataGenerator, parse_size
+
+# Must point somewhere local before app is imported
+STAND_IN = LocalSupabase()
+os.environ['SUPABASE_URL'] = STAND_IN.start()
+
+from supabase import create_client
+import app as churchease
+
+# Most Supabase requests a route may make, whatever the dataset size
+BUDGETS = {
+    'GET /api/dashboard/today-schedule': 3,
+    # recent reservations with names embedded, recent payments, older payers' reservations
+    'GET /api/dashboard/recent-activities': 3,
+    'GET /api/reports/payment-status': 2,
+    'POST /api/reservations': 1,
+    # by UUID or by code, with client, priest and payment embedded
+    'GET /api/reservations/{reservation_uuid}': 1,
+    'GET /api/reservations/{reservation_code}': 1,
+    'POST /api/reservations/{reservation_uuid}/attendance': 1,
+    'POST /api/reservations/{reservation_uuid}/reassign-priest': 3,
+    # the payments table is known from the schema probe, not tested per request
+    'GET /api/payments/{reservation_uuid}': 1,
+    'GET /api/payments/{reservation_code}': 2,
+    # legacy per-service tables are skipped when the database has none
+    'GET /api/reservations/by-date/{busy_date}': 0,
+    # priests, the client_key lookup, then one insert each for clients, reservations, payments
+    'POST /api/reservations/import': 5,
+    'POST /api/reservations/bulk-approve': 2,
+    # two updates, the payments read, one refund per distinct amount due
+    'POST /api/reservations/bulk-attendance': 5,
+    'POST /api/reservations/bulk-assign-priest': 4,
+    'POST /api/events': 4,
+    # one page with reservation and client embedded, then stipendium_totals()
+    'GET /api/stipendium/payments': 2,
+    'GET /api/stipendium/payments?page=2&payment_status=paid&start_date={month_start}&end_date={month_end}': 2,
+}
+
+# Routes that are deliberately not driven
+SKIPPED = {
+    'GET /api/stream': 'Server-Sent Events stream; it never finishes',
+    'POST /api/send-otp': 'always sends an email over SMTP',
+    'POST /api/reservations/<reservation_id>/priest-response':
+        'unreachable: the GET/POST rule for <reservation_uuid>/priest-response matches first',
+}
+
+
+class Case:
+    def __init__(self, method, path, role='admin', body=None, repeat=True):
+        self.method = method
+        self.path = path          # may contain {fixture} placeholders
+        self.role = role          # session to use, None for anonymous
+        self.body = body          # JSON body, may contain placeholders too
+        self.repeat = repeat      # False for requests that only make sense once
+
+    @property
+    def route(self):
+        return f'{self.method} {self.path}'
+
+
+CASES = [
+    # Calendar and reservations
+    Case('GET', '/api/reservations/by-date/{busy_date}'),
+    Case('GET', '/api/reservations/available-slots/{busy_date}'),
+    Case('GET', '/api/reservations/calendar-data?start_date={month_start}&end_date={month_end}'),
+    Case('GET', '/api/calendar/{year}/{month}'),
+    Case('GET', '/api/reservations/all'),
+    Case('GET', '/api/reservations/export?format=csv'),
+    Case('GET', '/api/sync'),
+    Case('GET', '/api/sync?since={week_ago}'),
+    Case('GET', '/api/reservations/{reservation_uuid}'),
+    Case('GET', '/api/reservations/{reservation_code}'),
+    Case('POST', '/api/reservations', role='secretary', body={
+        'service_type': 'baptism', 'date': '{future_date}', 'time_slot': '10:00',
+        'contact_first_name': 'Bench', 'contact_last_name': 'Client', 'contact_phone': '0917-000-0000',
+        'contact_email': 'bench.client@mail.test', 'child_full_name': 'Bench Child', 'father_name': 'Bench Father',
+        'mother_name': 'Bench Mother', 'assigned_priest': '{priest_id}',
+        'payment': {'payment_method': 'Cash', 'payment_type': 'Full', 'base_price': 3000, 'amount_due': 3000,
+                    'amount_paid': 3000, 'balance': 0, 'payment_status': 'Paid'},
+    }),
+    Case('POST', '/api/reservations/import', role='secretary', body=[
+        {'service_type': 'confirmation', 'date': '{future_date}', 'time_slot': '2:00 PM',
+         'contact_first_name': 'Bench', 'contact_last_name': 'Import', 'contact_phone': '0917-000-0003',
+         'candidate_name': 'Bench Candidate', 'assigned_priest': '{priest_id}', 'payment_method': 'Cash',
+         'amount_due': 1500, 'amount_paid': 1500, 'balance': 0, 'payment_status': 'paid'},
+        {'service_type': 'confirmation', 'date': 'next sunday', 'time_slot': '2:00 PM',
+         'contact_first_name': 'Bench', 'contact_last_name': 'Import', 'contact_phone': '0917-000-0003'},
+    ]),
+    Case('POST', '/api/reservations/wedding', role='secretary', body={
+        'date': '{future_date}', 'time_slot': '10:00 AM', 'contact_first_name': 'Bench',
+        'contact_last_name': 'Couple', 'contact_phone': '0917-000-0001', 'bride_name': 'Bench Bride',
+        'groom_name': 'Bench Groom',
+    }),
+    Case('PUT', '/api/reservations/{reservation_uuid}', body={
+        'service_type': 'wedding', 'reservation_date': '{future_date}', 'time_slot': '10:00',
+        'contact_first_name': 'Bench', 'contact_last_name': 'Edited', 'contact_phone': '0917-000-0002',
+    }),
+    Case('POST', '/api/reservations/{reservation_uuid}/attendance', body={'attendance_status': 'attended'}),
+    Case('POST', '/api/reservations/{pending_uuid}/approve'),
+    Case('POST', '/api/reservations/{reservation_uuid}/assign-priest', body={'priest_id': '{priest_id}'}),
+    Case('POST', '/api/reservations/{reservation_uuid}/reassign-priest', body={'priest_id': '{other_priest_id}'}),
+    Case('POST', '/api/reservations/bulk-approve', body={'ids': ['{pending_uuid}', '{reservation_code}', 'RNOTFOUND']}),
+    Case('POST', '/api/reservations/bulk-attendance', body={
+        'ids': ['{reservation_code}', '{pending_uuid}', 'RNOTFOUND'], 'attendance_status': 'cancelled'}),
+    Case('POST', '/api/reservations/bulk-assign-priest', body={
+        'ids': ['{pending_uuid}', '{reservation_code}'], 'priest_id': '{priest_id}'}),
+    Case('GET', '/api/reservations/{reservation_uuid}/priest-response?action=approve&token=invalid', role=None),
+    Case('POST', '/api/reservations/{reservation_uuid}/priest-response', role='priest',
+         body={'response': 'approved', 'message': 'See you there'}),
+    Case('GET', '/api/clients/search?q=Santos'),
+
+    # Payments and stipendium
+    Case('GET', '/api/service-pricing'),
+    Case('POST', '/api/payments', body={
+        'reservation_id': '{reservation_uuid}', 'service_type': 'wedding', 'payment_method': 'Cash',
+        'payment_type': 'Downpayment', 'base_price': 15000, 'amount_due': 15000, 'amount_paid': 5000,
+    }),
+    Case('GET', '/api/payments/{reservation_uuid}'),
+    Case('GET', '/api/payments/{reservation_code}'),
+    Case('PUT', '/api/payments/{payment_id}', body={
+        'payment_method': 'Cash', 'payment_type': 'Full', 'amount_due': 15000, 'amount_paid': 15000,
+    }),
+    Case('GET', '/api/debug/payments'),
+    Case('GET', '/api/stipendium/summary'),
+    Case('GET', '/api/stipendium/payments'),
+    Case('GET', '/api/stipendium/payments?page=2&payment_status=paid&start_date={month_start}&end_date={month_end}'),
+    Case('GET', '/api/stipendium/export?format=xlsx'),
+    Case('GET', '/api/stipendium/service-breakdown'),
+    Case('GET', '/api/stipendium/collection-rate'),
+
+    # Dashboards and reports
+    Case('GET', '/api/dashboard/stats'),
+    Case('GET', '/api/dashboard/today-schedule'),
+    Case('GET', '/api/dashboard/recent-activities'),
+    Case('GET', '/api/dashboard/pending-tasks'),
+    Case('GET', '/api/admin/dashboard-stats'),
+    Case('GET', '/api/admin/recent-activity'),
+    Case('GET', '/api/admin/http-pool'),
+    Case('GET', '/api/admin/schema'),
+    Case('GET', '/api/reports/summary'),
+    Case('GET', '/api/reports/monthly-reservations'),
+    Case('GET', '/api/reports/service-distribution'),
+    Case('GET', '/api/reports/revenue-trends'),
+    Case('GET', '/api/reports/payment-status'),
+
+    # Events
+    Case('GET', '/api/events'),
+    Case('GET', '/api/events/all'),
+    Case('POST', '/api/events', role='secretary', body={
+        'event_name': 'Bench Bible Study', 'event_type': 'worship', 'event_date': '{future_date}',
+        'start_time': '19:00', 'end_time': '21:00', 'assigned_priest': '{priest_id}',
+    }),
+    Case('PUT', '/api/events/{event_id}', body={'status': 'confirmed', 'description': 'Updated by the benchmark'}),
+
+    # Priests
+    Case('GET', '/api/priests'),
+    Case('GET', '/api/priests/all'),
+    Case('POST', '/api/priests', body={
+        'full_name': 'Bench Priest {run}', 'email': 'bench.priest{run}@churchease.test', 'specialization': 'Weddings',
+    }),
+    Case('GET', '/api/priests/{priest_id}'),
+    Case('PUT', '/api/priests/{priest_id}', body={
+        'full_name': '{priest_name}', 'email': '{priest_email}', 'specialization': 'Baptisms',
+    }),
+    Case('DELETE', '/api/priests/{spare_priest_id}', repeat=False),
+    Case('GET', '/api/priest/reservations', role='priest'),
+
+    # Users
+    Case('GET', '/api/users'),
+    Case('POST', '/api/users', body={
+        'full_name': 'Bench User {run}', 'username': 'bench.user{run}', 'email': 'bench.user{run}@churchease.test',
+        'password': DEFAULT_PASSWORD, 'role': 'secretary',
+    }),
+    Case('GET', '/api/users/stats'),
+    Case('GET', '/api/users/{secretary_id}'),
+    Case('PUT', '/api/users/{secretary_id}', body={
+        'full_name': '{secretary_name}', 'username': '{secretary_username}', 'email': '{secretary_email}',
+        'role': 'secretary',
+    }),
+    Case('POST', '/api/users/{secretary_id}/reset-password', body={'new_password': DEFAULT_PASSWORD}),
+    Case('DELETE', '/api/users/{spare_user_id}', repeat=False),
+    Case('GET', '/api/admin/users'),
+    Case('POST', '/api/admin/users', body={
+        'full_name': 'Bench Admin {run}', 'username': 'bench.admin{run}', 'email': 'bench.admin{run}@churchease.test',
+        'password': DEFAULT_PASSWORD, 'role': 'secretary',
+    }),
+    Case('PUT', '/api/admin/users/{secretary_id}', body={'status': 'active'}),
+    Case('DELETE', '/api/admin/users/{spare_admin_user_id}', repeat=False),
+    Case('POST', '/api/admin/users/{secretary_id}/reset-password', body={'new_password': DEFAULT_PASSWORD}),
+
+    # Account recovery (paths that don't send mail)
+    Case('POST', '/api/check-name-and-send-otp', role=None, body={'fullName': 'NOBODY BY THIS NAME'}),
+    Case('POST', '/api/verify-otp', role=None, body={'email': 'nobody@mail.test', 'otp': '000000'}),
+    Case('POST', '/api/complete-registration', role=None, body={
+        'fullName': 'NOBODY', 'email': 'nobody@mail.test', 'username': 'nobody', 'password': DEFAULT_PASSWORD,
+    }),
+    Case('POST', '/api/send-reset-code', role=None, body={'email': 'nobody@mail.test'}),
+    Case('POST', '/api/reset-password', role=None, body={'email': 'nobody@mail.test', 'newPassword': DEFAULT_PASSWORD}),
+]
+
+
+class PlaceholderValues(dict):
+    def __missing__(self, key):
+        return '1'
+
+
+def route_key(case):
+    """'GET /api/reservations/{reservation_uuid}' -> the app's rule, e.g. 'GET /api/reservations/<reservation_id>'"""
+    sample = case.path.split('?')[0].format_map(PlaceholderValues())
+    adapter = churchease.app.url_map.bind('localhost')
+    endpoint, _ = adapter.match(sample, method=case.method)
+    rule = next(rule for rule in churchease.app.url_map.iter_rules(endpoint) if case.method in rule.methods)
+    return f'{case.method} {rule.rule}'
+
+
+def uncovered_routes():
+    """/api/* rules that have no Case and are not in SKIPPED"""
+    covered = {route_key(case) for case in CASES} | set(SKIPPED)
+    missing = []
+    for rule in churchease.app.url_map.iter_rules():
+        if not rule.rule.startswith('/api/'):
+            continue
+        for method in sorted(rule.methods - {'HEAD', 'OPTIONS'}):
+            if f'{method} {rule.rule}' not in covered:
+                missing.append(f'{method} {rule.rule}')
+    return missing
+
+
+# ============================================
+# DATASET
+# ============================================
+
+def load_dataset(size, seed, today):
+    """A fresh stand-in holding one synthetic dataset; returns (stand_in, fixtures)"""
+    stand_in = LocalSupabase(latency_ms=0)
+    generator = ParishDataGenerator(size, seed=seed, today=today)
+    for batch in generator.batches():
+        for table, rows in batch:
+            stand_in.bulk_insert(table, rows)
+
+    def first(sql, *values):
+        return stand_in._db.execute(sql, values).fetchone()
+
+    month_start = today.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    reservation = first("SELECT id, reservation_id FROM reservations WHERE status = 'approved' "
+                        "AND service_type = 'wedding' AND priest_id IS NOT NULL ORDER BY reservation_date DESC LIMIT 1")
+    pending = first("SELECT id FROM reservations WHERE status = 'pending' ORDER BY reservation_date LIMIT 1")
+    busy_date = first('SELECT reservation_date FROM reservations GROUP BY reservation_date '
+                      'ORDER BY COUNT(*) DESC, reservation_date LIMIT 1')
+    payment = first('SELECT id FROM payments WHERE reservation_id = ?', reservation[0])
+    priests = stand_in._db.execute("SELECT id, first_name, last_name, email FROM priests "
+                                   "WHERE status = 'active' ORDER BY email").fetchall()
+    secretary = first("SELECT id, full_name, username, email FROM users WHERE role = 'secretary' ORDER BY username")
+    event = first('SELECT id FROM events ORDER BY event_date DESC LIMIT 1')
+
+    # Rows for the DELETE cases, so the shared fixtures survive
+    spare = {}
+    for name, table, row in [
+        ('spare_priest_id', 'priests', {'first_name': 'Spare', 'last_name': 'Priest', 'email': 'spare.priest@churchease.test'}),
+        ('spare_user_id', 'users', {'username': 'spare.user', 'email': 'spare.user@churchease.test',
+                                    'password_hash': 'x', 'role': 'secretary'}),
+        ('spare_admin_user_id', 'users', {'username': 'spare.admin', 'email': 'spare.admin@churchease.test',
+                                          'password_hash': 'x', 'role': 'secretary'}),
+    ]:
+        stand_in.bulk_insert(table, [row])
+        spare[name] = first(f'SELECT id FROM {table} WHERE email = ?', row['email'])[0]
+
+    fixtures = {
+        'reservation_uuid': reservation[0],
+        'reservation_code': reservation[1],
+        'pending_uuid': pending[0],
+        'busy_date': busy_date[0],
+        'payment_id': payment[0],
+        'priest_id': priests[0][0],
+        'priest_name': f'{priests[0][1]} {priests[0][2]}',
+        'priest_email': priests[0][3],
+        'other_priest_id': priests[1][0],
+        'secretary_id': secretary[0],
+        'secretary_name': secretary[1],
+        'secretary_username': secretary[2],
+        'secretary_email': secretary[3],
+        'event_id': event[0],
+        'year': today.year,
+        'month': today.month,
+        'month_start': month_start.isoformat(),
+        'month_end': (next_month - timedelta(days=1)).isoformat(),
+        'future_date': (today + timedelta(days=45)).isoformat(),
+        'week_ago': (datetime.now(timezone.utc) - timedelta(days=7)).isoformat(),
+        **spare,
+    }
+    return stand_in, fixtures
+
+
+def use_stand_in(stand_in):
+    """An app whose Supabase client talks to this stand-in, with emails suppressed"""
+    url = stand_in.start()
+    app = churchease.create_app({'MAIL_SUPPRESS_SEND': True},
+                                supabase_client=create_client(url, churchease.SUPABASE_KEY))
+    # Warm up now rather than on a background thread racing the first measurement
+    churchease._warm_up_started = True
+    churchease.warm_up(app)
+    return app
+
+
+def sessions(fixtures):
+    """Session contents per role, without going through /login"""
+    return {
+        'admin': {'user_id': 'bench-admin', 'username': 'admin', 'role': 'admin',
+                  'full_name': 'Administrator', 'email': 'admin@churchease.com'},
+        'secretary': {'user_id': fixtures['secretary_id'], 'username': fixtures['secretary_username'],
+                      'role': 'secretary', 'full_name': fixtures['secretary_name'],
+                      'email': fixtures['secretary_email']},
+        'priest': {'user_id': fixtures['priest_id'], 'priest_id': fixtures['priest_id'],
+                   'username': fixtures['priest_email'], 'role': 'priest',
+                   'full_name': fixtures['priest_name'], 'email': fixtures['priest_email']},
+    }
+
+
+def fill(value, fixtures):
+    if isinstance(value, str):
+        return value.format(**fixtures)
+    if isinstance(value, dict):
+        return {key: fill(item, fixtures) for key, item in value.items()}
+    if isinstance(value, list):
+        return [fill(item, fixtures) for item in value]
+    return value
+
+
+# ============================================
+# MEASURING
+# ============================================
+
+def login_as(client, session_data):
+    with client.session_transaction() as sess:
+        sess.clear()
+        sess.update(session_data or {})
+
+
+def call(client, case, fixtures):
+    """One request with the app's console output swallowed; returns (status, bytes)"""
+    kwargs = {'json': fill(case.body, fixtures)} if case.body is not None else {}
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        response = client.open(fill(case.path, fixtures), method=case.method, **kwargs)
+        body = response.get_data()
+    response.close()
+    return response.status_code, len(body)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def measure(client, stand_in, case, fixtures, session_data, repeat):
+    runs = repeat if case.repeat else 1
+    timings, queries, statuses = [], Counter(), Counter()
+    size = 0
+    for run in range(runs):
+        fixtures['run'] = run
+        login_as(client, session_data)
+        stand_in.reset_calls()
+        started = time.perf_counter()
+        status, size = call(client, case, fixtures)
+        timings.append((time.perf_counter() - started) * 1000)
+        statuses[status] += 1
+        if run == 0:
+            queries = Counter(stand_in.calls)
+
+    peak = None
+    if case.repeat:
+        # A separate run: tracemalloc slows every allocation down
+        fixtures['run'] = runs
+        login_as(client, session_data)
+        tracemalloc.start()
+        call(client, case, fixtures)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'status': statuses.most_common(1)[0][0],
+        'runs': runs,
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 0.95), 2),
+        'max_ms': round(max(timings), 2),
+        'queries': sum(queries.values()),
+        'queries_by_table': {f'{method} {table}': count for (method, table), count in sorted(queries.items())},
+        'bytes': size,
+        'peak_kib': round(peak / 1024, 1) if peak is not None else None,
+    }
+
+
+def run_size(size, args, today):
+    label = args_label(size)
+    print(f"\n📦 {label}: generating {size:,} reservations...", flush=True)
+    stand_in, fixtures = load_dataset(size, args.seed, today)
+    stand_in.latency_ms = args.latency_ms
+    app = use_stand_in(stand_in)
+    session_data = sessions(fixtures)
+    client = app.test_client()
+
+    results = {}
+    for case in CASES:
+        result = measure(client, stand_in, case, dict(fixtures),
+                         session_data.get(case.role), args.repeat)
+        results[case.route] = result
+        print(f"   {case.route[:64]:<64} {result['status']:>4} {result['p50_ms']:>9.1f} ms "
+              f"{result['queries']:>6} q {result['bytes']:>10,} B", flush=True)
+    stand_in.stop()
+    return results
+
+
+def args_label(size):
+    for name, value in (('1m', 1_000_000), ('100k', 100_000), ('10k', 10_000), ('1k', 1_000)):
+        if size == value:
+            return name
+    return str(size)
+
+
+def check_budgets(report):
+    failures = []
+    for label, results in report['results'].items():
+        for route, budget in BUDGETS.items():
+            result = results.get(route)
+            if result is None:
+                failures.append(f'{label} {route}: not measured')
+            elif result['queries'] > budget:
+                failures.append(f"{label} {route}: {result['queries']} queries (budget {budget})")
+            elif result['status'] >= 500:
+                failures.append(f"{label} {route}: HTTP {result['status']}")
+    return failures
+
+
+def compare(report, baseline_path):
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_path} ({baseline['meta'].get('commit', '?')})")
+    for label, results in report['results'].items():
+        before = baseline['results'].get(label, {})
+        for route, result in results.items():
+            old = before.get(route)
+            if not old:
+                continue
+            if old['queries'] != result['queries'] or abs(result['p50_ms'] - old['p50_ms']) > max(5, old['p50_ms'] * 0.2):
+                print(f"   {label:>5} {route[:60]:<60} queries {old['queries']:>6} -> {result['queries']:<6} "
+                      f"p50 {old['p50_ms']:>9.1f} -> {result['p50_ms']:.1f} ms")
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARKS_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every /api/* route against the local stand-in')
+    parser.add_argument('--sizes', default='1k,10k', help='comma-separated reservation counts (1k, 10k, 100k, 1m)')
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--latency-ms', type=float, default=0, help='added to every Supabase request')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per route')
+    parser.add_argument('--output', help='report path (default: benchmarks/results/endpoints-<commit>.json)')
+    parser.add_argument('--compare', help='earlier report to diff against')
+    args = parser.parse_args()
+
+    missing = uncovered_routes()
+    if missing:
+        print("❌ Routes without a benchmark case (add a Case or list them in SKIPPED):")
+        for route in missing:
+            print(f"   {route}")
+        return 1
+
+    today = date.today()
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'seed': args.seed,
+            'today': today.isoformat(),
+            'sizes': args.sizes,
+            'latency_ms': args.latency_ms,
+            'repeat': args.repeat,
+            'budgets': BUDGETS,
+            'skipped': SKIPPED,
+        },
+        'results': {},
+    }
+    for size in [parse_size(size) for size in args.sizes.split(',')]:
+        report['results'][args_label(size)] = run_size(size, args, today)
+
+    failures = check_budgets(report)
+    report['budget_failures'] = failures
+
+    output = args.output or os.path.join(BENCHMARKS_DIR, 'results', f"endpoints-{report['meta']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n📝 Report written to {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+    errors = [f"{label} {route}: HTTP {result['status']}" for label, results in report['results'].items()
+              for route, result in results.items() if result['status'] >= 500]
+    if errors:
+        print("\n⚠️ Server errors (not budgeted):")
+        for error in errors:
+            print(f"   {error}")
+
+    if failures:
+        print("\n❌ Over budget:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print(f"✅ All {len(BUDGETS)} budgets met")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Throughput per worker of the fan-out-heavy routes, sequential vs concurrent queries.
+
+Starts local_supabase.py and gunicorn once per QUERY_FANOUT mode and keeps
+--concurrency admin clients requesting the dashboard and report routes whose
+independent queries run_queries() sends together. Prints requests per second
+per worker and latency percentiles per route for each mode.
+
+    python benchmarks/synthetic_data.py --size 10k --database /tmp/churchease-10k.sqlite
+    python benchmarks/fanout_throughput.py --database /tmp/churchease-10k.sqlite --latency-ms 40
+
+    # gevent worker (greenlets instead of the event loop)
+    python benchmarks/fanout_throughput.py --database /tmp/churchease-10k.sqlite --worker-class gevent
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from http.cookiejar import CookieJar
+
+from load_replay import ADMIN_LOGINS, percentile, spawn_servers, stop_servers
+
+ROUTES = [
+    '/api/reservations/all',
+    '/api/dashboard/recent-activities',
+    '/api/dashboard/pending-tasks',
+    '/api/admin/dashboard-stats',
+    '/api/reports/summary',
+    '/api/stipendium/summary',
+    '/api/stipendium/payments',
+]
+
+
+def signed_in_opener(base_url):
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+    username, password = ADMIN_LOGINS[0]
+    request = urllib.request.Request(f'{base_url}/login', method='POST',
+                                     data=json.dumps({'username': username, 'password': password}).encode(),
+                                     headers={'Content-Type': 'application/json'})
+    with opener.open(request, timeout=60) as response:
+        if not json.loads(response.read()).get('success'):
+            raise SystemExit('❌ Could not sign in as admin')
+    return opener
+
+
+def hammer(base_url, args):
+    """--concurrency clients cycling through ROUTES for --duration seconds"""
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def client(offset):
+        opener = signed_in_opener(base_url)
+        index = offset
+        while time.monotonic() < deadline:
+            route = ROUTES[index % len(ROUTES)]
+            index += 1
+            started = time.perf_counter()
+            ok = False
+            try:
+                with opener.open(base_url + route, timeout=args.timeout) as response:
+                    response.read()
+                    ok = response.status == 200
+            except (OSError, urllib.error.HTTPError):
+                pass
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies[route].append(elapsed)
+                errors[route] += not ok
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors, time.perf_counter() - started
+
+
+def run_mode(mode, args):
+    base_url, processes = spawn_servers(args, env={'QUERY_FANOUT': mode})
+    try:
+        signed_in_opener(base_url).open(base_url + ROUTES[0], timeout=args.timeout).read()  # warm up
+        latencies, errors, elapsed = hammer(base_url, args)
+    finally:
+        stop_servers(processes)
+    total = sum(len(values) for values in latencies.values())
+    return {
+        'requests': total,
+        'errors': sum(errors.values()),
+        'rps_per_worker': round(total / elapsed / args.workers, 2),
+        'routes': {
+            route: {'count': len(latencies[route]), 'errors': errors[route],
+                    'p50_ms': round(percentile(latencies[route], 0.50), 1),
+                    'p95_ms': round(percentile(latencies[route], 0.95), 1)}
+            for route in ROUTES if latencies[route]
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare QUERY_FANOUT modes on the fan-out-heavy routes')
+    parser.add_argument('--database', default=':memory:', help='SQLite file for local_supabase.py')
+    parser.add_argument('--latency-ms', type=float, default=40, help='stand-in latency per Supabase request')
+    parser.add_argument('--modes', default='sequential,async')
+    parser.add_argument('--concurrency', type=int, default=8, help='clients sending requests at once')
+    parser.add_argument('--duration', type=float, default=30, help='seconds per mode')
+    parser.add_argument('--timeout', type=float, default=120, help='per-request timeout in seconds')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--worker-class', default='gthread', choices=['gthread', 'sync', 'gevent'])
+    parser.add_argument('--preload', action='store_true')
+    parser.add_argument('--port', type=int, default=8767)
+    parser.add_argument('--stand-in-port', type=int, default=54334)
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    results = {}
+    for mode in args.modes.split(','):
+        print(f"⏱️  QUERY_FANOUT={mode}: {args.workers} x {args.worker_class}, {args.concurrency} clients, "
+              f"{args.duration:g}s, stand-in latency {args.latency_ms:g} ms")
+        results[mode] = run_mode(mode, args)
+        print(f"   {results[mode]['rps_per_worker']} req/s per worker, {results[mode]['errors']} errors")
+
+    modes = list(results)
+    print(f"\n{'route':<36}" + ''.join(f"{mode + ' p50':>18}{mode + ' p95':>18}" for mode in modes))
+    for route in ROUTES:
+        cells = ''
+        for mode in modes:
+            stats = results[mode]['routes'].get(route, {})
+            cells += f"{stats.get('p50_ms', '-'):>18}{stats.get('p95_ms', '-'):>18}"
+        print(f"{route:<36}{cells}")
+    print(f"{'req/s per worker':<36}" + ''.join(f"{results[mode]['rps_per_worker']:>36}" for mode in modes))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'meta': vars(args), 'results': results}, f, indent=2)
+        print(f"\n📝 Results written to {args.output}")
+    return 1 if any(result['errors'] for result in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,550 @@
+"""Replays dashboard traffic from concurrent staff sessions against a running server.
+
+Each simulated secretary loads /dashboard the way Sec-Dashboard does (stats,
+today's schedule and recent activity in parallel, then the reservation
+table, events table and calendar) and each admin loads /admin-dashboard
+(dashboard stats, then reservations, users, priests and the monthly chart).
+Sessions keep /api/stream open like the pages do and fall back to the
+30-second /api/sync poll when it drops. Between polls they act: a secretary
+opens a reservation and its payment, an admin opens the reports or
+stipendium tab or the calendar.
+
+    # Against a gunicorn instance you started yourself
+    python benchmarks/load_replay.py --url http://127.0.0.1:8000 --secretaries 6 --admins 1 --duration 120
+
+    # Start local_supabase.py and gunicorn (render.yaml's command) for the run
+    python benchmarks/synthetic_data.py --size 10k --database /tmp/churchease-10k.sqlite
+    python benchmarks/load_replay.py --spawn --database /tmp/churchease-10k.sqlite --latency-ms 40 \\
+        --workers 2 --threads 8 --secretaries 8 --admins 2
+
+Reports throughput, latency percentiles per request and per page load, error
+rates, and worker saturation: a probe request for a small static file is
+sent every --probe-interval seconds, and the share of probes that queue
+behind busy workers is the saturation. With --spawn, worker CPU time is
+sampled from /proc too.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from urllib.parse import urlsplit
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Accounts `flask --app app bootstrap-users` seeds on every deployment
+ADMIN_LOGINS = [('admin', 'admin123')]
+SECRETARY_LOGINS = [('cyril.arbatin', 'cyril123'), ('hana.umali', 'hana123')]
+
+BROWSER_CONNECTIONS = 6     # parallel requests per session, as a browser does per host
+PROBE_PATH = '/static/philippine-holidays.js'
+PROBE_SLOW_MS = 100         # a probe slower than this waited for a worker
+STREAM_READ_TIMEOUT = 20    # /api/stream sends a keep-alive every 15 seconds
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(latencies):
+    return {
+        'count': len(latencies),
+        'p50_ms': round(percentile(latencies, 0.50), 1) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95), 1) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99), 1) if latencies else None,
+        'max_ms': round(max(latencies), 1) if latencies else None,
+    }
+
+
+class Recorder:
+    """Thread-safe log of every request and page load"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = defaultdict(list)   # name -> [latency ms]
+        self.errors = defaultdict(int)      # name -> 5xx and failed requests
+        self.client_errors = defaultdict(int)   # name -> 4xx, e.g. a reservation with no payment yet
+        self.pages = defaultdict(list)      # page -> [load time ms]
+        self.probes = []
+        self.bytes = 0
+        self.streams_open = 0
+        self.streams_peak = 0
+        self.stream_drops = 0
+        self.streams_refused = 0
+        self.polls = 0
+
+    def request(self, name, latency_ms, status, size):
+        with self.lock:
+            self.requests[name].append(latency_ms)
+            self.bytes += size
+            if status is None or status >= 500:
+                self.errors[name] += 1
+            elif status >= 400:
+                self.client_errors[name] += 1
+
+    def page(self, name, latency_ms):
+        with self.lock:
+            self.pages[name].append(latency_ms)
+
+    def stream(self, delta, dropped=False):
+        with self.lock:
+            self.streams_open += delta
+            self.streams_peak = max(self.streams_peak, self.streams_open)
+            self.stream_drops += dropped
+
+
+# ============================================
+# SESSIONS
+# ============================================
+
+class Session(threading.Thread):
+    def __init__(self, name, base_url, login, args, recorder, stop):
+        super().__init__(name=name, daemon=True)
+        self.base_url = base_url
+        self.login = login
+        self.args = args
+        self.recorder = recorder
+        self.stop = stop
+        self.random = random.Random(f'{args.seed}-{name}')
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+        self.pool = ThreadPoolExecutor(BROWSER_CONNECTIONS, thread_name_prefix=name)
+        self.stream_connected = threading.Event()
+        self.sync_cursor = None
+        self.reservations = []
+
+    # ---- HTTP
+
+    def fetch(self, path, name=None, method='GET', body=None):
+        """Returns the parsed JSON body (or None); records latency and status.
+        `path` may be a (path, name) pair so per-record URLs group by route.
+        """
+        if isinstance(path, tuple):
+            path, name = path
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                         headers={'Content-Type': 'application/json',
+                                                  'Accept-Encoding': 'identity'})
+        started = time.perf_counter()
+        status, size, payload = None, 0, None
+        try:
+            with self.opener.open(request, timeout=self.args.timeout) as response:
+                raw = response.read()
+                status, size = response.status, len(raw)
+                if 'json' in response.headers.get('Content-Type', ''):
+                    payload = json.loads(raw)
+        except urllib.error.HTTPError as error:
+            status, size = error.code, len(error.read() or b'')
+        except (OSError, ValueError, http.client.HTTPException):
+            pass
+        self.recorder.request(name or path.split('?')[0], (time.perf_counter() - started) * 1000, status, size)
+        return payload
+
+    def wave(self, *paths):
+        """Fetch in parallel, like a page's Promise.all or independent init calls"""
+        return list(self.pool.map(self.fetch, paths))
+
+    def page_load(self, name, *waves):
+        started = time.perf_counter()
+        results = []
+        for paths in waves:
+            results.extend(self.wave(*paths))
+        self.recorder.page(name, (time.perf_counter() - started) * 1000)
+        return results
+
+    # ---- live stream
+
+    def hold_stream(self):
+        """Keeps /api/stream open for the whole run, reconnecting like EventSource.
+        A refused stream (each worker allows LIVE_MAX_STREAMS) leaves the
+        session on the /api/sync poll, as it would in the browser.
+        """
+        parts = urlsplit(self.base_url)
+        while not self.stop.is_set():
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=STREAM_READ_TIMEOUT)
+            cookie = '; '.join(f'{c.name}={c.value}' for c in self.cookies)
+            try:
+                connection.request('GET', '/api/stream', headers={'Cookie': cookie, 'Accept': 'text/event-stream'})
+                response = connection.getresponse()
+                if response.status != 200:
+                    with self.recorder.lock:
+                        self.recorder.streams_refused += 1
+                    raise http.client.HTTPException(f'status {response.status}')
+                self.stream_connected.set()
+                self.recorder.stream(+1)
+                try:
+                    while not self.stop.is_set() and response.fp.readline():
+                        pass
+                finally:
+                    self.stream_connected.clear()
+                    self.recorder.stream(-1, dropped=not self.stop.is_set())
+            except (OSError, http.client.HTTPException):
+                pass
+            finally:
+                connection.close()
+            self.stop.wait(3)   # EventSource's default retry
+
+    # ---- behaviour
+
+    def sign_in(self):
+        username, password = self.login
+        result = self.fetch('/login', name='POST /login', method='POST',
+                            body={'username': username, 'password': password})
+        return bool(result and result.get('success'))
+
+    def load_page(self):
+        raise NotImplementedError
+
+    def act(self):
+        raise NotImplementedError
+
+    def poll(self):
+        if self.stream_connected.is_set():
+            return
+        with self.recorder.lock:
+            self.recorder.polls += 1
+        self.poll_data()
+
+    def poll_data(self):
+        pass
+
+    def run(self):
+        if not self.sign_in():
+            return
+        if self.args.streams:
+            threading.Thread(target=self.hold_stream, name=f'{self.name}-stream', daemon=True).start()
+        self.load_page()
+
+        next_poll = time.monotonic() + self.args.poll_interval
+        while not self.stop.is_set():
+            think = self.random.uniform(0.5, 1.5) * self.args.think_time
+            if self.stop.wait(min(think, max(0.0, next_poll - time.monotonic()))):
+                break
+            if time.monotonic() >= next_poll:
+                self.poll()
+                next_poll = time.monotonic() + self.args.poll_interval
+            else:
+                self.act()
+        self.pool.shutdown(wait=False)
+
+
+class SecretarySession(Session):
+    def load_page(self):
+        _, _, _, _, reservations, _, _, _ = self.page_load(
+            'secretary dashboard',
+            ['/dashboard', '/api/dashboard/stats', '/api/dashboard/today-schedule', '/api/dashboard/recent-activities'],
+            ['/api/reservations/all', '/api/events', '/api/priests', '/api/reservations/all'],
+        )
+        if reservations and reservations.get('success'):
+            self.reservations = [r['id'] for r in reservations.get('data', []) if r.get('id')][:500]
+            self.sync_cursor = reservations.get('sync_cursor')
+
+    def act(self):
+        if not self.reservations:
+            return
+        reservation_id = self.random.choice(self.reservations)
+        self.page_load('reservation details',
+                       [(f'/api/reservations/{reservation_id}', '/api/reservations/<id>'),
+                        (f'/api/payments/{reservation_id}', '/api/payments/<id>')])
+
+    def poll_data(self):
+        if self.sync_cursor:
+            result = self.fetch(f'/api/sync?since={self.sync_cursor}', name='/api/sync?since')
+            if result and result.get('cursor'):
+                self.sync_cursor = result['cursor']
+        else:
+            self.fetch('/api/reservations/all')
+
+
+class AdminSession(Session):
+    TABS = {
+        'reports tab': [
+            ['/admin/sections/reports'],
+            ['/api/reports/summary', '/api/reports/monthly-reservations', '/api/reports/service-distribution',
+             '/api/reports/revenue-trends', '/api/reports/payment-status', '/api/stipendium/payments'],
+        ],
+        'stipendium tab': [
+            ['/api/stipendium/summary', '/api/stipendium/payments', '/api/stipendium/service-breakdown',
+             '/api/stipendium/collection-rate'],
+        ],
+        'calendar tab': [
+            ['/admin/sections/calendar'],
+            ['__calendar__'],
+        ],
+    }
+
+    def load_page(self):
+        self.page_load(
+            'admin dashboard',
+            ['/admin-dashboard'],
+            ['/api/admin/dashboard-stats', '/api/reservations/all'],
+            ['/api/users'],
+            ['/api/priests'],
+            ['/api/reports/monthly-reservations'],
+        )
+
+    def act(self):
+        tab = self.random.choice(list(self.TABS))
+        today = time.localtime()
+        waves = [[path.replace('__calendar__', f'/api/calendar/{today.tm_year}/{today.tm_mon}') for path in paths]
+                 for paths in self.TABS[tab]]
+        self.page_load(tab, *waves)
+
+    def poll_data(self):
+        today = time.localtime()
+        self.fetch(f'/api/calendar/{today.tm_year}/{today.tm_mon}', name='/api/calendar (poll)')
+
+
+def probe(base_url, recorder, stop, interval):
+    """A cheap request on a fixed clock; it only gets slow when it has to wait for a worker"""
+    parts = urlsplit(base_url)
+    while not stop.wait(interval):
+        started = time.perf_counter()
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+            connection.request('HEAD', PROBE_PATH)
+            connection.getresponse().read()
+            connection.close()
+            latency = (time.perf_counter() - started) * 1000
+        except (OSError, http.client.HTTPException):
+            latency = None
+        with recorder.lock:
+            recorder.probes.append(latency)
+
+
+# ============================================
+# SERVERS
+# ============================================
+
+def wait_until_up(url, seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return True
+        except urllib.error.HTTPError as error:
+            if error.code != 503:   # /readyz before warm-up has finished
+                return True
+            time.sleep(0.2)
+        except OSError:
+            time.sleep(0.5)
+    return False
+
+
+def spawn_servers(args, env=None):
+    """local_supabase.py and gunicorn as child processes; returns (url, processes).
+    `env` adds environment variables for the app, e.g. {'QUERY_FANOUT': 'sequential'}.
+    """
+    stand_in_url = f'http://127.0.0.1:{args.stand_in_port}'
+    stand_in = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_DIR, 'local_supabase.py'), '--port', str(args.stand_in_port),
+         '--database', args.database, '--latency-ms', str(args.latency_ms)],
+        cwd=REPO_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not wait_until_up(f'{stand_in_url}/rest/v1/users?select=id&limit=1', 60):
+        stand_in.terminate()
+        raise SystemExit('❌ local_supabase.py did not start')
+
+    # Worker class and threads go through gunicorn.conf.py, which also sets
+    # the per-class defaults (e.g. no live streams on sync workers)
+    app_env = {**os.environ, 'SUPABASE_URL': stand_in_url, 'GUNICORN_WORKER_CLASS': args.worker_class,
+               'GUNICORN_THREADS': str(args.threads), 'WEB_CONCURRENCY': str(args.workers),
+               'GUNICORN_PRELOAD': '1' if args.preload else '0', **(env or {})}
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'bootstrap-users'],
+                   cwd=REPO_DIR, env=app_env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    app_url = f'http://127.0.0.1:{args.port}'
+    gunicorn = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:app', '--bind', f'127.0.0.1:{args.port}'],
+        cwd=REPO_DIR, env=app_env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if not wait_until_up(f'{app_url}/readyz', 120):
+        stop_servers([stand_in, gunicorn])
+        raise SystemExit('❌ gunicorn did not start')
+    return app_url, [stand_in, gunicorn]
+
+
+def stop_servers(processes):
+    for process in processes:
+        if process.poll() is None:
+            process.send_signal(signal.SIGTERM)   # gunicorn's master stops its workers
+    for process in processes:
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def worker_cpu_seconds(master_pid):
+    """user+system CPU of gunicorn's workers, from /proc (Linux only)"""
+    try:
+        children = open(f'/proc/{master_pid}/task/{master_pid}/children').read().split()
+    except OSError:
+        return None
+    ticks = os.sysconf('SC_CLK_TCK')
+    total = 0.0
+    for pid in children:
+        try:
+            fields = open(f'/proc/{pid}/stat').read().rsplit(')', 1)[1].split()
+            total += (int(fields[11]) + int(fields[12])) / ticks
+        except (OSError, IndexError, ValueError):
+            pass
+    return total
+
+
+# ============================================
+# REPORT
+# ============================================
+
+def build_report(args, recorder, elapsed, cpu_seconds):
+    total = sum(len(latencies) for latencies in recorder.requests.values())
+    errors = sum(recorder.errors.values())
+    probes = [p for p in recorder.probes if p is not None]
+    report = {
+        'meta': {
+            'url': args.url, 'secretaries': args.secretaries, 'admins': args.admins,
+            'duration_s': round(elapsed, 1), 'streams': args.streams, 'poll_interval_s': args.poll_interval,
+            'think_time_s': args.think_time, 'seed': args.seed,
+        },
+        'throughput_rps': round(total / elapsed, 2) if elapsed else None,
+        'requests': total,
+        'errors': errors,
+        'client_errors': sum(recorder.client_errors.values()),
+        'error_rate': round(errors / total, 4) if total else None,
+        'megabytes': round(recorder.bytes / 1_000_000, 2),
+        'streams': {'peak_open': recorder.streams_peak, 'drops': recorder.stream_drops,
+                    'refused': recorder.streams_refused, 'polls': recorder.polls},
+        'saturation': {
+            'probes': len(recorder.probes),
+            'failed': len(recorder.probes) - len(probes),
+            'queued_share': round(sum(1 for p in probes if p > PROBE_SLOW_MS) / len(probes), 3) if probes else None,
+            **summarize(probes),
+        },
+        'pages': {name: summarize(latencies) for name, latencies in sorted(recorder.pages.items())},
+        'endpoints': {
+            name: {**summarize(latencies), 'errors': recorder.errors.get(name, 0),
+                   'client_errors': recorder.client_errors.get(name, 0)}
+            for name, latencies in sorted(recorder.requests.items())
+        },
+    }
+    if args.spawn:
+        report['meta'].update({'workers': args.workers, 'threads': args.threads, 'worker_class': args.worker_class,
+                               'preload': args.preload,
+                               'latency_ms': args.latency_ms, 'database': args.database})
+        if cpu_seconds is not None:
+            capacity = elapsed * args.workers
+            report['saturation']['worker_cpu_seconds'] = round(cpu_seconds, 1)
+            report['saturation']['worker_cpu_share'] = round(cpu_seconds / capacity, 3) if capacity else None
+    return report
+
+
+def print_report(report):
+    print(f"\n{report['requests']:,} requests in {report['meta']['duration_s']}s: "
+          f"{report['throughput_rps']} req/s, {report['errors']} errors ({(report['error_rate'] or 0) * 100:.1f}%), "
+          f"{report['client_errors']} 4xx, {report['megabytes']} MB")
+    streams = report['streams']
+    print(f"Live streams: peak {streams['peak_open']} open, {streams['refused']} refused, {streams['drops']} dropped, "
+          f"{streams['polls']} fallback polls")
+    saturation = report['saturation']
+    print(f"Probe ({PROBE_PATH}): p50 {saturation['p50_ms']} ms, p99 {saturation['p99_ms']} ms, "
+          f"{(saturation['queued_share'] or 0) * 100:.0f}% waited >{PROBE_SLOW_MS} ms, {saturation['failed']} failed")
+    if 'worker_cpu_share' in saturation:
+        print(f"Worker CPU: {saturation['worker_cpu_seconds']}s, {saturation['worker_cpu_share'] * 100:.0f}% of "
+              f"{report['meta']['workers']} worker(s)")
+
+    print(f"\n{'page load':<44} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for name, stats in report['pages'].items():
+        print(f"{name:<44} {stats['count']:>6} {stats['p50_ms']:>9} {stats['p95_ms']:>9} "
+              f"{stats['p99_ms']:>9} {stats['max_ms']:>9}")
+    print(f"\n{'request':<44} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'errors':>7} {'4xx':>5}")
+    for name, stats in report['endpoints'].items():
+        print(f"{name[:44]:<44} {stats['count']:>6} {stats['p50_ms']:>9} {stats['p95_ms']:>9} "
+              f"{stats['p99_ms']:>9} {stats['max_ms']:>9} {stats['errors']:>7} {stats['client_errors']:>5}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay concurrent dashboard sessions against a running app')
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help='app to load (ignored with --spawn)')
+    parser.add_argument('--secretaries', type=int, default=4)
+    parser.add_argument('--admins', type=int, default=1)
+    parser.add_argument('--duration', type=float, default=120, help='seconds of load after the ramp-up')
+    parser.add_argument('--ramp', type=float, default=10, help='seconds over which sessions start')
+    parser.add_argument('--think-time', type=float, default=10, help='mean seconds between user actions')
+    parser.add_argument('--poll-interval', type=float, default=30, help='fallback poll period, as in the pages')
+    parser.add_argument('--no-streams', dest='streams', action='store_false', help="don't hold /api/stream open")
+    parser.add_argument('--timeout', type=float, default=60, help='per-request timeout in seconds')
+    parser.add_argument('--probe-interval', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--output', help='write the report as JSON')
+    spawn = parser.add_argument_group('spawning the servers')
+    spawn.add_argument('--spawn', action='store_true', help='start local_supabase.py and gunicorn for the run')
+    spawn.add_argument('--database', default=':memory:', help='SQLite file for local_supabase.py')
+    spawn.add_argument('--latency-ms', type=float, default=40, help='stand-in latency per Supabase request')
+    spawn.add_argument('--workers', type=int, default=1)
+    spawn.add_argument('--threads', type=int, default=8)
+    spawn.add_argument('--worker-class', default='gthread', choices=['gthread', 'sync', 'gevent'])
+    spawn.add_argument('--preload', action='store_true', help='import the app in the master before forking')
+    spawn.add_argument('--port', type=int, default=8765)
+    spawn.add_argument('--stand-in-port', type=int, default=54329)
+    args = parser.parse_args()
+
+    processes = []
+    if args.spawn:
+        args.url, processes = spawn_servers(args)
+        threads = f", {args.threads} threads" if args.worker_class == 'gthread' else ''
+        print(f"🚀 gunicorn ({args.workers} x {args.worker_class}{threads}{', preload' if args.preload else ''}) on {args.url}, "
+              f"stand-in latency {args.latency_ms:g} ms")
+    base_url = args.url.rstrip('/')
+
+    recorder = Recorder()
+    stop = threading.Event()
+    sessions = [SecretarySession(f'secretary-{i + 1}', base_url, SECRETARY_LOGINS[i % len(SECRETARY_LOGINS)],
+                                 args, recorder, stop) for i in range(args.secretaries)]
+    sessions += [AdminSession(f'admin-{i + 1}', base_url, ADMIN_LOGINS[i % len(ADMIN_LOGINS)],
+                              args, recorder, stop) for i in range(args.admins)]
+
+    print(f"👥 {args.secretaries} secretaries + {args.admins} admins against {base_url} for "
+          f"{args.duration:g}s (+{args.ramp:g}s ramp-up)")
+    cpu_before = worker_cpu_seconds(processes[1].pid) if args.spawn else None
+    started = time.perf_counter()
+    threading.Thread(target=probe, args=(base_url, recorder, stop, args.probe_interval), daemon=True).start()
+    try:
+        for session in sessions:
+            session.start()
+            if stop.wait(args.ramp / max(1, len(sessions))):
+                break
+        stop.wait(args.duration)
+    except KeyboardInterrupt:
+        print("\n⏹️ Stopped early")
+    finally:
+        stop.set()
+        elapsed = time.perf_counter() - started
+        cpu_after = worker_cpu_seconds(processes[1].pid) if args.spawn else None
+        for session in sessions:
+            session.join(timeout=args.timeout)
+        stop_servers(processes)
+
+    cpu_seconds = cpu_after - cpu_before if cpu_before is not None and cpu_after is not None else None
+    report = build_report(args, recorder, elapsed, cpu_seconds)
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📝 Report written to {args.output}")
+    return 1 if report['requests'] == 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""How long a fresh process takes before it can serve traffic.
+
+Serves local_supabase.py in-process with hosted-database latency, then
+
+  - imports app.py in fresh interpreters and counts the Supabase requests
+    the import makes (should be none), and
+  - starts gunicorn through gunicorn.conf.py and times, from spawn, the
+    first answered request and /readyz turning 200 in every worker.
+
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --latency-ms 80 --workers 4 --runs 5
+    python benchmarks/startup_time.py --workers 4 --preload
+
+--repo measures another checkout (e.g. a `git worktree` of an older commit)
+with the same stand-in, for before/after numbers.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from local_supabase import LocalSupabase
+
+IMPORT_SNIPPET = 'import time; started = time.perf_counter(); import app; print(time.perf_counter() - started)'
+
+
+def import_seconds(repo, env):
+    output = subprocess.run([sys.executable, '-c', IMPORT_SNIPPET], cwd=repo, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def get_status(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+    except OSError:
+        return None
+
+
+def gunicorn_boot(repo, env, args):
+    """(seconds to first response, seconds until every worker reports ready or None)"""
+    url = f'http://127.0.0.1:{args.port}'
+    started = time.perf_counter()
+    env = {**env, 'GUNICORN_WORKER_CLASS': args.worker_class, 'GUNICORN_THREADS': str(args.threads),
+           'WEB_CONCURRENCY': str(args.workers), 'GUNICORN_PRELOAD': '1' if args.preload else '0'}
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'app:app', '--worker-class', args.worker_class, '--threads', str(args.threads),
+         '--workers', str(args.workers), '--timeout', '120', '--bind', f'127.0.0.1:{args.port}'],
+        cwd=repo, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    first_response = ready = None
+    ready_hits = 0
+    try:
+        deadline = started + args.timeout
+        while time.perf_counter() < deadline:
+            status = get_status(f'{url}/readyz')
+            if status is not None and first_response is None:
+                first_response = time.perf_counter() - started
+            if status == 404:       # a checkout without /readyz: booted is as ready as it gets
+                ready = first_response
+                break
+            # Requests land on whichever worker accepts first, so a run of 200s
+            # is needed before all of them are likely warm
+            ready_hits = ready_hits + 1 if status == 200 else 0
+            if ready_hits >= args.workers * 3:
+                ready = time.perf_counter() - started
+                break
+            time.sleep(0.02)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    return first_response, ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure app import time and gunicorn worker boot time')
+    parser.add_argument('--repo', default=REPO_DIR, help='checkout to measure (default: this one)')
+    parser.add_argument('--latency-ms', type=float, default=40, help='stand-in latency per Supabase request')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--worker-class', default='gthread', choices=['gthread', 'sync', 'gevent'])
+    parser.add_argument('--preload', action='store_true', help='import the app in the master before forking')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--timeout', type=float, default=120)
+    args = parser.parse_args()
+
+    stand_in = LocalSupabase(latency_ms=args.latency_ms)
+    env = {**os.environ, 'SUPABASE_URL': stand_in.start(), 'PYTHONDONTWRITEBYTECODE': '1'}
+    repo = os.path.abspath(args.repo)
+    print(f"⏱️  {repo}, stand-in latency {args.latency_ms:g} ms, {args.runs} runs\n")
+
+    imports, import_calls = [], []
+    for _ in range(args.runs):
+        stand_in.reset_calls()
+        imports.append(import_seconds(repo, env))
+        import_calls.append(stand_in.total_calls)
+    print(f"{'import app:':<34} median {statistics.median(imports) * 1000:7.0f} ms, "
+          f"{max(import_calls)} Supabase requests")
+
+    boots = [gunicorn_boot(repo, env, args) for _ in range(args.runs)]
+    firsts = [first for first, _ in boots if first is not None]
+    readies = [ready for _, ready in boots if ready is not None]
+    label = f"gunicorn ({args.workers} x {args.worker_class}{', preload' if args.preload else ''})"
+    if firsts:
+        print(f"{label + ' first response:':<34} median {statistics.median(firsts) * 1000:7.0f} ms")
+    if readies:
+        print(f"{label + ' all ready:':<34} median {statistics.median(readies) * 1000:7.0f} ms")
+    if len(readies) < len(boots):
+        print(f"❌ {len(boots) - len(readies)} of {len(boots)} boots never became ready")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""Deterministic parish-scale test data.
+
+Generates staff users, secretaries, priests, clients, reservations (weddings,
+baptisms, multi-day funerals, confirmations), stipendium payments and events
+in the shapes the app writes them - including the [SERVICE_DETAILS] block in
+reservations.special_requests and the events/staff shapes from
+insert_sample_events.sql and insert_sample_staff.sql.
+
+    # Into a SQLite file the local stand-in can serve
+    python benchmarks/synthetic_data.py --size 100k --database /tmp/churchease-100k.sqlite
+    python local_supabase.py --database /tmp/churchease-100k.sqlite --latency-ms 40
+
+    # Into a scratch Supabase project (never the production one)
+    python benchmarks/synthetic_data.py --size 10k --supabase-url https://<scratch>.supabase.co --supabase-key <service key>
+
+The same --seed always produces the same rows. Rows are generated and loaded
+--batch-size reservations at a time, so memory use does not grow with --size.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from werkzeug.security import generate_password_hash
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# Password of every generated staff and priest account
+DEFAULT_PASSWORD = 'password123'
+
+FIRST_NAMES = [
+    'Juan', 'Maria', 'Jose', 'Ana', 'Pedro', 'Rosa', 'Miguel', 'Carmen', 'Antonio', 'Luz',
+    'Ramon', 'Elena', 'Francisco', 'Teresa', 'Manuel', 'Josefina', 'Carlos', 'Cristina', 'Roberto', 'Angelica',
+    'Mark', 'Kristine', 'John Paul', 'Mary Grace', 'Rommel', 'Jasmine', 'Noel', 'Rowena', 'Jerome', 'Hana',
+]
+LAST_NAMES = [
+    'Dela Cruz', 'Santos', 'Reyes', 'Garcia', 'Mendoza', 'Bautista', 'Villanueva', 'Ramos', 'Aquino', 'Castillo',
+    'Flores', 'Gonzales', 'Torres', 'Rivera', 'Navarro', 'Umali', 'Cadorna', 'Arbatin', 'Pascual', 'Domingo',
+    'Manalo', 'Salvador', 'Soriano', 'Tolentino', 'Valdez', 'Lim', 'Tan', 'Ocampo', 'Magbanua', 'Evangelista',
+]
+CITIES = ['Quezon City', 'Manila', 'Pasig', 'Marikina', 'Antipolo', 'Caloocan', 'Taytay', 'Cainta']
+SPECIALIZATIONS = ['Weddings', 'Baptisms', 'Funeral Masses', 'Confirmations', 'Youth Ministry', 'Parish Administration']
+
+SERVICE_WEIGHTS = {'baptism': 40, 'wedding': 25, 'funeral': 20, 'confirmation': 15}
+# Same defaults as /api/service-pricing; confirmations are not charged
+SERVICE_PRICES = {'wedding': 15000.0, 'baptism': 3000.0, 'funeral': 8000.0}
+SERVICE_TIMES = {
+    'wedding': ['08:00:00', '10:00:00', '13:00:00', '15:00:00'],
+    'baptism': ['09:00:00', '10:00:00', '11:00:00', '14:00:00'],
+    'funeral': ['08:00:00', '09:00:00', '13:00:00'],
+    'confirmation': ['09:00:00', '14:00:00'],
+}
+SPECIAL_REQUESTS = [
+    'Please prepare extra chairs for elderly guests.',
+    'Requesting choir for the ceremony.',
+    'Will bring own photographer.',
+    'Family requests a short homily.',
+    'Needs wheelchair access at the side entrance.',
+]
+
+# (event_name, event_type, description, start, end) - shapes from insert_sample_events.sql
+EVENT_TEMPLATES = [
+    ('Sunday Morning Service', 'worship', 'Regular Sunday worship service for the congregation', '09:00:00', '11:00:00'),
+    ('Youth Fellowship Meeting', 'youth', 'Monthly youth fellowship and bible study session', '18:00:00', '20:00:00'),
+    ('Community Outreach Program', 'community', 'Community service and outreach to local families', '14:00:00', '17:00:00'),
+    ('Food Distribution Drive', 'outreach', 'Monthly food distribution for needy families', '10:00:00', '15:00:00'),
+    ('Bible Study Session', 'worship', 'Weekly bible study and prayer meeting', '19:00:00', '21:00:00'),
+    ('Senior Citizens Gathering', 'community', 'Monthly gathering for senior church members', '15:00:00', '17:00:00'),
+    ('Charity Fundraising Event', 'outreach', 'Fundraising event for church charity programs', '16:00:00', '20:00:00'),
+    ('Parish Council Meeting', 'meeting', 'Monthly parish pastoral council meeting', '18:00:00', '20:00:00'),
+    ('Christmas Celebration', 'special', 'Annual Christmas celebration and mass', '19:00:00', '22:00:00'),
+]
+
+RESERVATION_ID_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+RESERVATION_ID_SPACE = 36 ** 8
+
+
+def parse_size(text):
+    text = text.strip().lower()
+    if text in SIZES:
+        return SIZES[text]
+    return int(text.replace('_', ''))
+
+
+class ParishDataGenerator:
+    """Streams deterministic rows for every table the app reads"""
+
+    def __init__(self, reservations, seed=2024, start=date(2021, 1, 1), end=date(2026, 12, 31), today=None):
+        self.total = reservations
+        self.seed = seed
+        self.start = start
+        self.end = end
+        self.today = today or date.today()
+        self.random = random.Random(seed)
+        self.password_hash = generate_password_hash(DEFAULT_PASSWORD)
+        self.services = list(SERVICE_WEIGHTS)
+        self.service_weights = list(SERVICE_WEIGHTS.values())
+        self.day_span = (end - start).days + 1
+
+        self.users = []
+        self.priests = []
+
+    # ---- helpers
+
+    def _uuid(self):
+        return str(uuid.UUID(int=self.random.getrandbits(128), version=4))
+
+    def _timestamp(self, day, hour=None):
+        moment = datetime(day.year, day.month, day.day, hour if hour is not None else self.random.randint(7, 18),
+                          self.random.randint(0, 59), self.random.randint(0, 59), tzinfo=timezone.utc)
+        return moment.isoformat()
+
+    def _name(self):
+        return self.random.choice(FIRST_NAMES), self.random.choice(LAST_NAMES)
+
+    def _phone(self):
+        return f'09{self.random.randint(10, 99)}-{self.random.randint(100, 999)}-{self.random.randint(1000, 9999)}'
+
+    @staticmethod
+    def _reservation_id(index):
+        # A bijection on 36^8, so ids look like generate_reservation_id() but never collide
+        value = (index * 2_654_435_761 + 1_234_567) % RESERVATION_ID_SPACE
+        digits = []
+        for _ in range(8):
+            value, remainder = divmod(value, 36)
+            digits.append(RESERVATION_ID_ALPHABET[remainder])
+        return 'R' + ''.join(digits)
+
+    # ---- staff
+
+    def staff(self):
+        """users, secretaries and admins (insert_sample_staff.sql shapes)"""
+        secretary_count = 5 + self.total // 20_000
+        users, secretaries = [], []
+        for index in range(secretary_count):
+            first, last = self._name()
+            username = f'{first.split()[0]}.{last.replace(" ", "")}{index + 1}'.lower()
+            email = f'{username}@churchease.test'
+            created = self._timestamp(self.start)
+            users.append({
+                'id': self._uuid(), 'username': username, 'email': email, 'password_hash': self.password_hash,
+                'full_name': f'{first} {last}', 'role': 'secretary', 'status': 'active',
+                'created_at': created, 'updated_at': created,
+            })
+            secretaries.append({
+                'id': self._uuid(), 'full_name': f'{first} {last} {index + 1}'.upper(), 'email': email,
+                'phone': self._phone(), 'department': 'Church Administration',
+                'position': 'Senior Secretary' if index == 0 else 'Secretary', 'status': 'active',
+                'username': username, 'password_hash': self.password_hash, 'email_verified': True,
+                'created_at': created, 'updated_at': created,
+            })
+        admins = [{
+            'id': self._uuid(), 'full_name': 'JUAN DELA CRUZ', 'email': 'juan.delacruz@churchease.test',
+            'phone': self._phone(), 'department': 'Church Management', 'position': 'System Administrator',
+            'admin_level': 'super', 'status': 'active',
+        }]
+        self.users = users
+        return [('users', users), ('secretaries', secretaries), ('admins', admins)]
+
+    def priests_rows(self):
+        count = min(40, max(4, self.total // 2_500))
+        rows = []
+        for index in range(count):
+            first, last = self._name()
+            username = f'fr.{first.split()[0]}{index + 1}'.lower()
+            rows.append({
+                'id': self._uuid(), 'first_name': first, 'last_name': last,
+                'email': f'{username}@churchease.test', 'phone': self._phone(),
+                # A few inactive priests so the active filters matter
+                'status': 'inactive' if index % 10 == 9 else 'active',
+                'specialization': self.random.choice(SPECIALIZATIONS),
+                'username': username, 'password_hash': self.password_hash, 'email_verified': True,
+                'created_at': self._timestamp(self.start),
+            })
+        self.priests = rows
+        return [('priests', rows)]
+
+    # ---- reservations
+
+    def _service_details(self, service, day, time_of_day, client_last_name):
+        first = self.random.choice(FIRST_NAMES)
+        if service == 'wedding':
+            return {
+                'bride_name': f'{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}',
+                'groom_name': f'{first} {client_last_name}',
+                'number_of_guests': str(self.random.choice([50, 80, 100, 150, 200])),
+                'wedding_theme': self.random.choice(['', 'Classic', 'Rustic', 'Garden', 'Vintage']),
+                'bride_address': self.random.choice(CITIES),
+                'groom_address': self.random.choice(CITIES),
+            }
+        if service == 'baptism':
+            father, mother = self.random.choice(FIRST_NAMES), self.random.choice(FIRST_NAMES)
+            birth = day - timedelta(days=self.random.randint(30, 700))
+            return {
+                'child_name': f'{first} {client_last_name}',
+                'child_gender': self.random.choice(['Male', 'Female']),
+                'baptism_type': self.random.choice(['Regular', 'Special']),
+                'parents': f'{father} {client_last_name} & {mother} {client_last_name}',
+                'father_name': f'{father} {client_last_name}',
+                'mother_name': f'{mother} {client_last_name}',
+                'birth_date': birth.isoformat(),
+            }
+        if service == 'funeral':
+            end = day + timedelta(days=self.random.randint(2, 4))
+            return {
+                'deceased_name': f'{first} {client_last_name}',
+                'deceased_age': str(self.random.randint(45, 98)),
+                'relationship': self.random.choice(['Father', 'Mother', 'Grandfather', 'Grandmother', 'Spouse']),
+                'burial_location': f'{self.random.choice(CITIES)} Memorial Park',
+                'wake_location': f'{self.random.choice(CITIES)} Chapels',
+                'date_of_death': (day - timedelta(days=self.random.randint(1, 5))).isoformat(),
+                'funeral_home_contact': self._phone(),
+                'funeral_start_date': day.isoformat(),
+                'funeral_start_time': time_of_day,
+                'funeral_end_date': end.isoformat(),
+                'funeral_end_time': self.random.choice(['15:00', '16:00', '17:00']),
+            }
+        return {
+            'confirmand_name': f'{first} {client_last_name}',
+            'confirmation_name': self.random.choice(['Michael', 'Gabriel', 'Teresa', 'Clare', 'Joseph', 'Mary']),
+            'sponsor_name': f'{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}',
+            'attendees': str(self.random.randint(5, 30)),
+            'preparation_status': self.random.choice(['Completed', 'In Progress']),
+        }
+
+    def _status(self, day, priest):
+        if day < self.today:
+            status = self.random.choices(['completed', 'approved', 'cancelled', 'declined'], [60, 25, 8, 7])[0]
+        else:
+            status = self.random.choices(['pending', 'waiting_priest_approval', 'approved', 'cancelled'],
+                                         [35, 25, 35, 5])[0]
+        if status == 'waiting_priest_approval' and priest is None:
+            status = 'pending'
+        return status
+
+    def _attendance(self, day, status):
+        if day >= self.today or status not in ('approved', 'completed', 'cancelled'):
+            return 'pending'
+        if status == 'cancelled':
+            return 'cancelled'
+        return self.random.choices(['attended', 'no_show'], [94, 6])[0]
+
+    def _payment(self, reservation, service, attendance, marked_at):
+        base = SERVICE_PRICES[service]
+        discount_type = self.random.choices(['none', 'percentage', 'fixed'], [80, 12, 8])[0]
+        discount_value = {'none': 0.0, 'percentage': float(self.random.choice([5, 10, 20])),
+                          'fixed': float(self.random.choice([500, 1000]))}[discount_type]
+        discount_amount = base * discount_value / 100 if discount_type == 'percentage' else min(discount_value, base)
+        amount_due = base - discount_amount
+
+        kind = self.random.choices(['full', 'partial', 'pending'], [55, 30, 15])[0]
+        amount_paid = {'full': amount_due, 'partial': round(amount_due * self.random.choice([0.3, 0.5]), 2),
+                       'pending': 0.0}[kind]
+        payment_type = {'full': 'Full', 'partial': 'Downpayment', 'pending': ''}[kind]
+        notes = ''
+        updated_at = reservation['created_at']
+        if attendance == 'cancelled' and amount_paid:
+            # Refund as mark_attendance does it: the constraint has no refunded status
+            amount_paid, payment_type, notes = 0.0, 'None', 'Refunded on cancellation'
+            updated_at = marked_at
+        status = 'Paid' if amount_paid >= amount_due else 'Partial' if amount_paid > 0 else 'Pending'
+        method = self.random.choices(['Cash', 'GCash'], [80, 20])[0]
+        return {
+            'id': self._uuid(),
+            'reservation_id': reservation['id'],
+            'service_type': service,
+            'payment_method': method,
+            'payment_type': payment_type,
+            'base_price': base,
+            'discount_type': discount_type,
+            'discount_value': discount_value,
+            'discount_amount': discount_amount,
+            'amount_due': amount_due,
+            'amount_paid': amount_paid,
+            'balance': round(amount_due - amount_paid, 2),
+            'payment_status': status,
+            'gcash_reference': f'{self.random.randint(10**12, 10**13 - 1)}' if method == 'GCash' else None,
+            'payment_notes': notes,
+            'created_at': reservation['created_at'],
+            'updated_at': updated_at,
+        }
+
+    def reservation_batches(self, batch_size):
+        """Yields [('clients', rows), ('reservations', rows), ('payments', rows)] per batch"""
+        clients, reservations, payments = [], [], []
+        active_priests = [priest for priest in self.priests if priest['status'] == 'active']
+        for index in range(self.total):
+            service = self.random.choices(self.services, self.service_weights)[0]
+            day = self.start + timedelta(days=self.random.randrange(self.day_span))
+            time_of_day = self.random.choice(SERVICE_TIMES[service])
+            booked = day - timedelta(days=self.random.randint(3, 120))
+            created_at = self._timestamp(booked)
+            first, last = self._name()
+
+            client = {
+                'id': self._uuid(), 'first_name': first, 'last_name': last, 'phone': self._phone(),
+                'email': f'{first.split()[0]}.{last.replace(" ", "")}{index}@mail.test'.lower(),
+                'address': self.random.choice(CITIES), 'created_at': created_at,
+            }
+            priest = self.random.choice(active_priests) if self.random.random() < 0.8 else None
+            status = self._status(day, priest)
+            attendance = self._attendance(day, status)
+            secretary = self.random.choice(self.users)
+            marked_at = self._timestamp(day, hour=19) if attendance != 'pending' else None
+
+            details = self._service_details(service, day, time_of_day, last)
+            special = f'[SERVICE_DETAILS]{json.dumps(details)}[/SERVICE_DETAILS]'
+            if self.random.random() < 0.2:
+                special = f'{self.random.choice(SPECIAL_REQUESTS)}\n\n{special}'
+
+            reservation = {
+                'id': self._uuid(),
+                'reservation_id': self._reservation_id(index),
+                'service_type': service,
+                'reservation_date': day.isoformat(),
+                'reservation_time': time_of_day,
+                'location': 'Main Church',
+                'attendees': int(details['number_of_guests']) if service == 'wedding' else 1,
+                'special_requests': special,
+                'status': status,
+                'priest_id': priest['id'] if priest else None,
+                'priest_response': None,
+                'client_id': client['id'],
+                'created_by': secretary['id'],
+                'created_by_secretary': secretary['full_name'],
+                'created_by_email': secretary['email'],
+                'attendance_status': attendance,
+                'attendance_marked_at': marked_at,
+                'attendance_marked_by': None,
+                'created_at': created_at,
+                'updated_at': marked_at or created_at,
+            }
+            if service == 'funeral':
+                reservation.update({
+                    'funeral_start_date': details['funeral_start_date'],
+                    'funeral_start_time': details['funeral_start_time'],
+                    'funeral_end_date': details['funeral_end_date'],
+                    'funeral_end_time': details['funeral_end_time'] + ':00',
+                })
+
+            clients.append(client)
+            reservations.append(reservation)
+            if service in SERVICE_PRICES:
+                payments.append(self._payment(reservation, service, attendance, marked_at))
+
+            if len(reservations) >= batch_size:
+                yield [('clients', clients), ('reservations', reservations), ('payments', payments)]
+                clients, reservations, payments = [], [], []
+        if reservations:
+            yield [('clients', clients), ('reservations', reservations), ('payments', payments)]
+
+    def event_batches(self, batch_size):
+        count = max(10, self.total // 10)
+        batch = []
+        for _ in range(count):
+            name, event_type, description, start_time, end_time = self.random.choice(EVENT_TEMPLATES)
+            day = self.start + timedelta(days=self.random.randrange(self.day_span))
+            if day < self.today:
+                status = self.random.choices(['completed', 'cancelled'], [90, 10])[0]
+            else:
+                status = self.random.choices(['pending', 'confirmed', 'cancelled'], [40, 55, 5])[0]
+            created_at = self._timestamp(day - timedelta(days=self.random.randint(7, 60)))
+            secretary = self.random.choice(self.users)
+            batch.append({
+                'id': self._uuid(), 'event_name': name, 'event_type': event_type, 'description': description,
+                'event_date': day.isoformat(), 'start_time': start_time, 'end_time': end_time,
+                'assigned_priest': self.random.choice(self.priests)['id'] if self.random.random() < 0.9 else None,
+                'status': status, 'created_by': secretary['id'],
+                'created_by_secretary': secretary['full_name'], 'created_by_email': secretary['email'],
+                'created_at': created_at, 'updated_at': created_at,
+            })
+            if len(batch) >= batch_size:
+                yield [('events', batch)]
+                batch = []
+        if batch:
+            yield [('events', batch)]
+
+    def batches(self, batch_size=1_000):
+        """Every table in foreign-key order, batch_size rows at a time"""
+        yield self.staff()
+        yield self.priests_rows()
+        yield from self.reservation_batches(batch_size)
+        yield from self.event_batches(batch_size)
+
+
+# ============================================
+# LOADERS
+# ============================================
+
+class StandInLoader:
+    """Writes straight into the SQLite database of local_supabase.py"""
+
+    def __init__(self, database):
+        from local_supabase import LocalSupabase
+        self.stand_in = LocalSupabase(database)
+
+    def load(self, table, rows):
+        self.stand_in.bulk_insert(table, rows)
+
+
+class SupabaseLoader:
+    """Inserts through the REST API of a (scratch) Supabase project"""
+
+    def __init__(self, url, key):
+        from supabase import create_client
+        self.client = create_client(url, key)
+
+    def load(self, table, rows):
+        self.client.table(table).insert(rows).execute()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate deterministic ChurchEase test data')
+    parser.add_argument('--size', default='10k', help='reservations: 1k, 10k, 100k, 1m or a number')
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--batch-size', type=int, default=1_000)
+    parser.add_argument('--start', default='2021-01-01', help='first reservation date')
+    parser.add_argument('--end', default='2026-12-31', help='last reservation date')
+    parser.add_argument('--today', help='split past/future statuses at this date (default: today)')
+    parser.add_argument('--database', help='SQLite file to load for local_supabase.py')
+    parser.add_argument('--supabase-url', help='scratch Supabase project to load instead')
+    parser.add_argument('--supabase-key')
+    args = parser.parse_args()
+
+    if bool(args.database) == bool(args.supabase_url):
+        parser.error('give exactly one of --database or --supabase-url')
+    if args.supabase_url and not args.supabase_key:
+        parser.error('--supabase-url needs --supabase-key')
+
+    total = parse_size(args.size)
+    generator = ParishDataGenerator(
+        total, seed=args.seed,
+        start=date.fromisoformat(args.start), end=date.fromisoformat(args.end),
+        today=date.fromisoformat(args.today) if args.today else None)
+    loader = StandInLoader(args.database) if args.database else SupabaseLoader(args.supabase_url, args.supabase_key)
+
+    print(f"🌱 Generating {total:,} reservations (seed {args.seed}) into {args.database or args.supabase_url}")
+    started = time.perf_counter()
+    counts = {}
+    for batch in generator.batches(args.batch_size):
+        for table, rows in batch:
+            if rows:
+                loader.load(table, rows)
+                counts[table] = counts.get(table, 0) + len(rows)
+        done = counts.get('reservations', 0)
+        if done and done % (args.batch_size * 50) == 0:
+            print(f"   {done:,} reservations ({time.perf_counter() - started:.0f}s)")
+
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
+    for table, count in counts.items():
+        print(f"   {table:<14} {count:>10,}")
+    print(f"   Staff and priest accounts use the password '{DEFAULT_PASSWORD}'")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Gunicorn settings for ChurchEase, read automatically from the repo root.
+
+    gunicorn app:app              (or gunicorn 'app:create_app()')
+
+Pick the worker class with GUNICORN_WORKER_CLASS; WEB_CONCURRENCY sets the
+number of workers (gunicorn's own variable, default 1):
+
+  gthread (default)  GUNICORN_THREADS threads per worker (8). Up to
+                     LIVE_MAX_STREAMS (4) of them may hold an /api/stream
+                     connection; the rest serve normal requests.
+  sync               One request at a time per worker. Live streams are
+                     turned off (LIVE_MAX_STREAMS=0) because each would pin a
+                     whole worker; dashboards use their 30-second polling.
+  gevent             GUNICORN_WORKER_CONNECTIONS greenlets per worker (1000),
+                     LIVE_MAX_STREAMS defaults to 100. Needs `pip install
+                     gevent`, and trio must not be installed: httpcore
+                     imports it when present and it fails under gevent. Not
+                     combined with preload: the app must be imported after
+                     gevent has patched threading and sockets.
+
+GUNICORN_PRELOAD=1 imports the app once in the master and forks workers
+from it (faster boots, shared memory for templates and code). post_fork
+gives every worker its own Supabase client, locks and live-update state.
+
+With more than one worker, also set LIVE_UPDATES_BACKEND=supabase and
+OTP_STORAGE_BACKEND=supabase so live updates and sign-up codes reach every
+worker.
+"""
+import os
+import sys
+
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+timeout = 120
+
+if worker_class == 'gthread':
+    threads = int(os.getenv('GUNICORN_THREADS', '8'))
+elif worker_class == 'sync':
+    os.environ.setdefault('LIVE_MAX_STREAMS', '0')
+elif worker_class == 'gevent':
+    worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))
+    os.environ.setdefault('LIVE_MAX_STREAMS', '100')
+
+preload_app = os.getenv('GUNICORN_PRELOAD', '0') == '1' and worker_class != 'gevent'
+
+
+def post_fork(server, worker):
+    # Only with preload_app is the app already imported here; importing it
+    # ourselves would run before the gevent worker has patched the stdlib
+    app_module = sys.modules.get('app')
+    if app_module is not None:
+        app_module.init_process_resources()
+
+
+def post_worker_init(worker):
+    # Warm up before the first request rather than on it; worker.wsgi is the
+    # app gunicorn loaded (app:app or 'app:create_app()')
+    sys.modules['app'].start_warm_up(worker.wsgi)
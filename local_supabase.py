@@ -0,0 +1,1211 @@
+"""Local stand-in for the Supabase REST API, for offline benchmarks and tests.
+
+Implements the part of PostgREST that app.py uses - select with embedded
+resources, eq/neq/gt/gte/lt/lte/like/ilike/is/in filters and or/and groups
+of them, order, limit, offset, count, insert/upsert, update, delete and the
+RPCs in RPC_FUNCTIONS - on top of SQLite. Tables come from the repo's SQL
+files (supabase_setup.sql, create_staff_tables.sql and the migrations in
+SCHEMA_FILES).
+
+    # Separate server, then point the app at it
+    python local_supabase.py --port 54321 --latency-ms 40 --database /tmp/churchease.sqlite
+    SUPABASE_URL=http://127.0.0.1:54321 python app.py
+
+    # In-process, e.g. from a benchmark (before app is imported)
+    stand_in = LocalSupabase(latency_ms=40)
+    os.environ['SUPABASE_URL'] = stand_in.start()
+    import app
+
+Every request sleeps latency_ms (+ up to jitter_ms) before it is answered, so
+a loop of per-row lookups costs what it would against the hosted project.
+stand_in.calls counts requests per (method, table).
+
+The SQL files lag behind the hosted schema (the payments table, for one, is
+not in the repo), so tables and columns that are written but not declared
+are added on first write, and reading an unknown column gives null instead
+of an error. Embedded resources follow the REFERENCES in the SQL files, or
+the <table>_id naming convention when there is none.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone, date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from urllib.parse import unquote_to_bytes
+
+from werkzeug.wrappers import Request, Response
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Applied in order; later files alter or replace tables from earlier ones
+SCHEMA_FILES = [
+    'supabase_setup.sql',
+    'create_staff_tables.sql',
+    'create_events_table_only.sql',
+    'create_secretary_accounts_table.sql',
+    'add_funeral_multiday_fields.sql',
+    'add_secretary_tracking.sql',
+    'add_secretary_tracking_to_events.sql',
+    'add_username_to_priests.sql',
+    'attendance_migration.sql',
+    'add_sync_tombstones.sql',
+    'add_live_notifications.sql',
+    'add_otp_codes.sql',
+    'add_book_reservation_rpc.sql',
+    'add_report_snapshots.sql',
+    'add_client_dedup.sql',
+    'add_stipendium_ledger.sql',
+]
+
+REST_PREFIX = '/rest/v1/'
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+FILTER_OPERATORS = {'eq': '=', 'neq': '<>', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+SQLITE_CHUNK = 500  # keys per IN (...) when loading embedded rows
+
+# Trigger functions from the SQL files that the stand-in reproduces
+TOUCH_UPDATED_AT_FUNCTIONS = {'update_updated_at_column', 'update_staff_updated_at'}
+TOMBSTONE_FUNCTIONS = {'record_sync_tombstone'}
+
+
+class KeepAliveRequestHandler(BaseHTTPRequestHandler):
+    """Serves the stand-in over HTTP/1.1 keep-alive like the hosted API does.
+
+    werkzeug's development server closes the connection after every response,
+    which would make each app request pay a new connection and hide whether
+    the app's connection pool is reused at all.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def handle_wsgi(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        path, _, query = self.path.partition('?')
+        host, port = self.server.server_address[:2]
+        environ = {
+            'REQUEST_METHOD': self.command,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': unquote_to_bytes(path).decode('latin-1'),
+            'QUERY_STRING': query,
+            'SERVER_NAME': host,
+            'SERVER_PORT': str(port),
+            'SERVER_PROTOCOL': self.request_version,
+            'REMOTE_ADDR': self.client_address[0],
+            'CONTENT_TYPE': self.headers.get('Content-Type', ''),
+            'CONTENT_LENGTH': str(length),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in self.headers.items():
+            key = 'HTTP_' + name.upper().replace('-', '_')
+            if key not in ('HTTP_CONTENT_TYPE', 'HTTP_CONTENT_LENGTH'):
+                environ[key] = value
+
+        started = []
+
+        def start_response(status, headers, exc_info=None):
+            started[:] = [status, headers]
+
+        chunks = self.server.app(environ, start_response)
+        try:
+            payload = b''.join(chunks)
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+
+        status, headers = started
+        code, _, reason = status.partition(' ')
+        self.send_response(int(code), reason)
+        for name, value in headers:
+            if name.lower() not in ('content-length', 'connection'):
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = handle_wsgi
+
+    def log_request(self, *args, **kwargs):
+        # Keeps the app's own console output readable
+        pass
+
+
+def make_server(host, port, app):
+    server = ThreadingHTTPServer((host, port), KeepAliveRequestHandler)
+    server.daemon_threads = True
+    server.app = app
+    return server
+
+
+class PostgrestError(Exception):
+    """Answered as a PostgREST error body"""
+
+    def __init__(self, status, code, message, details=None, hint=None):
+        super().__init__(message)
+        self.status = status
+        self.body = {'code': code, 'message': message, 'details': details, 'hint': hint}
+
+
+# ============================================
+# SCHEMA
+# ============================================
+
+class Column:
+    def __init__(self, name, kind, default=None, references=None, unique=False, primary=False):
+        self.name = name
+        self.kind = kind              # uuid, text, integer, serial, numeric, boolean, date, time, timestamp, json
+        self.default = default        # SQL default expression (text) or None
+        self.references = references  # referenced table name or None
+        self.unique = unique
+        self.primary = primary
+
+    @property
+    def affinity(self):
+        if self.kind in ('integer', 'serial', 'boolean'):
+            return 'INTEGER'
+        if self.kind == 'numeric':
+            return 'REAL'
+        return 'TEXT'
+
+    def ddl(self):
+        if self.kind == 'serial' and self.primary:
+            return f'"{self.name}" INTEGER PRIMARY KEY AUTOINCREMENT'
+        parts = [f'"{self.name}"', self.affinity]
+        if self.primary:
+            parts.append('PRIMARY KEY')
+        elif self.unique:
+            parts.append('UNIQUE')
+        return ' '.join(parts)
+
+
+class Table:
+    def __init__(self, name):
+        self.name = name
+        self.columns = {}
+        self.touch_updated_at = False
+        self.tombstone = False
+
+    @property
+    def primary_key(self):
+        return next((c.name for c in self.columns.values() if c.primary), 'id')
+
+    @classmethod
+    def implicit(cls, name):
+        """A table the SQL files never create: give it the usual id and created_at"""
+        table = cls(name)
+        table.columns['id'] = Column('id', 'uuid', default='gen_random_uuid()', primary=True)
+        table.columns['created_at'] = Column('created_at', 'timestamp', default='now()')
+        return table
+
+
+def _column_kind(sql_type):
+    sql_type = sql_type.lower()
+    if 'serial' in sql_type:
+        return 'serial'
+    if sql_type.startswith('uuid'):
+        return 'uuid'
+    if sql_type.startswith(('int', 'bigint', 'smallint')):
+        return 'integer'
+    if sql_type.startswith(('numeric', 'decimal', 'real', 'double', 'float', 'money')):
+        return 'numeric'
+    if sql_type.startswith('bool'):
+        return 'boolean'
+    if sql_type.startswith('timestamp'):
+        return 'timestamp'
+    if sql_type.startswith('date'):
+        return 'date'
+    if sql_type.startswith('time'):
+        return 'time'
+    if sql_type.startswith('json'):
+        return 'json'
+    return 'text'
+
+
+_COLUMN_RE = re.compile(
+    r'^"?(?P<name>\w+)"?\s+(?P<type>\w+(?:\s+(?:precision|varying|with(?:out)?\s+time\s+zone))*(?:\s*\([^)]*\))?(?:\[\])?)'
+    r'(?P<rest>.*)$', re.I | re.S)
+_DEFAULT_RE = re.compile(r"\bDEFAULT\s+('(?:[^']|'')*'(?:::\w+)?|[\w.]+\s*\(\s*\)|[-\w.]+)", re.I)
+_REFERENCES_RE = re.compile(r'\bREFERENCES\s+"?(\w+)"?', re.I)
+_TABLE_CONSTRAINT_RE = re.compile(r'^(CONSTRAINT|PRIMARY\s+KEY|UNIQUE\s*\(|FOREIGN\s+KEY|CHECK\s*\(|EXCLUDE)', re.I)
+
+
+def _parse_column(definition):
+    match = _COLUMN_RE.match(definition.strip())
+    if not match or _TABLE_CONSTRAINT_RE.match(definition.strip()):
+        return None
+    rest = match.group('rest')
+    default = _DEFAULT_RE.search(rest)
+    references = _REFERENCES_RE.search(rest)
+    return Column(
+        match.group('name').lower(),
+        _column_kind(match.group('type')),
+        default=default.group(1) if default else None,
+        references=references.group(1).lower() if references else None,
+        unique=bool(re.search(r'\bUNIQUE\b', rest, re.I)),
+        primary=bool(re.search(r'\bPRIMARY\s+KEY\b', rest, re.I)),
+    )
+
+
+def _split_top_level(text, separator=','):
+    """Split on separator outside parentheses and quotes"""
+    parts, depth, quote, current = [], 0, None, []
+    for char in text:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append(''.join(current))
+    return [part for part in parts if part.strip()]
+
+
+def _strip_sql_comments(sql):
+    return re.sub(r'--[^\n]*', '', sql)
+
+
+def _matching_paren(text, start):
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == '(':
+            depth += 1
+        elif text[index] == ')':
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(text)
+
+
+def load_schema(paths):
+    """Tables, indexes and trigger behaviour declared by the given SQL files"""
+    tables, indexes = {}, []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            sql = _strip_sql_comments(f.read())
+
+        events = []
+        for match in re.finditer(r'DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?"?(\w+)"?', sql, re.I):
+            events.append((match.start(), 'drop', match))
+        for match in re.finditer(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"?(\w+)"?\s*\(', sql, re.I):
+            events.append((match.start(), 'create', match))
+        for match in re.finditer(r'ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?"?(\w+)"?\s+(ADD\s+COLUMN\b[^;]*)', sql, re.I):
+            events.append((match.start(), 'alter', match))
+        for match in re.finditer(r'CREATE\s+(UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?"?(\w+)"?\s+ON\s+"?(\w+)"?\s*\(([^)]*)\)', sql, re.I):
+            events.append((match.start(), 'index', match))
+        for match in re.finditer(r'CREATE\s+TRIGGER\s+\w+\s+(?:BEFORE|AFTER)\s+(\w+)\s+ON\s+"?(\w+)"?.*?EXECUTE\s+(?:FUNCTION|PROCEDURE)\s+(\w+)', sql, re.I | re.S):
+            events.append((match.start(), 'trigger', match))
+
+        for _, kind, match in sorted(events, key=lambda event: event[0]):
+            if kind == 'drop':
+                tables.pop(match.group(1).lower(), None)
+            elif kind == 'create':
+                name = match.group(1).lower()
+                if name in tables and 'IF NOT EXISTS' in match.group(0).upper():
+                    continue
+                body = sql[match.end():_matching_paren(sql, match.end() - 1)]
+                table = Table(name)
+                for definition in _split_top_level(body):
+                    column = _parse_column(definition)
+                    if column:
+                        table.columns[column.name] = column
+                tables[name] = table
+            elif kind == 'alter':
+                name = match.group(1).lower()
+                table = tables.get(name) or tables.setdefault(name, Table.implicit(name))
+                for clause in re.split(r',\s*(?=ADD\s+COLUMN)', match.group(2), flags=re.I):
+                    clause = re.sub(r'^ADD\s+COLUMN\s+(IF\s+NOT\s+EXISTS\s+)?', '', clause.strip(), flags=re.I)
+                    column = _parse_column(clause)
+                    if column:
+                        table.columns.setdefault(column.name, column)
+            elif kind == 'index':
+                indexes.append((match.group(2).lower(), match.group(3).lower(),
+                                [c.strip().split()[0].strip('"').lower() for c in match.group(4).split(',')],
+                                bool(match.group(1))))
+            elif kind == 'trigger':
+                table = tables.get(match.group(2).lower())
+                function = match.group(3).lower()
+                if table is None:
+                    continue
+                if function in TOUCH_UPDATED_AT_FUNCTIONS and match.group(1).upper() == 'UPDATE':
+                    table.touch_updated_at = True
+                if function in TOMBSTONE_FUNCTIONS and match.group(1).upper() == 'DELETE':
+                    table.tombstone = True
+
+    for table in tables.values():
+        if 'id' in table.columns and not any(c.primary for c in table.columns.values()):
+            table.columns['id'].primary = True
+    return tables, indexes
+
+
+def declared_functions(paths):
+    """Names of the functions created by the given SQL files"""
+    names = set()
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            sql = _strip_sql_comments(f.read())
+        names.update(match.group(1).lower() for match in
+                     re.finditer(r'CREATE\s+(?:OR\s+REPLACE\s+)?FUNCTION\s+"?(\w+)"?\s*\(', sql, re.I))
+    return names
+
+
+# ============================================
+# VALUES
+# ============================================
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _default_value(column):
+    expression = column.default
+    if expression is None:
+        return None
+    lowered = expression.lower()
+    if lowered.startswith(('gen_random_uuid', 'uuid_generate_v4')):
+        return str(uuid.uuid4())
+    if lowered.startswith(('now', 'current_timestamp')):
+        return _now()
+    if lowered.startswith('current_date'):
+        return date.today().isoformat()
+    if lowered in ('true', 'false'):
+        return 1 if lowered == 'true' else 0
+    if lowered == 'null':
+        return None
+    if expression.startswith("'"):
+        text = expression.split('::')[0][1:-1].replace("''", "'")
+        return _to_storage(column, text)
+    try:
+        return int(expression)
+    except ValueError:
+        try:
+            return float(expression)
+        except ValueError:
+            return None
+
+
+def _to_storage(column, value):
+    """Normalise a JSON value the way Postgres would store it"""
+    if value is None:
+        return None
+    kind = column.kind
+    if kind == 'json':
+        return json.dumps(value)
+    if kind == 'boolean':
+        if isinstance(value, str):
+            return 1 if value.lower() in ('true', 't', '1') else 0
+        return 1 if value else 0
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if kind == 'time' and isinstance(value, str) and re.match(r'^\d{2}:\d{2}$', value):
+        return value + ':00'
+    if kind == 'date' and isinstance(value, str) and len(value) > 10 and value[4] == '-':
+        return value[:10]
+    if kind == 'timestamp' and isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return value
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.isoformat()
+    if kind in ('integer', 'serial', 'numeric') and isinstance(value, str):
+        try:
+            return int(value) if kind != 'numeric' else float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _from_storage(column, value):
+    if value is None or column is None:
+        return value
+    if column.kind == 'boolean':
+        return bool(value)
+    if column.kind == 'json' and isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _infer_kind(value):
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'numeric'
+    if isinstance(value, (dict, list)):
+        return 'json'
+    return 'text'
+
+
+def _filter_value(column, text):
+    """Coerce a filter operand from the query string to the column's storage type"""
+    if column is not None and column.kind == 'boolean':
+        return 1 if text.lower() in ('true', 't', '1') else 0
+    return text
+
+
+def _split_in_list(text):
+    """'(a,"b,c",d)' -> ['a', 'b,c', 'd']"""
+    inner = text.strip()
+    if inner.startswith('(') and inner.endswith(')'):
+        inner = inner[1:-1]
+    values = []
+    for part in _split_top_level(inner):
+        part = part.strip()
+        if len(part) >= 2 and part[0] == part[-1] == '"':
+            part = part[1:-1]
+        values.append(part)
+    return values
+
+
+# ============================================
+# SELECT PARSING
+# ============================================
+
+class Embed:
+    def __init__(self, alias, table, hint, inner, select):
+        self.alias = alias
+        self.table = table
+        self.hint = hint
+        self.inner = inner
+        self.select = select
+
+
+def parse_select(text):
+    """'*, clients(first_name), p:priests!priest_id(*)' -> (columns, embeds)
+
+    columns is a list of (output name, column name) or ('*', '*').
+    """
+    columns, embeds = [], []
+    for item in _split_top_level(text or '*'):
+        item = item.strip()
+        if not item:
+            continue
+        if '(' in item and item.endswith(')'):
+            head, body = item[:item.index('(')], item[item.index('(') + 1:-1]
+            alias = None
+            if ':' in head:
+                alias, head = head.split(':', 1)
+            parts = head.split('!')
+            table = parts[0].strip()
+            flags = [p.strip() for p in parts[1:]]
+            inner = 'inner' in flags
+            hint = next((flag for flag in flags if flag not in ('inner', 'left')), None)
+            embeds.append(Embed(alias or table, table.lower(), hint, inner, parse_select(body)))
+            continue
+        name = item.split('::')[0]
+        alias = name
+        if ':' in name:
+            alias, name = name.split(':', 1)
+        columns.append((alias.strip(), name.strip().strip('"').lower()))
+    return columns, embeds
+
+
+# ============================================
+# RPC FUNCTIONS
+# ============================================
+# Python versions of the database functions in the SQL files, registered as
+# RPCs when a schema file declares them. Each runs under the stand-in's lock
+# and is rolled back as a whole if it raises, like a PostgREST RPC call.
+
+def book_reservation(stand_in, p_client, p_reservation, p_payment=None, p_priest_id=None, p_created_by=None):
+    """add_book_reservation_rpc.sql"""
+    priest = None
+    if p_priest_id:
+        priest = next(iter(stand_in.select_rows('priests', 'id', p_priest_id)), None)
+
+    users = [{'id': p_created_by}] if p_created_by else stand_in.select_rows('users', order='created_at', limit=1)
+    if users:
+        created_by = users[0]['id']
+    else:
+        created_by = stand_in.insert_row('users', {'username': 'system', 'email': 'system@churchease.com',
+                                                   'password_hash': 'system_hash', 'role': 'secretary'})['id']
+
+    client = None
+    if p_client.get('client_key') is not None:
+        client = next(iter(stand_in.select_rows('clients', 'client_key', p_client['client_key'])), None)
+    if client is None:
+        client = stand_in.insert_row('clients', p_client)
+    else:
+        client = stand_in.update_row('clients', client['id'],
+                                     {name: value for name, value in p_client.items()
+                                      if value not in (None, '') and client.get(name) in (None, '')})
+    reservation = stand_in.insert_row('reservations', {
+        **p_reservation,
+        'client_id': client['id'],
+        'created_by': created_by,
+        'priest_id': priest['id'] if priest else None,
+        'status': 'waiting_priest_approval' if priest else 'pending',
+    })
+
+    payment = payment_error = None
+    if p_payment is not None:
+        stand_in._db.execute('SAVEPOINT book_reservation_payment')
+        try:
+            payment = stand_in.insert_row('payments', {**p_payment, 'reservation_id': reservation['id']})
+            stand_in._db.execute('RELEASE book_reservation_payment')
+        except sqlite3.DatabaseError as error:
+            stand_in._db.execute('ROLLBACK TO book_reservation_payment')
+            payment_error = str(error)
+
+    return [{'client': client, 'reservation': reservation, 'payment': payment,
+             'payment_error': payment_error, 'priest': priest}]
+
+
+def merge_clients(stand_in, p_groups):
+    """add_client_dedup.sql"""
+    merged = 0
+    for group in p_groups:
+        keep = group['keep']
+        duplicate_ids = [client_id for client_id in group.get('duplicate_ids') or [] if client_id != keep['id']]
+        if duplicate_ids:
+            marks = ', '.join('?' for _ in duplicate_ids)
+            stand_in._db.execute(f'UPDATE "reservations" SET "client_id" = ? WHERE "client_id" IN ({marks})',
+                                 [keep['id'], *duplicate_ids])
+            stand_in._db.execute(f'DELETE FROM "clients" WHERE "id" IN ({marks})', duplicate_ids)
+            merged += len(duplicate_ids)
+        changes = {name: keep.get(name) for name in ('email', 'address', 'client_key')}
+        changes.update((name, keep[name]) for name in ('first_name', 'last_name', 'phone')
+                       if keep.get(name) is not None)
+        stand_in.update_row('clients', keep['id'], changes)
+    return merged
+
+
+def stipendium_totals(stand_in, p_start_date=None, p_end_date=None, p_service_type=None,
+                      p_payment_status=None, p_payment_method=None):
+    """add_stipendium_ledger.sql"""
+    totals = {'payments': 0, 'amount_due': 0.0, 'amount_paid': 0.0, 'outstanding': 0.0}
+    for payment in stand_in.select_rows('payments'):
+        day = str(payment.get('created_at') or '')[:10]
+        if ((p_start_date and day < p_start_date) or (p_end_date and day > p_end_date)
+                or (p_service_type is not None and payment.get('service_type') not in p_service_type)
+                or (p_payment_status is not None and payment.get('payment_status') not in p_payment_status)
+                or (p_payment_method is not None and payment.get('payment_method') not in p_payment_method)):
+            continue
+        due, paid = float(payment.get('amount_due') or 0), float(payment.get('amount_paid') or 0)
+        totals['payments'] += 1
+        totals['amount_due'] += due
+        totals['amount_paid'] += paid
+        totals['outstanding'] += max(due - paid, 0)
+    return [totals]
+
+
+RPC_FUNCTIONS = {
+    'book_reservation': book_reservation,
+    'merge_clients': merge_clients,
+    'stipendium_totals': stipendium_totals,
+}
+
+
+# ============================================
+# STAND-IN
+# ============================================
+
+class LocalSupabase:
+    """PostgREST-compatible WSGI app over SQLite"""
+
+    def __init__(self, database=':memory:', latency_ms=0, jitter_ms=0, schema_files=None, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.calls = Counter()
+        self.rpcs = {}
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._server = None
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.execute('PRAGMA case_sensitive_like = ON')
+        self._db.execute('PRAGMA journal_mode = WAL' if database != ':memory:' else 'PRAGMA journal_mode = MEMORY')
+
+        paths = [os.path.join(BASE_DIR, name) for name in (schema_files or SCHEMA_FILES)]
+        paths = [path for path in paths if os.path.exists(path)]
+        self.tables, indexes = load_schema(paths)
+        self._create_tables(indexes)
+        for name in declared_functions(paths) & set(RPC_FUNCTIONS):
+            self.register_rpc(name, RPC_FUNCTIONS[name])
+
+    # ---- setup
+
+    def _existing_columns(self, table_name):
+        return [row[1] for row in self._db.execute(f'PRAGMA table_info("{table_name}")')]
+
+    def _create_tables(self, indexes):
+        with self._lock:
+            for table in self.tables.values():
+                existing = self._existing_columns(table.name)
+                if not existing:
+                    ddl = ', '.join(column.ddl() for column in table.columns.values()) or '"id" TEXT PRIMARY KEY'
+                    self._db.execute(f'CREATE TABLE "{table.name}" ({ddl})')
+                else:
+                    # Reopened database file: pick up columns added since
+                    for column in table.columns.values():
+                        if column.name not in existing:
+                            self._db.execute(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.affinity}')
+                    for name in existing:
+                        table.columns.setdefault(name, Column(name, 'text'))
+            for name, table_name, columns, unique in indexes:
+                if table_name not in self.tables:
+                    continue
+                columns = [c for c in columns if c in self.tables[table_name].columns]
+                if not columns:
+                    continue
+                quoted = ', '.join(f'"{c}"' for c in columns)
+                try:
+                    self._db.execute(f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS "{name}" '
+                                     f'ON "{table_name}" ({quoted})')
+                except sqlite3.DatabaseError:
+                    pass
+            # Tables written before the schema knew about them (e.g. payments)
+            known = set(self.tables)
+            for (name,) in self._db.execute("SELECT name FROM sqlite_master WHERE type = 'table' "
+                                            "AND name NOT LIKE 'sqlite_%'").fetchall():
+                if name not in known:
+                    table = Table(name)
+                    for column_name in self._existing_columns(name):
+                        table.columns[column_name] = Column(column_name, 'text', primary=column_name == 'id')
+                    self.tables[name] = table
+            self._db.commit()
+
+    def _ensure_table(self, name):
+        table = self.tables.get(name)
+        if table is None:
+            table = Table.implicit(name)
+            self._db.execute(f'CREATE TABLE "{name}" ({", ".join(c.ddl() for c in table.columns.values())})')
+            self.tables[name] = table
+        return table
+
+    def _ensure_columns(self, table, rows):
+        for row in rows:
+            for name, value in row.items():
+                if name not in table.columns:
+                    column = Column(name, _infer_kind(value) if value is not None else 'text')
+                    self._db.execute(f'ALTER TABLE "{table.name}" ADD COLUMN "{name}" {column.affinity}')
+                    table.columns[name] = column
+
+    # ---- running
+
+    def start(self, host='127.0.0.1', port=0):
+        """Serve on a background thread; returns the URL to use as SUPABASE_URL"""
+        self._server = make_server(host, port, self)
+        thread = threading.Thread(target=self._server.serve_forever, name='local-supabase', daemon=True)
+        thread.start()
+        return f'http://{host}:{self._server.server_address[1]}'
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset_calls(self):
+        self.calls.clear()
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def register_rpc(self, name, function):
+        """Answer POST /rest/v1/rpc/<name> with function(stand_in, **params)"""
+        self.rpcs[name] = function
+
+    def bulk_insert(self, table_name, rows):
+        """Load rows directly, without HTTP or latency (for data generators)"""
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._lock:
+            table = self._ensure_table(table_name)
+            self._ensure_columns(table, rows)
+            prepared = [self._prepare_insert(table, row) for row in rows]
+            names = sorted({name for row in prepared for name in row})
+            quoted = ', '.join(f'"{name}"' for name in names)
+            placeholders = ', '.join('?' for _ in names)
+            self._db.executemany(f'INSERT INTO "{table_name}" ({quoted}) VALUES ({placeholders})',
+                                 [[row.get(name) for name in names] for row in prepared])
+            self._db.commit()
+        return len(prepared)
+
+    def insert_row(self, table_name, row):
+        """Insert one row inside the current transaction (for RPC functions); returns it as stored"""
+        table = self._ensure_table(table_name)
+        self._ensure_columns(table, [row])
+        prepared = self._prepare_insert(table, row)
+        quoted = ', '.join(f'"{name}"' for name in prepared)
+        cursor = self._db.execute(f'INSERT INTO "{table_name}" ({quoted}) '
+                                  f'VALUES ({", ".join("?" for _ in prepared)}) RETURNING *', list(prepared.values()))
+        return self._rows(table, cursor)[0]
+
+    def update_row(self, table_name, row_id, values):
+        """Update one row by primary key inside the current transaction (for RPC functions); returns it"""
+        table = self.tables[table_name]
+        self._ensure_columns(table, [values])
+        stored = {name: _to_storage(table.columns[name], value) for name, value in values.items()}
+        if not stored:
+            return next(iter(self.select_rows(table_name, table.primary_key, row_id)), None)
+        assignments = ', '.join(f'"{name}" = ?' for name in stored)
+        key = table.primary_key
+        cursor = self._db.execute(f'UPDATE "{table_name}" SET {assignments} WHERE "{key}" = ? RETURNING *',
+                                  list(stored.values()) + [_to_storage(table.columns[key], row_id)])
+        return self._rows(table, cursor)[0]
+
+    def select_rows(self, table_name, column=None, value=None, order=None, limit=None):
+        """Rows where column = value (for RPC functions)"""
+        table = self.tables.get(table_name)
+        if table is None or (column is not None and column not in table.columns):
+            return []
+        sql, values = f'SELECT * FROM "{table_name}"', []
+        if column is not None:
+            sql += f' WHERE "{column}" = ?'
+            values.append(_to_storage(table.columns[column], value))
+        if order is not None and order in table.columns:
+            sql += f' ORDER BY "{order}"'
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        return self._rows(table, self._db.execute(sql, values))
+
+    def count(self, table_name):
+        with self._lock:
+            if table_name not in self.tables:
+                return 0
+            return self._db.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+
+    # ---- WSGI
+
+    def __call__(self, environ, start_response):
+        request = Request(environ)
+        try:
+            response = self.handle(request)
+        except PostgrestError as error:
+            response = Response(json.dumps(error.body), status=error.status, mimetype='application/json')
+        return response(environ, start_response)
+
+    def handle(self, request):
+        if not request.path.startswith(REST_PREFIX):
+            raise PostgrestError(404, 'PGRST000', f'{request.path} is not served by local_supabase')
+        resource = request.path[len(REST_PREFIX):].strip('/')
+
+        delay = self.latency_ms + (self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay:
+            sleep(delay / 1000.0)
+
+        if resource.startswith('rpc/'):
+            self.calls[('RPC', resource[4:])] += 1
+            return self._rpc(resource[4:], request)
+
+        self.calls[(request.method, resource)] += 1
+        if not resource and request.method == 'GET':
+            return self._openapi()
+        prefer = request.headers.get('Prefer', '')
+        with self._lock:
+            if request.method in ('GET', 'HEAD'):
+                return self._read(resource, request, prefer)
+            if request.method == 'POST':
+                return self._insert(resource, request, prefer)
+            if request.method == 'PATCH':
+                return self._update(resource, request, prefer)
+            if request.method == 'DELETE':
+                return self._delete(resource, request, prefer)
+        raise PostgrestError(405, 'PGRST000', f'{request.method} is not supported')
+
+    def _openapi(self):
+        """GET /rest/v1/: PostgREST's OpenAPI description, reduced to tables, columns and functions"""
+        with self._lock:
+            definitions = {table.name: {'type': 'object',
+                                        'properties': {column.name: {'format': column.kind}
+                                                       for column in table.columns.values()}}
+                           for table in self.tables.values()}
+            paths = {'/': {}, **{f'/{name}': {} for name in definitions}, **{f'/rpc/{name}': {} for name in self.rpcs}}
+        return Response(json.dumps({'swagger': '2.0', 'definitions': definitions, 'paths': paths}),
+                        mimetype='application/openapi+json')
+
+    def _rpc(self, name, request):
+        function = self.rpcs.get(name)
+        if function is None:
+            raise PostgrestError(404, 'PGRST202', f'Could not find the function public.{name} in the schema cache')
+        params = request.get_json(silent=True) or {}
+        with self._lock:
+            try:
+                result = function(self, **params)
+            except sqlite3.IntegrityError as error:
+                self._db.rollback()
+                raise PostgrestError(409, '23505', str(error))
+            except (sqlite3.DatabaseError, KeyError, TypeError) as error:
+                self._db.rollback()
+                raise PostgrestError(400, 'P0001', str(error))
+            self._db.commit()
+        return Response(json.dumps(result), mimetype='application/json')
+
+    # ---- filters
+
+    def _where(self, table, args):
+        clauses, values = [], []
+        for key, raw in args.items(multi=True):
+            if key in RESERVED_PARAMS:
+                continue
+            if key in ('or', 'and', 'not.or', 'not.and'):
+                clause, clause_values = self._logic(table, key, raw)
+            elif '.' in key:
+                raise PostgrestError(400, 'PGRST100', f'Filter "{key}" is not supported by local_supabase')
+            else:
+                clause, clause_values = self._condition(table, key, raw)
+            clauses.append(clause)
+            values.extend(clause_values)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', values
+
+    def _logic(self, table, operator, text):
+        """or=(a.eq.1,and(b.gt.2,c.is.null)) -> one parenthesised clause"""
+        negate = operator.startswith('not.')
+        operator = operator[4:] if negate else operator
+        inner = text.strip()
+        if not (inner.startswith('(') and inner.endswith(')')):
+            raise PostgrestError(400, 'PGRST100', f'"{operator}" needs a parenthesised list')
+        clauses, values = [], []
+        for part in _split_top_level(inner[1:-1]):
+            part = part.strip()
+            head, _, rest = part.partition('(')
+            if head in ('or', 'and', 'not.or', 'not.and'):
+                clause, clause_values = self._logic(table, head, '(' + rest)
+            else:
+                column_name, _, raw = part.partition('.')
+                clause, clause_values = self._condition(table, column_name, raw, quoted=True)
+            clauses.append(clause)
+            values.extend(clause_values)
+        clause = '(' + f' {operator.upper()} '.join(clauses) + ')'
+        return (f'NOT {clause}' if negate else clause), values
+
+    def _condition(self, table, key, raw, quoted=False):
+        """column=operator.operand -> (SQL clause, values)"""
+        column_name = key.strip('"').lower()
+        column = table.columns.get(column_name) if table else None
+        sql_column = f'"{column_name}"' if column is not None else 'NULL'
+
+        negate = raw.startswith('not.')
+        if negate:
+            raw = raw[4:]
+        operator, _, operand = raw.partition('.')
+        if quoted and operator != 'in' and len(operand) >= 2 and operand[0] == operand[-1] == '"':
+            operand = operand[1:-1]
+
+        values = []
+        if operator in FILTER_OPERATORS:
+            clause = f'{sql_column} {FILTER_OPERATORS[operator]} ?'
+            values.append(_filter_value(column, operand))
+        elif operator in ('like', 'ilike'):
+            pattern = operand.replace('*', '%')
+            if operator == 'ilike':
+                clause = f'lower({sql_column}) LIKE lower(?)'
+            else:
+                clause = f'{sql_column} LIKE ?'
+            values.append(pattern)
+        elif operator == 'is':
+            keyword = operand.lower()
+            if keyword == 'null':
+                clause = f'{sql_column} IS NULL'
+            elif keyword in ('true', 'false'):
+                clause = f'{sql_column} = {1 if keyword == "true" else 0}'
+            else:
+                raise PostgrestError(400, 'PGRST100', f'Invalid is. operand "{operand}"')
+        elif operator == 'in':
+            items = [_filter_value(column, item) for item in _split_in_list(operand)]
+            if not items:
+                clause = '0'
+            else:
+                clause = f'{sql_column} IN ({", ".join("?" for _ in items)})'
+                values.extend(items)
+        else:
+            raise PostgrestError(400, 'PGRST100', f'Operator "{operator}" is not supported by local_supabase')
+        return (f'NOT ({clause})' if negate else clause), values
+
+    def _order_by(self, table, text):
+        if not text:
+            return ''
+        terms = []
+        for term in text.split(','):
+            parts = term.strip().split('.')
+            name = parts[0].strip('"').lower()
+            if name not in table.columns:
+                continue
+            descending = 'desc' in parts[1:]
+            nulls_first = 'nullsfirst' in parts[1:] or (descending and 'nullslast' not in parts[1:])
+            # Postgres puts NULLs last for ASC and first for DESC unless told otherwise
+            terms.append(f'("{name}" IS NULL) {"DESC" if nulls_first else "ASC"}')
+            terms.append(f'"{name}" {"DESC" if descending else "ASC"}')
+        return (' ORDER BY ' + ', '.join(terms)) if terms else ''
+
+    # ---- reading
+
+    def _rows(self, table, cursor):
+        names = [description[0] for description in cursor.description]
+        columns = [table.columns.get(name) for name in names]
+        return [{name: _from_storage(column, value) for name, column, value in zip(names, columns, row)}
+                for row in cursor.fetchall()]
+
+    def _read(self, resource, request, prefer):
+        table = self.tables.get(resource)
+        args = request.args
+        offset = int(args.get('offset', 0))
+        limit = args.get('limit')
+        range_header = request.headers.get('Range')
+        if range_header and '-' in range_header:
+            start, _, end = range_header.partition('-')
+            offset = int(start)
+            limit = int(end) - offset + 1 if end else None
+
+        if table is None:
+            rows, total = [], 0
+        else:
+            where, values = self._where(table, args)
+            sql = f'SELECT * FROM "{table.name}"{where}{self._order_by(table, args.get("order"))}'
+            sql_values = list(values)
+            if limit is not None or offset:
+                sql += ' LIMIT ? OFFSET ?'
+                sql_values += [int(limit) if limit is not None else -1, offset]
+            rows = self._rows(table, self._db.execute(sql, sql_values))
+            total = None
+            if 'count=' in prefer:
+                total = self._db.execute(f'SELECT COUNT(*) FROM "{table.name}"{where}', values).fetchone()[0]
+
+        columns, embeds = parse_select(args.get('select', '*') if request.method == 'GET' else '*')
+        if table is not None:
+            rows = self._shape(table, rows, columns, embeds)
+
+        headers = {'Content-Range': self._content_range(offset, len(rows), total if 'count=' in prefer else None)}
+        if request.method == 'HEAD':
+            return Response(status=200, headers=headers)
+        return self._json_response(request, rows, headers)
+
+    @staticmethod
+    def _content_range(offset, returned, total):
+        span = f'{offset}-{offset + returned - 1}' if returned else '*'
+        return f'{span}/{total if total is not None else "*"}'
+
+    @staticmethod
+    def _json_response(request, rows, headers, status=200):
+        if 'vnd.pgrst.object' in request.headers.get('Accept', ''):
+            if len(rows) != 1:
+                raise PostgrestError(406, 'PGRST116', 'JSON object requested, multiple (or no) rows returned',
+                                     details=f'The result contains {len(rows)} rows')
+            return Response(json.dumps(rows[0]), status=status, headers=headers, mimetype='application/json')
+        return Response(json.dumps(rows), status=status, headers=headers, mimetype='application/json')
+
+    def _relationship(self, parent, embed):
+        """(local column, remote column, many) linking parent rows to the embedded table"""
+        child = self.tables.get(embed.table)
+        if child is None:
+            return None
+        hint = embed.hint.lower() if embed.hint else None
+
+        def singular(name):
+            return name[:-1] if name.endswith('s') else name
+
+        # Many-to-one: parent.<fk> -> child.id
+        for column in parent.columns.values():
+            if hint and column.name != hint and not hint.endswith(f'_{column.name}_fkey'):
+                continue
+            if column.references == child.name or (column.references is None
+                                                    and column.name == f'{singular(child.name)}_id'):
+                return column.name, child.primary_key, False
+        # One-to-many: child.<fk> -> parent.id
+        for column in child.columns.values():
+            if hint and column.name != hint and not hint.endswith(f'_{column.name}_fkey'):
+                continue
+            if column.references == parent.name or (column.references is None
+                                                     and column.name == f'{singular(parent.name)}_id'):
+                return parent.primary_key, column.name, True
+        return None
+
+    def _shape(self, table, rows, columns, embeds):
+        """Project rows to the selected columns and attach embedded resources"""
+        for embed in embeds:
+            relationship = self._relationship(table, embed)
+            if relationship is None:
+                raise PostgrestError(400, 'PGRST200',
+                                     f"Could not find a relationship between '{table.name}' and '{embed.table}'")
+            local, remote, many = relationship
+            child = self.tables[embed.table]
+            keys = sorted({row.get(local) for row in rows if row.get(local) is not None}, key=str)
+            related = {}
+            for start in range(0, len(keys), SQLITE_CHUNK):
+                chunk = keys[start:start + SQLITE_CHUNK]
+                cursor = self._db.execute(
+                    f'SELECT * FROM "{child.name}" WHERE "{remote}" IN ({", ".join("?" for _ in chunk)})', chunk)
+                child_rows = self._rows(child, cursor)
+                shaped = self._shape(child, child_rows, *embed.select)
+                for raw, shaped_row in zip(child_rows, shaped):
+                    related.setdefault(raw.get(remote), []).append(shaped_row)
+            for row in rows:
+                matches = related.get(row.get(local), [])
+                row['\0' + embed.alias] = matches if many else (matches[0] if matches else None)
+
+        if any(embed.inner for embed in embeds):
+            rows = [row for row in rows
+                    if all(row['\0' + embed.alias] for embed in embeds if embed.inner)]
+
+        shaped = []
+        for row in rows:
+            out = {}
+            for alias, name in columns:
+                if name == '*':
+                    out.update({key: value for key, value in row.items() if not key.startswith('\0')})
+                else:
+                    out[alias] = row.get(name)
+            for embed in embeds:
+                out[embed.alias] = row['\0' + embed.alias]
+            shaped.append(out)
+        return shaped
+
+    # ---- writing
+
+    def _prepare_insert(self, table, row):
+        prepared = {}
+        for column in table.columns.values():
+            if column.name in row:
+                prepared[column.name] = _to_storage(column, row[column.name])
+            elif column.default is not None:
+                prepared[column.name] = _default_value(column)
+        return prepared
+
+    def _returning(self, request, prefer, table, rows, status):
+        if 'return=representation' not in prefer:
+            return Response(status=204 if status == 200 else status,
+                            headers={'Content-Range': self._content_range(0, len(rows), None)})
+        columns, embeds = parse_select(request.args.get('select', '*'))
+        shaped = self._shape(table, rows, columns, embeds)
+        headers = {'Content-Range': self._content_range(0, len(shaped), len(shaped) if 'count=' in prefer else None)}
+        return self._json_response(request, shaped, headers, status=status)
+
+    def _integrity_error(self, table, error):
+        message = str(error)
+        if 'UNIQUE' in message:
+            column = message.rsplit('.', 1)[-1]
+            return PostgrestError(409, '23505',
+                                  f'duplicate key value violates unique constraint "{table.name}_{column}_key"',
+                                  details=message)
+        return PostgrestError(400, '23502', message)
+
+    def _insert(self, resource, request, prefer):
+        payload = request.get_json(silent=True)
+        if payload is None:
+            raise PostgrestError(400, 'PGRST102', 'Empty or invalid json')
+        rows = payload if isinstance(payload, list) else [payload]
+        table = self._ensure_table(resource)
+        self._ensure_columns(table, rows)
+
+        upsert = 'resolution=' in prefer
+        conflict = [c.strip().lower() for c in request.args.get('on_conflict', table.primary_key).split(',')]
+        inserted = []
+        try:
+            for row in rows:
+                prepared = self._prepare_insert(table, row)
+                names = list(prepared)
+                quoted = ', '.join(f'"{name}"' for name in names)
+                sql = f'INSERT INTO "{table.name}" ({quoted}) VALUES ({", ".join("?" for _ in names)})'
+                if upsert:
+                    target = ', '.join(f'"{c}"' for c in conflict)
+                    if 'resolution=ignore-duplicates' in prefer:
+                        sql += f' ON CONFLICT ({target}) DO NOTHING'
+                    else:
+                        updates = [name for name in row if name not in conflict]
+                        assignments = ', '.join(f'"{name}" = excluded."{name}"' for name in updates)
+                        sql += f' ON CONFLICT ({target}) DO ' + (f'UPDATE SET {assignments}' if assignments else 'NOTHING')
+                cursor = self._db.execute(sql + ' RETURNING *', [prepared[name] for name in names])
+                inserted.extend(self._rows(table, cursor))
+        except sqlite3.IntegrityError as error:
+            self._db.rollback()
+            raise self._integrity_error(table, error)
+        except sqlite3.OperationalError as error:
+            self._db.rollback()
+            raise PostgrestError(400, '42P10', str(error))
+        self._db.commit()
+        return self._returning(request, prefer, table, inserted, 201)
+
+    def _update(self, resource, request, prefer):
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            raise PostgrestError(400, 'PGRST102', 'Empty or invalid json')
+        table = self.tables.get(resource)
+        if table is None:
+            return self._returning(request, prefer, self._ensure_table(resource), [], 200)
+        self._ensure_columns(table, [payload])
+        values = {name: _to_storage(table.columns[name], value) for name, value in payload.items()}
+        if table.touch_updated_at and 'updated_at' in table.columns and 'updated_at' not in payload:
+            values['updated_at'] = _now()
+        if not values:
+            return self._returning(request, prefer, table, [], 200)
+
+        where, where_values = self._where(table, request.args)
+        assignments = ', '.join(f'"{name}" = ?' for name in values)
+        try:
+            cursor = self._db.execute(f'UPDATE "{table.name}" SET {assignments}{where} RETURNING *',
+                                      list(values.values()) + where_values)
+            updated = self._rows(table, cursor)
+        except sqlite3.IntegrityError as error:
+            self._db.rollback()
+            raise self._integrity_error(table, error)
+        self._db.commit()
+        return self._returning(request, prefer, table, updated, 200)
+
+    def _delete(self, resource, request, prefer):
+        table = self.tables.get(resource)
+        if table is None:
+            return self._returning(request, prefer, self._ensure_table(resource), [], 200)
+        where, values = self._where(table, request.args)
+        cursor = self._db.execute(f'DELETE FROM "{table.name}"{where} RETURNING *', values)
+        deleted = self._rows(table, cursor)
+        tombstones = self.tables.get('sync_tombstones')
+        if table.tombstone and tombstones is not None and deleted:
+            self._db.executemany(
+                'INSERT INTO sync_tombstones (table_name, record_id, deleted_at) VALUES (?, ?, ?)',
+                [(table.name, str(row.get(table.primary_key)), _now()) for row in deleted])
+        self._db.commit()
+        return self._returning(request, prefer, table, deleted, 200)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a local stand-in for the Supabase REST API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=54321)
+    parser.add_argument('--database', default=':memory:', help='SQLite file (default: in memory)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='added to every request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='random extra latency, 0..N ms')
+    args = parser.parse_args()
+
+    stand_in = LocalSupabase(args.database, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    server = make_server(args.host, args.port, stand_in)
+    print(f"🗄️ Local Supabase on http://{args.host}:{args.port} "
+          f"({len(stand_in.tables)} tables, {args.latency_ms:g} ms latency, database {args.database})")
+    print(f"   SUPABASE_URL=http://{args.host}:{args.port} python app.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+if __name__ == '__main__':
+    main()
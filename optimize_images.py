@@ -0,0 +1,99 @@
+"""Build resized WebP/AVIF variants of the site images.
+
+    pip install Pillow        # build-time only, not needed by the app
+    python optimize_images.py
+
+Writes static/img/<name>-<width>.<format> for every entry in IMAGES plus
+static/img/manifest.json, which the responsive_image() template helper in
+app.py reads to build <picture> srcsets. Commit the output; re-run only when
+a source image changes.
+"""
+import json
+import os
+import sys
+
+try:
+    from PIL import Image, features
+except ImportError:
+    print("❌ Pillow is required: pip install Pillow")
+    sys.exit(1)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(BASE_DIR, 'static', 'img')
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, 'manifest.json')
+
+# Source file under static/ -> output name and the widths it is displayed at
+# (1x and 2x). The logo shows at 32-50px in the dashboards and print headers
+# and up to ~300px on the login page.
+IMAGES = {
+    'ChurchLogo.jpg': {  # actually a transparent PNG
+        'name': 'ChurchLogo',
+        'widths': [64, 128, 256, 500],
+    },
+}
+
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+
+def fallback_format(image):
+    """PNG keeps transparency; everything else falls back to JPEG"""
+    return 'png' if image.mode in ('RGBA', 'LA', 'P') else 'jpg'
+
+def save_variant(image, path, image_format):
+    if image_format == 'webp':
+        image.save(path, 'WEBP', quality=WEBP_QUALITY, method=6)
+    elif image_format == 'avif':
+        image.save(path, 'AVIF', quality=AVIF_QUALITY)
+    elif image_format == 'png':
+        image.save(path, 'PNG', optimize=True)
+    else:
+        image.convert('RGB').save(path, 'JPEG', quality=82, optimize=True, progressive=True)
+
+def build_image(source_file, config, formats):
+    name = config['name']
+    source_path = os.path.join(BASE_DIR, 'static', source_file)
+    with Image.open(source_path) as source:
+        source.load()
+        fallback = fallback_format(source)
+        widths = sorted({min(width, source.width) for width in config['widths']})
+
+        for width in widths:
+            height = round(source.height * width / source.width)
+            resized = source.resize((width, height), Image.LANCZOS) if width != source.width else source
+            for image_format in formats + [fallback]:
+                path = os.path.join(OUTPUT_DIR, f"{name}-{width}.{image_format}")
+                save_variant(resized, path, image_format)
+
+        original_size = os.path.getsize(source_path)
+        largest = os.path.getsize(os.path.join(OUTPUT_DIR, f"{name}-{widths[-1]}.{formats[0]}"))
+        print(f"✅ {name}: {len(widths)} widths x {len(formats) + 1} formats "
+              f"({original_size:,} bytes -> {largest:,} bytes at {widths[-1]}px {formats[0]})")
+
+        return {
+            'name': name,
+            'widths': widths,
+            'formats': formats,
+            'fallback': fallback,
+            'aspect_ratio': round(source.width / source.height, 4)
+        }
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Best first: <source> elements are tried in order
+    formats = []
+    if features.check('avif'):
+        formats.append('avif')
+    else:
+        print("⚠️ This Pillow build has no AVIF support - only WebP variants will be written")
+    formats.append('webp')
+
+    manifest = {source_file: build_image(source_file, config, formats)
+                for source_file, config in IMAGES.items()}
+
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"📝 Wrote {os.path.relpath(MANIFEST_PATH, BASE_DIR)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1137 @@
+// ChurchEase Admin - Calendar
+// Loaded the first time the tab is opened, right after templates/admin/calendar.html
+// has been inserted into the page.
+
+// ============================================================================
+// ADMIN CALENDAR FUNCTIONALITY (Same as Secretary Events Calendar)
+// ============================================================================
+
+let adminCalendarInstance = null;
+let adminReservations = [];
+let adminEvents = [];
+let adminCalendarETag = null;
+
+// Initialize Admin Calendar (Same as Secretary)
+async function initializeAdminCalendar() {
+    console.log('Initializing Admin Calendar...');
+    
+    // Destroy existing calendar if it exists
+    if (adminCalendarInstance) {
+        adminCalendarInstance.destroy();
+        adminCalendarInstance = null;
+    }
+    
+    const calendarEl = document.getElementById('adminCalendar');
+    if (!calendarEl) {
+        console.error('Admin calendar element not found');
+        return;
+    }
+    
+    // Load reservations and events
+    await loadAdminCalendarData();
+    
+    // Initialize FullCalendar
+    adminCalendarInstance = new FullCalendar.Calendar(calendarEl, {
+        initialView: 'dayGridMonth',
+        headerToolbar: {
+            left: 'prev,next today',
+            center: 'title',
+            right: 'dayGridMonth,timeGridWeek,timeGridDay'
+        },
+        height: 'auto',
+        aspectRatio: 1.35,
+        dayMaxEvents: true,
+        weekends: true,
+        themeSystem: 'standard',
+        eventDisplay: 'block',
+        displayEventTime: true,
+        displayEventEnd: false,
+        events: [],
+        datesSet: async function() {
+            // Navigating to another month loads that month's feed
+            if (await loadAdminCalendarData()) {
+                refreshAdminCalendarEvents();
+            }
+        },
+        eventClick: function(info) {
+            showAdminEventDetails(info.event);
+        },
+        eventTimeFormat: {
+            hour: '2-digit',
+            minute: '2-digit',
+            meridiem: 'short'
+        }
+    });
+    
+    adminCalendarInstance.render();
+    
+    // Load events after calendar is rendered
+    setTimeout(() => {
+        refreshAdminCalendarEvents();
+    }, 200);
+    
+    // Setup refresh button
+    const refreshBtn = document.getElementById('refreshAdminCalendarBtn');
+    if (refreshBtn) {
+        refreshBtn.addEventListener('click', async () => {
+            refreshBtn.disabled = true;
+            refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i><span>Refreshing...</span>';
+            
+            await loadAdminCalendarData();
+            refreshAdminCalendarEvents();
+            
+            refreshBtn.disabled = false;
+            refreshBtn.innerHTML = '<i class="fas fa-sync-alt"></i><span>Refresh</span>';
+        });
+    }
+    
+    // Setup type filter (Events/Reservations)
+    const typeFilter = document.getElementById('adminTypeFilter');
+    if (typeFilter) {
+        typeFilter.addEventListener('change', () => {
+            refreshAdminCalendarEvents();
+        });
+    }
+    
+    // Setup service filter
+    const serviceFilter = document.getElementById('adminServiceFilter');
+    if (serviceFilter) {
+        serviceFilter.addEventListener('change', () => {
+            refreshAdminCalendarEvents();
+        });
+    }
+    
+    // Reload the month when a live update arrives; the 30-second poll
+    // only runs while the live stream is disconnected
+    const reloadAdminCalendar = async () => {
+        if (await loadAdminCalendarData()) {
+            refreshAdminCalendarEvents();
+        }
+    };
+    if (window.ChurchEaseLive) {
+        ['reservation', 'event', 'resync'].forEach(type => {
+            window.ChurchEaseLive.on(type, reloadAdminCalendar);
+        });
+    }
+    setInterval(async () => {
+        if (window.ChurchEaseLive && window.ChurchEaseLive.connected) {
+            return;
+        }
+        console.log('Admin Calendar: Auto-refreshing data...');
+        await reloadAdminCalendar();
+    }, 30000); // 30 seconds
+    
+    // Setup print button
+    const printBtn = document.getElementById('printAdminCalendarBtn');
+    if (printBtn) {
+        printBtn.addEventListener('click', printAdminCalendar);
+    }
+    
+    console.log('✅ Admin Calendar initialized with auto-refresh');
+}
+
+// Month currently shown by the admin calendar (today before it is created)
+function getAdminCalendarMonth() {
+    const current = adminCalendarInstance ? adminCalendarInstance.getDate() : new Date();
+    return { year: current.getFullYear(), month: current.getMonth() + 1 };
+}
+
+// Load reservations and events for the visible month.
+// Returns true when the data changed since the last load.
+async function loadAdminCalendarData() {
+    try {
+        const { year, month } = getAdminCalendarMonth();
+        
+        // The month feed carries an ETag with Cache-Control: no-cache, so the
+        // browser revalidates with If-None-Match and an unchanged poll is a 304
+        const response = await fetch(`/api/calendar/${year}/${month}`);
+        const result = await response.json();
+        
+        if (!result.success) {
+            console.error('Admin Calendar: Failed to load month feed:', result.error);
+            return false;
+        }
+        
+        const etag = response.headers.get('ETag');
+        if (etag && etag === adminCalendarETag) {
+            return false;
+        }
+        adminCalendarETag = etag;
+        
+        adminReservations = result.data.reservations || [];
+        adminEvents = result.data.events || [];
+        console.log(`Admin Calendar: Loaded ${year}-${month}:`, adminReservations.length, 'reservations,', adminEvents.length, 'events');
+        return true;
+    } catch (error) {
+        console.error('Admin Calendar: Error loading data:', error);
+        return false;
+    }
+}
+
+// Refresh calendar events
+function refreshAdminCalendarEvents() {
+    const events = getAdminCalendarEvents();
+    console.log('=== REFRESHING ADMIN CALENDAR ===');
+    console.log('Total events to add:', events.length);
+    console.log('Events:', events);
+    
+    if (adminCalendarInstance) {
+        // Remove all existing events
+        adminCalendarInstance.removeAllEvents();
+        console.log('✅ Cleared existing events');
+        
+        // Add each event
+        events.forEach((event, index) => {
+            try {
+                adminCalendarInstance.addEvent(event);
+                console.log(`✅ Added event ${index + 1}:`, event.title);
+            } catch (error) {
+                console.error(`❌ Failed to add event ${index + 1}:`, error);
+                console.error('Event data:', event);
+            }
+        });
+        
+        // Force re-render
+        adminCalendarInstance.render();
+        console.log('✅ Calendar rendered with', events.length, 'events');
+    } else {
+        console.error('❌ Calendar instance not found!');
+    }
+    console.log('=================================');
+}
+
+// Get calendar events (confirmed reservations + confirmed events)
+function getAdminCalendarEvents() {
+    const serviceColors = {
+        'wedding': '#FFD700',
+        'baptism': '#3B82F6',
+        'funeral': '#6B7280',
+        'confirmation': '#8B5CF6'
+    };
+    
+    // Get selected filters
+    const typeFilter = document.getElementById('adminTypeFilter');
+    const serviceFilter = document.getElementById('adminServiceFilter');
+    const selectedType = typeFilter ? typeFilter.value : 'all';
+    const selectedService = serviceFilter ? serviceFilter.value : 'all';
+    
+    // Filter APPROVED reservations (status = 'approved')
+    let confirmedReservations = adminReservations.filter(res => {
+        const status = res.status ? res.status.toLowerCase() : '';
+        return status === 'approved';
+    });
+    
+    // Apply service filter to reservations
+    if (selectedService !== 'all') {
+        confirmedReservations = confirmedReservations.filter(res => 
+            res.service_type && res.service_type.toLowerCase() === selectedService.toLowerCase()
+        );
+    }
+    
+    // Filter confirmed events (status = 'active' or 'confirmed')
+    let confirmedEvents = adminEvents.filter(event => {
+        const status = event.status ? event.status.toLowerCase() : '';
+        return status === 'active' || status === 'confirmed';
+    });
+    
+    console.log('=== ADMIN CALENDAR DEBUG ===');
+    console.log('Total reservations loaded:', adminReservations.length);
+    console.log('All reservation statuses:', adminReservations.map(r => ({id: r.id, status: r.status})));
+    console.log('Approved reservations (status=approved):', confirmedReservations.length);
+    console.log('Type filter:', selectedType);
+    console.log('Service filter:', selectedService);
+    console.log('Total events loaded:', adminEvents.length);
+    console.log('All event statuses:', adminEvents.map(e => ({id: e.id, status: e.status})));
+    console.log('Active/Confirmed events:', confirmedEvents.length);
+    console.log('===========================');
+    
+    // Map reservations to calendar events
+    const reservationItems = confirmedReservations.map(res => {
+        // Get client name from API response
+        const clientName = res.contact_name || 'Unknown Client';
+        
+        // Get service type
+        const serviceType = res.service_type ? res.service_type.charAt(0).toUpperCase() + res.service_type.slice(1) : null;
+        
+        // Get date and time - API returns 'date' and 'time_slot'
+        const reservationDate = res.date;
+        const reservationTime = res.time_slot || res.time;
+        
+        console.log('Processing reservation:', {
+            id: res.id,
+            clientName,
+            serviceType,
+            date: reservationDate,
+            time: reservationTime,
+            status: res.status
+        });
+        
+        if (!reservationDate || !reservationTime || !clientName || !serviceType) {
+            console.log('❌ Skipping reservation - missing required fields:', {
+                hasDate: !!reservationDate,
+                hasTime: !!reservationTime,
+                hasClient: !!clientName,
+                hasService: !!serviceType
+            });
+            return null;
+        }
+        
+        const displayTime = formatTime12Hour(reservationTime);
+        const serviceColor = serviceColors[res.service_type?.toLowerCase()] || '#6B7280';
+        
+        // Convert time to proper format for FullCalendar
+        // Time from API is already in HH:MM:SS format (e.g., "09:00:00")
+        let formattedTime = reservationTime;
+        
+        // Remove seconds if present (09:00:00 -> 09:00)
+        if (formattedTime.includes(':')) {
+            const parts = formattedTime.split(':');
+            formattedTime = `${parts[0]}:${parts[1]}`;
+        }
+        
+        const calendarEvent = {
+            id: res.id,
+            title: `${displayTime}, ${clientName}, ${serviceType}`,
+            start: `${reservationDate}T${formattedTime}:00`,
+            backgroundColor: '#FFFFFF',
+            borderColor: serviceColor,
+            textColor: '#000000',
+            className: 'confirmed-event',
+            extendedProps: {
+                type: 'reservation',
+                clientName: clientName,
+                serviceType: serviceType,
+                time: displayTime,
+                date: reservationDate,
+                status: res.status,
+                serviceColor: serviceColor
+            }
+        };
+        
+        console.log('✅ Created calendar event:', {
+            title: calendarEvent.title,
+            start: calendarEvent.start,
+            color: serviceColor
+        });
+        
+        return calendarEvent;
+    }).filter(event => event !== null);
+    
+    // Map events to calendar events
+    const eventItems = confirmedEvents.map(event => {
+        if (!event.event_date || !event.start_time) {
+            return null;
+        }
+        
+        const eventName = event.event_name || event.description || 'Church Event';
+        const displayTime = formatTime12Hour(event.start_time);
+        const eventTypeColor = '#8B5CF6'; // Purple for events
+        
+        return {
+            id: `event_${event.id}`,
+            title: `${displayTime}, ${eventName}`,
+            start: `${event.event_date}T${event.start_time}`,
+            backgroundColor: '#FFFFFF',
+            borderColor: eventTypeColor,
+            textColor: '#000000',
+            className: 'confirmed-event',
+            extendedProps: {
+                type: 'event',
+                eventName: eventName,
+                eventType: event.event_type || 'other',
+                time: displayTime,
+                date: event.event_date,
+                status: event.status,
+                eventTypeColor: eventTypeColor
+            }
+        };
+    }).filter(event => event !== null);
+    
+    // Apply type filter - decide what to return
+    if (selectedType === 'reservations') {
+        console.log('📋 Showing RESERVATIONS ONLY:', reservationItems.length);
+        return reservationItems;
+    } else if (selectedType === 'events') {
+        console.log('📅 Showing EVENTS ONLY:', eventItems.length);
+        return eventItems;
+    } else {
+        console.log('🔄 Showing ALL (Reservations + Events):', reservationItems.length + eventItems.length);
+        return [...reservationItems, ...eventItems];
+    }
+}
+
+// Format time to 12-hour format
+function formatTime12Hour(timeString) {
+    if (!timeString) return '';
+    
+    try {
+        if (timeString.includes('AM') || timeString.includes('PM')) {
+            return timeString;
+        }
+        
+        const timeParts = timeString.split(':');
+        let hours = parseInt(timeParts[0]);
+        const minutes = timeParts[1] || '00';
+        
+        const ampm = hours >= 12 ? 'PM' : 'AM';
+        let displayHours = hours % 12;
+        displayHours = displayHours === 0 ? 12 : displayHours;
+        
+        return `${displayHours}:${minutes.padStart(2, '0')} ${ampm}`;
+    } catch (error) {
+        return timeString;
+    }
+}
+
+// Show event details in modal
+function showAdminEventDetails(event) {
+    const props = event.extendedProps;
+    const modal = document.getElementById('adminCalendarEventModal');
+    
+    if (props.type === 'event') {
+        // Show Event Details
+        document.getElementById('adminModalTitle').textContent = 'Event Details';
+        document.getElementById('admin-calendar-info-title').innerHTML = '<i class="fas fa-calendar-check" style="color: #002b5c;"></i> Event Information';
+        
+        // Event badge
+        const eventTypeColors = {
+            'worship': '#8B5CF6',
+            'prayer': '#F59E0B',
+            'youth': '#3B82F6',
+            'outreach': '#10B981',
+            'special': '#EF4444',
+            'other': '#6B7280'
+        };
+        const eventColor = eventTypeColors[props.eventType] || '#6B7280';
+        document.getElementById('admin-calendar-detail-badge').innerHTML = `
+            <span style="display: inline-flex; align-items: center; padding: 8px 16px; border-radius: 20px; font-size: 13px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; gap: 6px; background: ${eventColor}; color: white; border: 1px solid ${eventColor};">
+                <i class="fas fa-calendar-alt"></i>
+                ${props.eventType}
+            </span>
+        `;
+        
+        // Date and time
+        document.getElementById('admin-calendar-detail-date').textContent = props.date;
+        document.getElementById('admin-calendar-detail-time').textContent = props.time;
+        
+        // Event details
+        document.getElementById('admin-calendar-detail-content').innerHTML = `
+            <div style="display: flex; align-items: center; gap: 12px;">
+                <div style="background: #002b5c; color: white; width: 32px; height: 32px; border-radius: 8px; display: flex; align-items: center; justify-content: center; font-size: 14px;">
+                    <i class="fas fa-tag"></i>
+                </div>
+                <div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Event Name</div>
+                    <div style="color: #1e293b; font-weight: 600; font-size: 15px;">${props.eventName}</div>
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 12px;">
+                <div style="background: #d4af37; color: white; width: 32px; height: 32px; border-radius: 8px; display: flex; align-items: center; justify-content: center; font-size: 14px;">
+                    <i class="fas fa-info-circle"></i>
+                </div>
+                <div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Status</div>
+                    <div style="color: #1e293b; font-weight: 600; font-size: 15px;">${props.status}</div>
+                </div>
+            </div>
+        `;
+    } else {
+        // Show Reservation Details
+        document.getElementById('adminModalTitle').textContent = 'Reservation Details';
+        document.getElementById('admin-calendar-info-title').innerHTML = '<i class="fas fa-user-circle" style="color: #002b5c;"></i> Client Information';
+        
+        // Service badge
+        const serviceColors = {
+            'Wedding': '#FFD700',
+            'Baptism': '#3B82F6',
+            'Funeral': '#6B7280',
+            'Confirmation': '#8B5CF6'
+        };
+        const serviceColor = serviceColors[props.serviceType] || '#6B7280';
+        document.getElementById('admin-calendar-detail-badge').innerHTML = `
+            <span style="display: inline-flex; align-items: center; padding: 8px 16px; border-radius: 20px; font-size: 13px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; gap: 6px; background: ${serviceColor}; color: white; border: 1px solid ${serviceColor};">
+                <i class="fas fa-church"></i>
+                ${props.serviceType}
+            </span>
+        `;
+        
+        // Date and time
+        document.getElementById('admin-calendar-detail-date').textContent = props.date;
+        document.getElementById('admin-calendar-detail-time').textContent = props.time;
+        
+        // Client details
+        document.getElementById('admin-calendar-detail-content').innerHTML = `
+            <div style="display: flex; align-items: center; gap: 12px;">
+                <div style="background: #002b5c; color: white; width: 32px; height: 32px; border-radius: 8px; display: flex; align-items: center; justify-content: center; font-size: 14px;">
+                    <i class="fas fa-user"></i>
+                </div>
+                <div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Client Name</div>
+                    <div style="color: #1e293b; font-weight: 600; font-size: 15px;">${props.clientName}</div>
+                </div>
+            </div>
+            <div style="display: flex; align-items: center; gap: 12px;">
+                <div style="background: #d4af37; color: white; width: 32px; height: 32px; border-radius: 8px; display: flex; align-items: center; justify-content: center; font-size: 14px;">
+                    <i class="fas fa-info-circle"></i>
+                </div>
+                <div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px;">Status</div>
+                    <div style="color: #1e293b; font-weight: 600; font-size: 15px;">${props.status}</div>
+                </div>
+            </div>
+        `;
+    }
+    
+    // Show modal
+    modal.style.display = 'flex';
+    document.body.style.overflow = 'hidden';
+}
+
+
+// ============================================================================
+// PRINT CALENDAR FUNCTIONALITY (Same as Reports Print)
+// ============================================================================
+
+function generateCalendarGrid(year, month, events) {
+    const monthNames = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
+    const dayNames = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+    
+    // Get first day of month and total days
+    const firstDay = new Date(year, month, 1).getDay();
+    const daysInMonth = new Date(year, month + 1, 0).getDate();
+    
+    // Group events by date
+    const eventsByDate = {};
+    events.forEach(event => {
+        const eventDate = new Date(event.start);
+        if (eventDate.getMonth() === month && eventDate.getFullYear() === year) {
+            const dateKey = eventDate.getDate();
+            if (!eventsByDate[dateKey]) {
+                eventsByDate[dateKey] = [];
+            }
+            eventsByDate[dateKey].push(event);
+        }
+    });
+    
+    let html = `
+        <div style="text-align: center; margin-bottom: 10px; font-size: 12px; font-weight: bold;">
+            ${monthNames[month]} ${year}
+        </div>
+        <table style="width: 100%; border-collapse: collapse; border: 2px solid #000;">
+            <thead>
+                <tr>
+    `;
+    
+    // Day headers
+    dayNames.forEach(day => {
+        html += `<th style="border: 1px solid #000; padding: 5px; background: #e0e0e0; font-size: 9px; font-weight: bold;">${day}</th>`;
+    });
+    
+    html += `
+                </tr>
+            </thead>
+            <tbody>
+    `;
+    
+    // Calendar grid
+    let dayCounter = 1;
+    let weekRow = '<tr>';
+    
+    // Empty cells before first day
+    for (let i = 0; i < firstDay; i++) {
+        weekRow += '<td style="border: 1px solid #000; height: 70px; vertical-align: top; padding: 3px; background: #f5f5f5;"></td>';
+    }
+    
+    // Days of month
+    for (let day = 1; day <= daysInMonth; day++) {
+        const dayOfWeek = (firstDay + day - 1) % 7;
+        
+        weekRow += '<td style="border: 1px solid #000; height: 70px; vertical-align: top; padding: 3px;">';
+        weekRow += `<div style="font-weight: bold; font-size: 9px; margin-bottom: 3px; text-align: center;">${day}</div>`;
+        
+        // Add events for this day
+        if (eventsByDate[day]) {
+            eventsByDate[day].forEach(event => {
+                const color = event.borderColor || '#3788d8';
+                weekRow += `<div style="background: ${color}; color: white; font-size: 6px; padding: 1px 2px; margin: 1px 0; border-radius: 2px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;">${event.title}</div>`;
+            });
+        }
+        
+        weekRow += '</td>';
+        
+        // End of week
+        if (dayOfWeek === 6) {
+            weekRow += '</tr>';
+            html += weekRow;
+            weekRow = '<tr>';
+        }
+    }
+    
+    // Fill remaining cells
+    const remainingCells = (7 - ((firstDay + daysInMonth) % 7)) % 7;
+    for (let i = 0; i < remainingCells; i++) {
+        weekRow += '<td style="border: 1px solid #000; height: 70px; vertical-align: top; padding: 3px; background: #f5f5f5;"></td>';
+    }
+    
+    if (weekRow !== '<tr>') {
+        weekRow += '</tr>';
+        html += weekRow;
+    }
+    
+    html += `
+            </tbody>
+        </table>
+    `;
+    
+    return html;
+}
+
+function printAdminCalendar() {
+    console.log('🖨️ Printing Admin Calendar...');
+    
+    // Get the calendar instance
+    if (!adminCalendarInstance) {
+        alert('Calendar not initialized');
+        return;
+    }
+    
+    // Get current filter selections
+    const typeFilter = document.getElementById('adminTypeFilter');
+    const serviceFilter = document.getElementById('adminServiceFilter');
+    const selectedType = typeFilter ? typeFilter.value : 'all';
+    const selectedService = serviceFilter ? serviceFilter.value : 'all';
+    
+    // Get filtered events
+    const events = getAdminCalendarEvents();
+    
+    // Get current month/year from calendar
+    const currentDate = adminCalendarInstance.getDate();
+    const currentMonth = currentDate.getMonth();
+    const currentYear = currentDate.getFullYear();
+    
+    // Generate calendar grid HTML
+    const calendarHTML = generateCalendarGrid(currentYear, currentMonth, events);
+    
+    // Get month name
+    const monthNames = ['January', 'February', 'March', 'April', 'May', 'June',
+                       'July', 'August', 'September', 'October', 'November', 'December'];
+    const monthName = monthNames[currentMonth];
+    
+    // Determine title based on filters
+    let reportTitle = `${monthName} ${currentYear} Church Calendar Report`;
+    if (selectedType === 'reservations') {
+        reportTitle = `${monthName} ${currentYear} Reservations Calendar Report`;
+    } else if (selectedType === 'events') {
+        reportTitle = `${monthName} ${currentYear} Events Calendar Report`;
+    }
+    
+    if (selectedService !== 'all') {
+        reportTitle += ` - ${selectedService.charAt(0).toUpperCase() + selectedService.slice(1)}`;
+    }
+    
+    // Filter events to only show current month
+    const filteredEvents = events.filter(event => {
+        const eventDate = new Date(event.start);
+        return eventDate.getMonth() === currentMonth && eventDate.getFullYear() === currentYear;
+    });
+    
+    console.log(`🔍 Filtering events for ${currentYear}-${currentMonth + 1}: Found ${filteredEvents.length} events`);
+    
+    // Group events by date
+    const eventsByDate = {};
+    filteredEvents.forEach(event => {
+        const date = event.start.split('T')[0];
+        if (!eventsByDate[date]) {
+            eventsByDate[date] = [];
+        }
+        eventsByDate[date].push(event);
+    });
+    
+    // Sort dates
+    const sortedDates = Object.keys(eventsByDate).sort();
+    
+    // Generate print content
+    let printContent = '';
+    
+    sortedDates.forEach(date => {
+        const dateObj = new Date(date);
+        const formattedDate = dateObj.toLocaleDateString('en-US', { 
+            weekday: 'long', 
+            year: 'numeric', 
+            month: 'long', 
+            day: 'numeric' 
+        });
+        
+        printContent += `
+            <div class="date-section">
+                <div class="date-header">${formattedDate}</div>
+        `;
+        
+        // Sort events by time
+        eventsByDate[date].sort((a, b) => {
+            const timeA = a.start.split('T')[1];
+            const timeB = b.start.split('T')[1];
+            return timeA.localeCompare(timeB);
+        });
+        
+        eventsByDate[date].forEach(event => {
+            const props = event.extendedProps;
+            const isReservation = props.type === 'reservation';
+            
+            printContent += `
+                <div class="event-item">
+                    <div class="event-header">
+                        <div>
+                            <div class="event-title">${event.title}</div>
+                            <div class="event-type">${isReservation ? 'RESERVATION' : 'EVENT'} - ${isReservation ? props.serviceType : props.eventType}</div>
+                        </div>
+                        <div class="event-time">${props.time}</div>
+                    </div>
+                    ${isReservation ? `
+                        <div class="event-details">
+                            <div class="detail-row">
+                                <span class="detail-label">Client:</span>
+                                <span>${props.clientName}</span>
+                            </div>
+                            <div class="detail-row">
+                                <span class="detail-label">Status:</span>
+                                <span>${props.status.toUpperCase()}</span>
+                            </div>
+                        </div>
+                    ` : `
+                        <div class="event-details">
+                            <div class="detail-row">
+                                <span class="detail-label">Event Name:</span>
+                                <span>${props.eventName}</span>
+                            </div>
+                            <div class="detail-row">
+                                <span class="detail-label">Status:</span>
+                                <span>${props.status.toUpperCase()}</span>
+                            </div>
+                        </div>
+                    `}
+                </div>
+            `;
+        });
+        
+        printContent += `
+            </div>
+        `;
+    });
+    
+    if (sortedDates.length === 0) {
+        printContent = `
+            <div style="text-align: center; padding: 40px; border: 2px solid #000; margin: 20px 0;">
+                <p style="font-size: 14px; font-weight: bold;">NO DATA AVAILABLE</p>
+                <p style="font-size: 12px; margin-top: 10px;">No events or reservations found for the selected filters.</p>
+            </div>
+        `;
+    }
+    
+    // Get current date and time
+    const now = new Date();
+    const dateStr = now.toLocaleDateString('en-US', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+    const timeStr = now.toLocaleTimeString('en-US', {
+        hour: '2-digit',
+        minute: '2-digit'
+    });
+    
+    // Create hidden iframe for printing (same as Reports)
+    const iframe = document.createElement('iframe');
+    iframe.style.position = 'fixed';
+    iframe.style.right = '0';
+    iframe.style.bottom = '0';
+    iframe.style.width = '0';
+    iframe.style.height = '0';
+    iframe.style.border = 'none';
+    document.body.appendChild(iframe);
+    
+    const iframeDoc = iframe.contentWindow.document;
+    
+    // Write HTML content to iframe
+    iframeDoc.open();
+    iframeDoc.write(`
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>${reportTitle} - ChurchEase Report</title>
+            <link href="https://cdn.jsdelivr.net/npm/fullcalendar@6.1.8/index.global.min.css" rel="stylesheet">
+            <style>
+                @page {
+                    size: A4 portrait;
+                    margin: 15mm;
+                }
+                
+                * {
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }
+                
+                body {
+                    font-family: 'Times New Roman', Times, serif;
+                    background: white;
+                    color: #000;
+                }
+                
+                .document {
+                    max-width: 210mm;
+                    margin: 0 auto;
+                    padding: 0;
+                }
+                
+                /* Official Header */
+                .official-header {
+                    text-align: center;
+                    border-bottom: 4px double #000;
+                    padding-bottom: 10px;
+                    margin-bottom: 15px;
+                }
+                
+                .church-logo {
+                    width: 50px;
+                    height: 50px;
+                    margin: 0 auto 8px;
+                }
+                
+                .church-name {
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-bottom: 3px;
+                    letter-spacing: 1px;
+                }
+                
+                .church-address {
+                    font-size: 9px;
+                    color: #333;
+                    margin: 1px 0;
+                }
+                
+                .document-title {
+                    font-size: 14px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-top: 8px;
+                    text-transform: uppercase;
+                    letter-spacing: 1.5px;
+                    border-top: 1px solid #000;
+                    border-bottom: 1px solid #000;
+                    padding: 6px 0;
+                }
+                
+                /* Document Info */
+                .document-info {
+                    margin: 12px 0;
+                    font-size: 9px;
+                    border: 1px solid #ddd;
+                    padding: 8px;
+                    background: #f9f9f9;
+                }
+                
+                .info-row {
+                    display: flex;
+                    justify-content: space-between;
+                    margin: 4px 0;
+                }
+                
+                .info-label {
+                    font-weight: bold;
+                    color: #333;
+                }
+                
+                .info-value {
+                    color: #000;
+                }
+                
+                /* Content Sections */
+                .date-section {
+                    margin-bottom: 25px;
+                    page-break-inside: avoid;
+                }
+                
+                .date-header {
+                    font-size: 14px;
+                    font-weight: bold;
+                    border-bottom: 2px solid #000;
+                    padding-bottom: 5px;
+                    margin-bottom: 12px;
+                }
+                
+                .event-item {
+                    border: 1px solid #000;
+                    padding: 12px;
+                    margin-bottom: 10px;
+                    page-break-inside: avoid;
+                }
+                
+                .event-header {
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: start;
+                    margin-bottom: 8px;
+                    border-bottom: 1px solid #ccc;
+                    padding-bottom: 8px;
+                }
+                
+                .event-title {
+                    font-size: 13px;
+                    font-weight: bold;
+                }
+                
+                .event-time {
+                    font-size: 12px;
+                    font-weight: bold;
+                    background: #000;
+                    color: #fff;
+                    padding: 4px 10px;
+                    border-radius: 3px;
+                }
+                
+                .event-type {
+                    font-size: 11px;
+                    color: #555;
+                    margin-bottom: 5px;
+                }
+                
+                .event-details {
+                    font-size: 11px;
+                    margin-top: 8px;
+                    padding-top: 8px;
+                    border-top: 1px dashed #ccc;
+                }
+                
+                .detail-row {
+                    margin-bottom: 3px;
+                }
+                
+                .detail-label {
+                    font-weight: bold;
+                    display: inline-block;
+                    width: 80px;
+                }
+                
+                /* Signature Section */
+                .signature-section {
+                    margin-top: 30px;
+                    display: flex;
+                    justify-content: space-between;
+                    page-break-inside: avoid;
+                }
+                
+                .signature-box {
+                    text-align: center;
+                    width: 45%;
+                }
+                
+                .signature-line {
+                    border-top: 1px solid #000;
+                    margin-top: 40px;
+                    padding-top: 5px;
+                }
+                
+                .signature-name {
+                    font-size: 10px;
+                    font-weight: bold;
+                    color: #000;
+                }
+                
+                .signature-title {
+                    font-size: 8px;
+                    color: #666;
+                    margin-top: 2px;
+                    text-transform: uppercase;
+                }
+                
+                /* Footer */
+                .document-footer {
+                    margin-top: 15px;
+                    padding-top: 10px;
+                    border-top: 2px solid #000;
+                    text-align: center;
+                    font-size: 8px;
+                    color: #666;
+                }
+                
+                .footer-note {
+                    margin: 2px 0;
+                    font-style: italic;
+                }
+                
+                /* Visual Calendar Styles */
+                .visual-calendar {
+                    page-break-inside: avoid;
+                }
+                
+                .visual-calendar .fc-toolbar {
+                    margin-bottom: 10px !important;
+                }
+                
+                .visual-calendar .fc-toolbar-chunk:first-child,
+                .visual-calendar .fc-toolbar-chunk:last-child {
+                    display: none !important;
+                }
+                
+                .visual-calendar .fc-toolbar-title {
+                    font-size: 12px !important;
+                    font-weight: bold !important;
+                    color: #000 !important;
+                }
+                
+                .visual-calendar .fc-col-header-cell {
+                    font-size: 8px !important;
+                    padding: 5px 2px !important;
+                    background: #e0e0e0 !important;
+                    border: 1px solid #000 !important;
+                    font-weight: bold !important;
+                }
+                
+                .visual-calendar .fc-daygrid-day {
+                    border: 1px solid #000 !important;
+                    min-height: 60px !important;
+                }
+                
+                .visual-calendar .fc-daygrid-day-number {
+                    font-size: 9px !important;
+                    padding: 3px !important;
+                    font-weight: bold !important;
+                }
+                
+                .visual-calendar .fc-daygrid-day-top {
+                    justify-content: center !important;
+                }
+                
+                .visual-calendar .fc-event {
+                    font-size: 6px !important;
+                    padding: 1px 3px !important;
+                    margin: 1px 2px !important;
+                    border-radius: 2px !important;
+                    white-space: nowrap !important;
+                    overflow: hidden !important;
+                    text-overflow: ellipsis !important;
+                }
+                
+                .visual-calendar .fc-daygrid-event-harness {
+                    margin: 1px 0 !important;
+                }
+                
+                .visual-calendar .fc-button {
+                    display: none !important;
+                }
+                
+                .visual-calendar .fc-scrollgrid {
+                    border: 2px solid #000 !important;
+                }
+                
+                .visual-calendar .fc-day-today {
+                    background: #fff !important;
+                }
+                
+                @media print {
+                    body {
+                        print-color-adjust: exact;
+                        -webkit-print-color-adjust: exact;
+                    }
+                }
+            </style>
+        </head>
+        <body>
+            <div class="document">
+                <!-- Official Header -->
+                <div class="official-header">
+                    <div class="church-logo">
+                        <img src="/static/img/ChurchLogo-128.png" alt="Church Logo" style="width: 100%; height: 100%; object-fit: contain;">
+                    </div>
+                    <div class="church-name">SAINT ANDREW THE APOSTLE PARISH</div>
+                    <div class="church-address">Norzagaray, Bulacan</div>
+                    <div class="church-address">H. Bernabe Street, Poblacion, Norzagaray, 3013 Bulacan</div>
+                    <div class="church-address">Tel: 0995 770 5637</div>
+                    <div class="church-address">Office Hours: Tuesday - Sunday, 8:00 AM - 5:00 PM (Closed Mondays)</div>
+                    <div class="document-title">${reportTitle}</div>
+                </div>
+                
+                <!-- Document Information -->
+                <div class="document-info">
+                    <div class="info-row">
+                        <span class="info-label">Document Type:</span>
+                        <span class="info-value">Calendar Report</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Report Period:</span>
+                        <span class="info-value">All Scheduled Events & Reservations</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Generated Date:</span>
+                        <span class="info-value">${dateStr}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Generated Time:</span>
+                        <span class="info-value">${timeStr}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Total Items:</span>
+                        <span class="info-value">${events.length}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Prepared By:</span>
+                        <span class="info-value">ChurchEase Management System</span>
+                    </div>
+                </div>
+                
+                <!-- Visual Calendar -->
+                <div style="margin-bottom: 30px; padding: 10px; page-break-inside: avoid;">
+                    <h3 style="font-size: 12px; font-weight: bold; text-align: center; margin-bottom: 15px; text-transform: uppercase; border-bottom: 2px solid #000; padding-bottom: 8px;">Calendar View</h3>
+                    ${calendarHTML}
+                </div>
+                
+                <!-- Detailed Events List -->
+                <div class="calendar-content">
+                    <h3 style="font-size: 12px; font-weight: bold; text-align: center; margin-bottom: 15px; text-transform: uppercase; border-bottom: 1px solid #000; padding-bottom: 8px;">Detailed Schedule</h3>
+                    ${printContent}
+                </div>
+                
+                <!-- Signature Section -->
+                <div class="signature-section">
+                    <div class="signature-box">
+                        <div class="signature-line">
+                            <div class="signature-name">_____________________</div>
+                            <div class="signature-title">Prepared By</div>
+                        </div>
+                    </div>
+                    <div class="signature-box">
+                        <div class="signature-line">
+                            <div class="signature-name">_____________________</div>
+                            <div class="signature-title">Approved By</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <!-- Document Footer -->
+                <div class="document-footer">
+                    <p class="footer-note"><strong>Saint Andrew the Apostle Parish © ${new Date().getFullYear()}. All Rights Reserved.</strong></p>
+                    <p class="footer-note">This is a computer-generated document.</p>
+                </div>
+            </div>
+        </body>
+        </html>
+    `);
+    
+    iframeDoc.close();
+    
+    // Wait for content to load, then print (same as Reports)
+    iframe.onload = function() {
+        setTimeout(function() {
+            iframe.contentWindow.focus();
+            iframe.contentWindow.print();
+            
+            // Remove iframe after printing
+            setTimeout(function() {
+                document.body.removeChild(iframe);
+            }, 1000);
+        }, 250);
+    };
+}
@@ -0,0 +1,278 @@
+// ChurchEase Admin - Events
+// Loaded the first time the tab is opened, right after templates/admin/events.html
+// has been inserted into the page.
+
+// ===== EVENTS MODULE FUNCTIONS =====
+let allEvents = [];
+let filteredEvents = [];
+
+async function initializeEventsModule() {
+    console.log('Initializing Events module...');
+    await loadEventsData();
+    setupEventFilters();
+    setupEventSearch();
+}
+
+async function loadEventsData() {
+    try {
+        const response = await fetch('/api/events/all');
+        const result = await response.json();
+        
+        if (result.success) {
+            allEvents = result.data || [];
+            filteredEvents = allEvents;
+            displayEvents(allEvents);
+        } else {
+            console.error('Failed to load events:', result.error);
+            showEventsError('Failed to load events');
+        }
+    } catch (error) {
+        console.error('Error loading events:', error);
+        showEventsError('Error loading events from server');
+    }
+}
+
+function displayEvents(events) {
+    const tableBody = document.getElementById('eventsTableBody');
+    if (!tableBody) return;
+    
+    tableBody.innerHTML = '';
+    
+    if (events.length === 0) {
+        tableBody.innerHTML = `
+            <tr>
+                <td colspan="6" style="text-align: center; padding: 40px; color: #6b7280;">
+                    <i class="fas fa-calendar-times" style="font-size: 32px; margin-bottom: 12px;"></i>
+                    <p style="margin-top: 12px; font-size: 16px;">No events found</p>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+    
+    events.forEach((event, index) => {
+        const row = document.createElement('tr');
+        const eventDate = new Date(event.event_date);
+        const createdDate = new Date(event.created_at);
+        const isUpcoming = eventDate >= new Date();
+        
+        row.innerHTML = `
+            <td>#${String(index + 1).padStart(3, '0')}</td>
+            <td style="font-weight: 600;">${event.event_title || 'Untitled Event'}</td>
+            <td>
+                <span style="display: inline-flex; align-items: center; gap: 6px; padding: 6px 12px; background: ${isUpcoming ? '#dbeafe' : '#f3f4f6'}; color: ${isUpcoming ? '#1e40af' : '#6b7280'}; border-radius: 6px; font-weight: 600; font-size: 13px;">
+                    <i class="fas fa-calendar"></i>
+                    ${eventDate.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' })}
+                </span>
+            </td>
+            <td>${event.created_by_secretary || event.secretary_name || 'N/A'}</td>
+            <td style="color: #6b7280; font-size: 13px;">${createdDate.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' })}</td>
+            <td class="table-actions">
+                <button class="action-btn" onclick="viewEventDetails('${event.id}')" title="View Details">
+                    <i class="fas fa-eye"></i>
+                </button>
+            </td>
+        `;
+        tableBody.appendChild(row);
+    });
+    
+    console.log(`✅ Displayed ${events.length} events`);
+}
+
+function showEventsError(message) {
+    const tableBody = document.getElementById('eventsTableBody');
+    if (!tableBody) return;
+    
+    tableBody.innerHTML = `
+        <tr>
+            <td colspan="6" style="text-align: center; padding: 40px; color: #ef4444;">
+                <i class="fas fa-exclamation-triangle" style="font-size: 32px; margin-bottom: 12px;"></i>
+                <p style="margin-top: 12px; font-size: 16px;">${message}</p>
+            </td>
+        </tr>
+    `;
+}
+
+function setupEventFilters() {
+    document.querySelectorAll('.event-filter-tab').forEach(tab => {
+        tab.addEventListener('click', function() {
+            // Update active state
+            document.querySelectorAll('.event-filter-tab').forEach(t => t.classList.remove('active'));
+            this.classList.add('active');
+            
+            const filter = this.getAttribute('data-filter');
+            filterEvents(filter);
+        });
+    });
+}
+
+function filterEvents(filter) {
+    const now = new Date();
+    
+    switch(filter) {
+        case 'upcoming':
+            filteredEvents = allEvents.filter(event => new Date(event.event_date) >= now);
+            break;
+        case 'past':
+            filteredEvents = allEvents.filter(event => new Date(event.event_date) < now);
+            break;
+        case 'all':
+        default:
+            filteredEvents = allEvents;
+            break;
+    }
+    
+    displayEvents(filteredEvents);
+}
+
+function setupEventSearch() {
+    const searchInput = document.getElementById('eventSearchInput');
+    const clearBtn = document.getElementById('clearEventSearch');
+    
+    if (searchInput) {
+        searchInput.addEventListener('input', function() {
+            const query = this.value.toLowerCase().trim();
+            
+            if (query) {
+                clearBtn.style.display = 'block';
+                const searchResults = filteredEvents.filter(event => 
+                    (event.event_title && event.event_title.toLowerCase().includes(query)) ||
+                    (event.event_description && event.event_description.toLowerCase().includes(query)) ||
+                    (event.secretary_name && event.secretary_name.toLowerCase().includes(query))
+                );
+                displayEvents(searchResults);
+            } else {
+                clearBtn.style.display = 'none';
+                displayEvents(filteredEvents);
+            }
+        });
+    }
+    
+    if (clearBtn) {
+        clearBtn.addEventListener('click', function() {
+            searchInput.value = '';
+            this.style.display = 'none';
+            displayEvents(filteredEvents);
+        });
+    }
+}
+
+// Refresh button
+document.getElementById('refreshEventsBtn')?.addEventListener('click', async function() {
+    this.innerHTML = '<i class="fas fa-sync-alt fa-spin"></i> Refreshing...';
+    await loadEventsData();
+    this.innerHTML = '<i class="fas fa-sync-alt"></i> Refresh Events';
+});
+
+function viewEventDetails(eventId) {
+    const event = allEvents.find(e => e.id === eventId);
+    if (!event) return;
+    
+    console.log('Event details:', event); // Debug log
+    
+    // Show modal
+    const modal = document.getElementById('adminCalendarEventModal');
+    if (!modal) return;
+    
+    // Set modal title
+    document.getElementById('adminModalTitle').textContent = 'Event Details';
+    
+    // Format date and time
+    const eventDate = new Date(event.event_date);
+    const dateStr = eventDate.toLocaleDateString('en-US', { 
+        weekday: 'long', 
+        year: 'numeric', 
+        month: 'long', 
+        day: 'numeric' 
+    });
+    
+    // Format time
+    let timeStr = 'Not specified';
+    if (event.start_time) {
+        timeStr = event.start_time;
+        if (event.end_time) {
+            timeStr += ` - ${event.end_time}`;
+        }
+    }
+    
+    // Set date and time
+    document.getElementById('admin-calendar-detail-date').textContent = dateStr;
+    document.getElementById('admin-calendar-detail-time').textContent = timeStr;
+    
+    // Create event type badge
+    const eventTypes = {
+        'worship': { label: 'Worship Service', color: '#8b5cf6', icon: 'church' },
+        'prayer': { label: 'Prayer Meeting', color: '#ec4899', icon: 'praying-hands' },
+        'bible_study': { label: 'Bible Study', color: '#3b82f6', icon: 'book-bible' },
+        'youth': { label: 'Youth Activity', color: '#10b981', icon: 'users' },
+        'outreach': { label: 'Outreach Program', color: '#f59e0b', icon: 'hands-helping' },
+        'fellowship': { label: 'Fellowship', color: '#06b6d4', icon: 'handshake' },
+        'special': { label: 'Special Event', color: '#ef4444', icon: 'star' },
+        'meeting': { label: 'Meeting', color: '#6366f1', icon: 'users-cog' },
+        'other': { label: 'Other', color: '#64748b', icon: 'calendar' }
+    };
+    
+    // Get event type - check both 'type' and 'event_type' fields
+    const typeValue = event.type || event.event_type || 'other';
+    console.log('Event type value:', typeValue); // Debug log
+    const eventType = eventTypes[typeValue] || eventTypes['other'];
+    document.getElementById('admin-calendar-detail-badge').innerHTML = `
+        <span style="display: inline-flex; align-items: center; gap: 8px; padding: 10px 20px; background: ${eventType.color}; color: white; border-radius: 12px; font-weight: 600; font-size: 14px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
+            <i class="fas fa-${eventType.icon}"></i>
+            ${eventType.label}
+        </span>
+    `;
+    
+    // Set content
+    document.getElementById('admin-calendar-info-title').innerHTML = '<i class="fas fa-calendar-check" style="color: #002b5c;"></i> Event Information';
+    
+    const content = document.getElementById('admin-calendar-detail-content');
+    content.innerHTML = `
+        <div style="display: flex; align-items: start; gap: 12px; padding: 12px; background: white; border-radius: 10px; border: 1px solid rgba(148, 163, 184, 0.15);">
+            <i class="fas fa-heading" style="color: #002b5c; font-size: 16px; margin-top: 2px;"></i>
+            <div style="flex: 1;">
+                <div style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px;">Event Title</div>
+                <div style="color: #1e293b; font-size: 15px; font-weight: 600;">${event.event_title || 'Untitled Event'}</div>
+            </div>
+        </div>
+        
+        <div style="display: flex; align-items: start; gap: 12px; padding: 12px; background: white; border-radius: 10px; border: 1px solid rgba(148, 163, 184, 0.15);">
+            <i class="fas fa-align-left" style="color: #002b5c; font-size: 16px; margin-top: 2px;"></i>
+            <div style="flex: 1;">
+                <div style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px;">Description</div>
+                <div style="color: #1e293b; font-size: 14px; line-height: 1.6;">${event.event_description || 'No description provided'}</div>
+            </div>
+        </div>
+        
+        ${event.location ? `
+        <div style="display: flex; align-items: start; gap: 12px; padding: 12px; background: white; border-radius: 10px; border: 1px solid rgba(148, 163, 184, 0.15);">
+            <i class="fas fa-map-marker-alt" style="color: #002b5c; font-size: 16px; margin-top: 2px;"></i>
+            <div style="flex: 1;">
+                <div style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px;">Location</div>
+                <div style="color: #1e293b; font-size: 14px;">${event.location}</div>
+            </div>
+        </div>
+        ` : ''}
+        
+        ${event.organizer ? `
+        <div style="display: flex; align-items: start; gap: 12px; padding: 12px; background: white; border-radius: 10px; border: 1px solid rgba(148, 163, 184, 0.15);">
+            <i class="fas fa-user-tie" style="color: #002b5c; font-size: 16px; margin-top: 2px;"></i>
+            <div style="flex: 1;">
+                <div style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px;">Organizer</div>
+                <div style="color: #1e293b; font-size: 14px;">${event.organizer}</div>
+            </div>
+        </div>
+        ` : ''}
+        
+        <div style="display: flex; align-items: start; gap: 12px; padding: 12px; background: white; border-radius: 10px; border: 1px solid rgba(148, 163, 184, 0.15);">
+            <i class="fas fa-user-shield" style="color: #002b5c; font-size: 16px; margin-top: 2px;"></i>
+            <div style="flex: 1;">
+                <div style="color: #64748b; font-size: 12px; font-weight: 600; text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px;">Created By</div>
+                <div style="color: #1e293b; font-size: 14px;">${event.created_by_secretary || event.secretary_name || 'N/A'}</div>
+            </div>
+        </div>
+    `;
+    
+    // Show modal
+    modal.style.display = 'flex';
+}
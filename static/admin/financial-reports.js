@@ -0,0 +1,1066 @@
+// ChurchEase Admin - Financial Reports
+// Loaded the first time the tab is opened, right after templates/admin/financial-reports.html
+// has been inserted into the page.
+
+// Financial Reports Module Functions
+let monthlyReservationsChartInstance = null;
+let serviceDistributionChartInstance = null;
+let revenueTrendsChartInstance = null;
+let paymentStatusChartInstance = null;
+
+async function initializeFinancialReports() {
+    if (financialReportsInitialized) {
+        console.log('📊 Financial Reports already initialized, skipping...');
+        return;
+    }
+    console.log('📊 Initializing Financial Reports module...');
+    try {
+        await loadReportsData();
+        await loadFinancialSummaryData(); // Load financial summary cards
+        financialReportsInitialized = true;
+        console.log('✅ Financial Reports initialized successfully');
+    } catch (error) {
+        console.error('❌ Error initializing Financial Reports:', error);
+    }
+}
+
+async function loadReportsData() {
+    try {
+        console.log('📊 Loading all reports data...');
+        // Load all reports data
+        await Promise.all([
+            loadReportsSummary(),
+            loadMonthlyReservationsChart(),
+            loadServiceDistributionChart(),
+            loadRevenueTrendsChart(),
+            loadAttendanceRateChart(),
+            loadPopularServicesTable()
+        ]);
+        
+        console.log('✅ All reports data loaded successfully');
+    } catch (error) {
+        console.error('❌ Error loading reports data:', error);
+        console.error('Error details:', error.message, error.stack);
+    }
+}
+
+// Load Financial Summary Data from Database
+async function loadFinancialSummaryData() {
+    try {
+        // Get payments data for financial calculations
+        const paymentsResponse = await fetch('/api/reservations/all');
+        const paymentsResult = await paymentsResponse.json();
+        
+        if (paymentsResult.success) {
+            const reservations = paymentsResult.data;
+            
+            // Calculate total revenue from all payments
+            let totalRevenue = 0;
+            let monthlyRevenue = 0;
+            let pendingPayments = 0;
+            
+            const now = new Date();
+            const currentMonth = now.getMonth();
+            const currentYear = now.getFullYear();
+            
+            reservations.forEach(reservation => {
+                const amountPaid = parseFloat(reservation.amount_paid || 0);
+                const totalAmount = parseFloat(reservation.total_amount || 0);
+                
+                // Add to total revenue
+                totalRevenue += amountPaid;
+                
+                // Check if this month's payment
+                if (reservation.created_at) {
+                    const resDate = new Date(reservation.created_at);
+                    if (resDate.getMonth() === currentMonth && resDate.getFullYear() === currentYear) {
+                        monthlyRevenue += amountPaid;
+                    }
+                }
+                
+                // Calculate pending payments (total_amount - amount_paid)
+                if (totalAmount > amountPaid && reservation.service_type !== 'confirmation') {
+                    pendingPayments += (totalAmount - amountPaid);
+                }
+            });
+            
+            // Update financial summary cards
+            document.getElementById('financial-total-revenue').textContent = `₱${totalRevenue.toLocaleString()}`;
+            document.getElementById('financial-monthly-revenue').textContent = `₱${monthlyRevenue.toLocaleString()}`;
+            document.getElementById('financial-pending-payments').textContent = `₱${pendingPayments.toLocaleString()}`;
+            
+            console.log('✅ Financial summary data loaded from database');
+        }
+    } catch (error) {
+        console.error('Error loading financial summary data:', error);
+        document.getElementById('financial-total-revenue').textContent = '₱0';
+        document.getElementById('financial-monthly-revenue').textContent = '₱0';
+        document.getElementById('financial-pending-payments').textContent = '₱0';
+    }
+}
+
+// Load Summary Statistics
+async function loadReportsSummary() {
+    try {
+        const response = await fetch('/api/reports/summary');
+        const result = await response.json();
+        
+        if (result.success) {
+            const data = result.data;
+            
+            // Update summary cards
+            document.getElementById('reportTotalReservations').textContent = data.total_reservations || 0;
+            document.getElementById('reportTotalRevenue').textContent = `₱${(data.total_revenue || 0).toLocaleString()}`;
+            document.getElementById('reportPendingApprovals').textContent = data.pending_approvals || 0;
+            
+            // Update growth indicators
+            const reservationGrowth = data.reservation_growth || 0;
+            const trendElement = document.querySelector('#reportTotalReservations').closest('.stat-card').querySelector('.stat-trend');
+            if (trendElement) {
+                trendElement.textContent = `${reservationGrowth > 0 ? '+' : ''}${reservationGrowth}%`;
+                trendElement.className = `stat-trend ${reservationGrowth >= 0 ? 'trend-up' : 'trend-down'}`;
+            }
+            
+            console.log('✅ Reports summary loaded');
+        }
+    } catch (error) {
+        console.error('Error loading reports summary:', error);
+    }
+}
+
+// Load Monthly Reservations Chart
+async function loadMonthlyReservationsChart() {
+    try {
+        console.log('📈 Loading Monthly Reservations Chart...');
+        const response = await fetch('/api/reports/monthly-reservations');
+        console.log('📡 API Response status:', response.status);
+        
+        const result = await response.json();
+        console.log('📊 Monthly Reservations Data:', result);
+        
+        if (result.success) {
+            const data = result.data;
+            console.log('📊 Chart data - Labels:', data.labels, 'Counts:', data.counts);
+            
+            const ctx = document.getElementById('reportsMonthlyReservationsChart');
+            
+            if (!ctx) {
+                console.error('❌ Chart canvas not found: reportsMonthlyReservationsChart');
+                return;
+            }
+            
+            if (ctx) {
+                if (monthlyReservationsChartInstance) {
+                    monthlyReservationsChartInstance.destroy();
+                }
+                
+                monthlyReservationsChartInstance = new Chart(ctx, {
+                    type: 'line',
+                    data: {
+                        labels: data.labels,
+                        datasets: [{
+                            label: 'Reservations',
+                            data: data.counts,
+                            borderColor: '#3b82f6',
+                            backgroundColor: 'rgba(59, 130, 246, 0.1)',
+                            borderWidth: 3,
+                            fill: true,
+                            tension: 0.4,
+                            pointBackgroundColor: '#ffffff',
+                            pointBorderColor: '#3b82f6',
+                            pointBorderWidth: 2,
+                            pointRadius: 4
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                display: false
+                            },
+                            tooltip: {
+                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
+                                padding: 12,
+                                titleColor: '#fff',
+                                bodyColor: '#fff',
+                                borderColor: '#3b82f6',
+                                borderWidth: 1
+                            }
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: {
+                                    stepSize: 1,
+                                    color: '#6b7280'
+                                },
+                                grid: {
+                                    color: 'rgba(0, 0, 0, 0.05)'
+                                }
+                            },
+                            x: {
+                                ticks: {
+                                    color: '#6b7280'
+                                },
+                                grid: {
+                                    display: false
+                                }
+                            }
+                        }
+                    }
+                });
+                
+                console.log('✅ Monthly reservations chart created successfully');
+            }
+        } else {
+            console.error('❌ API returned error:', result.error || 'Unknown error');
+        }
+    } catch (error) {
+        console.error('❌ Error loading monthly reservations chart:', error);
+        console.error('Error details:', error.message, error.stack);
+    }
+}
+
+// Load Service Distribution Chart
+async function loadServiceDistributionChart() {
+    try {
+        console.log('🍩 Loading Service Distribution Chart...');
+        const response = await fetch('/api/reports/service-distribution');
+        console.log('📡 API Response status:', response.status);
+        
+        const result = await response.json();
+        console.log('📊 Service Distribution Data:', result);
+        
+        if (result.success) {
+            const data = result.data;
+            console.log('📊 Chart data - Labels:', data.labels, 'Counts:', data.counts);
+            
+            const ctx = document.getElementById('reportsServiceDistributionChart');
+            
+            if (!ctx) {
+                console.error('❌ Chart canvas not found: reportsServiceDistributionChart');
+                return;
+            }
+            
+            if (ctx) {
+                if (serviceDistributionChartInstance) {
+                    serviceDistributionChartInstance.destroy();
+                }
+                
+                serviceDistributionChartInstance = new Chart(ctx, {
+                    type: 'doughnut',
+                    data: {
+                        labels: data.labels,
+                        datasets: [{
+                            data: data.counts,
+                            backgroundColor: [
+                                '#fbbf24', // Wedding - Gold
+                                '#60a5fa', // Baptism - Blue
+                                '#9ca3af', // Funeral - Gray
+                                '#c084fc'  // Confirmation - Purple
+                            ],
+                            borderWidth: 2,
+                            borderColor: '#ffffff'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                position: 'bottom',
+                                labels: {
+                                    padding: 15,
+                                    font: {
+                                        size: 12
+                                    }
+                                }
+                            },
+                            tooltip: {
+                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
+                                padding: 12,
+                                callbacks: {
+                                    label: function(context) {
+                                        const label = context.label || '';
+                                        const value = context.parsed || 0;
+                                        const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                                        const percentage = ((value / total) * 100).toFixed(1);
+                                        return `${label}: ${value} (${percentage}%)`;
+                                    }
+                                }
+                            }
+                        }
+                    }
+                });
+                
+                console.log('✅ Service distribution chart created successfully');
+            }
+        } else {
+            console.error('❌ API returned error:', result.error || 'Unknown error');
+        }
+    } catch (error) {
+        console.error('❌ Error loading service distribution chart:', error);
+        console.error('Error details:', error.message, error.stack);
+    }
+}
+
+// Load Revenue Trends Chart
+async function loadRevenueTrendsChart() {
+    try {
+        console.log('💰 Loading Revenue Trends Chart...');
+        const response = await fetch('/api/reports/revenue-trends');
+        console.log('📡 API Response status:', response.status);
+        
+        const result = await response.json();
+        console.log('📊 Revenue Trends Data:', result);
+        
+        if (result.success) {
+            const data = result.data;
+            console.log('📊 Chart data - Labels:', data.labels, 'Revenue:', data.revenue);
+            
+            const ctx = document.getElementById('reportsRevenueTrendsChart');
+            
+            if (!ctx) {
+                console.error('❌ Chart canvas not found: reportsRevenueTrendsChart');
+                return;
+            }
+            
+            if (ctx) {
+                if (revenueTrendsChartInstance) {
+                    revenueTrendsChartInstance.destroy();
+                }
+                
+                revenueTrendsChartInstance = new Chart(ctx, {
+                    type: 'bar',
+                    data: {
+                        labels: data.labels,
+                        datasets: [{
+                            label: 'Stipendium',
+                            data: data.revenue,
+                            backgroundColor: 'rgba(16, 185, 129, 0.8)',
+                            borderColor: '#10b981',
+                            borderWidth: 1,
+                            borderRadius: 6
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                display: false
+                            },
+                            tooltip: {
+                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
+                                padding: 12,
+                                callbacks: {
+                                    label: function(context) {
+                                        return 'Stipendium: ₱' + context.parsed.y.toLocaleString();
+                                    }
+                                }
+                            }
+                        },
+                        scales: {
+                            y: {
+                                beginAtZero: true,
+                                ticks: {
+                                    callback: function(value) {
+                                        return '₱' + value.toLocaleString();
+                                    },
+                                    color: '#6b7280'
+                                },
+                                grid: {
+                                    color: 'rgba(0, 0, 0, 0.05)'
+                                }
+                            },
+                            x: {
+                                ticks: {
+                                    color: '#6b7280'
+                                },
+                                grid: {
+                                    display: false
+                                }
+                            }
+                        }
+                    }
+                });
+                
+                console.log('✅ Revenue trends chart created successfully');
+            }
+        } else {
+            console.error('❌ API returned error:', result.error || 'Unknown error');
+        }
+    } catch (error) {
+        console.error('❌ Error loading revenue trends chart:', error);
+        console.error('Error details:', error.message, error.stack);
+    }
+}
+
+// Load Payment Status Chart
+async function loadPaymentStatusChart() {
+    try {
+        const response = await fetch('/api/reports/payment-status');
+        const result = await response.json();
+        
+        if (result.success) {
+            const data = result.data;
+            const ctx = document.getElementById('paymentStatusChart');
+            
+            if (ctx) {
+                if (paymentStatusChartInstance) {
+                    paymentStatusChartInstance.destroy();
+                }
+                
+                paymentStatusChartInstance = new Chart(ctx, {
+                    type: 'pie',
+                    data: {
+                        labels: data.labels,
+                        datasets: [{
+                            data: data.counts,
+                            backgroundColor: [
+                                '#10b981', // Fully Paid - Green
+                                '#f59e0b', // Partial - Orange
+                                '#ef4444', // Pending - Red
+                                '#6b7280'  // No Payment - Gray
+                            ],
+                            borderWidth: 2,
+                            borderColor: '#ffffff'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                position: 'bottom',
+                                labels: {
+                                    padding: 15,
+                                    font: {
+                                        size: 12
+                                    }
+                                }
+                            },
+                            tooltip: {
+                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
+                                padding: 12,
+                                callbacks: {
+                                    label: function(context) {
+                                        const label = context.label || '';
+                                        const value = context.parsed || 0;
+                                        const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                                        const percentage = ((value / total) * 100).toFixed(1);
+                                        return `${label}: ${value} (${percentage}%)`;
+                                    }
+                                }
+                            }
+                        }
+                    }
+                });
+                
+                console.log('✅ Payment status chart loaded');
+            }
+        }
+    } catch (error) {
+        console.error('Error loading payment status chart:', error);
+    }
+}
+
+// Load Attendance Rate Chart
+let attendanceRateChartInstance = null;
+
+async function loadAttendanceRateChart() {
+    try {
+        console.log('📊 Loading Attendance Rate Chart...');
+        // Fetch attendance data from reservations
+        const response = await fetch('/api/reservations/all');
+        console.log('📡 API Response status:', response.status);
+        
+        const result = await response.json();
+        console.log('📊 Attendance Data:', result);
+        
+        if (result.success) {
+            const reservations = result.data;
+            
+            // Count attendance statuses
+            let attended = 0;
+            let noShow = 0;
+            let cancelled = 0;
+            let pending = 0;
+            
+            reservations.forEach(reservation => {
+                const status = reservation.attendance_status || 'pending';
+                switch(status) {
+                    case 'attended':
+                        attended++;
+                        break;
+                    case 'no_show':
+                        noShow++;
+                        break;
+                    case 'cancelled':
+                        cancelled++;
+                        break;
+                    case 'pending':
+                    default:
+                        pending++;
+                        break;
+                }
+            });
+            
+            const ctx = document.getElementById('reportsAttendanceRateChart');
+            
+            if (!ctx) {
+                console.error('❌ Chart canvas not found: reportsAttendanceRateChart');
+                return;
+            }
+            
+            if (ctx) {
+                if (attendanceRateChartInstance) {
+                    attendanceRateChartInstance.destroy();
+                }
+                
+                attendanceRateChartInstance = new Chart(ctx, {
+                    type: 'doughnut',
+                    data: {
+                        labels: ['Attended', 'No-Show', 'Pending', 'Cancelled'],
+                        datasets: [{
+                            data: [attended, noShow, pending, cancelled],
+                            backgroundColor: [
+                                '#10b981', // Attended - Green
+                                '#ef4444', // No-Show - Red
+                                '#f59e0b', // Pending - Orange
+                                '#6b7280'  // Cancelled - Gray
+                            ],
+                            borderWidth: 2,
+                            borderColor: '#ffffff'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                position: 'bottom',
+                                labels: {
+                                    padding: 15,
+                                    font: {
+                                        size: 12
+                                    }
+                                }
+                            },
+                            tooltip: {
+                                backgroundColor: 'rgba(0, 0, 0, 0.8)',
+                                padding: 12,
+                                callbacks: {
+                                    label: function(context) {
+                                        const label = context.label || '';
+                                        const value = context.parsed || 0;
+                                        const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                                        const percentage = total > 0 ? ((value / total) * 100).toFixed(1) : 0;
+                                        return `${label}: ${value} (${percentage}%)`;
+                                    }
+                                }
+                            }
+                        }
+                    }
+                });
+                
+                console.log('✅ Attendance rate chart loaded');
+            }
+        }
+    } catch (error) {
+        console.error('Error loading attendance rate chart:', error);
+    }
+}
+
+// Print Individual Chart Function
+function printChart(chartId, chartTitle) {
+    // Get the chart canvas
+    const canvas = document.getElementById(chartId);
+    if (!canvas) {
+        console.error('Chart not found:', chartId);
+        return;
+    }
+    
+    // Get chart image as base64
+    const chartImage = canvas.toDataURL('image/png');
+    
+    // Get current date
+    const now = new Date();
+    const dateStr = now.toLocaleDateString('en-US', {
+        year: 'numeric',
+        month: 'long',
+        day: 'numeric'
+    });
+    const timeStr = now.toLocaleTimeString('en-US', {
+        hour: '2-digit',
+        minute: '2-digit'
+    });
+    
+    // Get chart-specific summary data
+    let summaryHTML = '';
+    
+    if (chartId === 'monthlyReservationsChart') {
+        // Monthly Reservations Summary
+        const chartInstance = monthlyReservationsChartInstance;
+        if (chartInstance) {
+            const data = chartInstance.data.datasets[0].data;
+            const total = data.reduce((a, b) => a + b, 0);
+            const average = (total / data.length).toFixed(1);
+            const highest = Math.max(...data);
+            summaryHTML = `
+                <div class="summary-item">
+                    <div class="summary-value">${total}</div>
+                    <div class="summary-label">Total Approved</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${average}</div>
+                    <div class="summary-label">Monthly Average</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${highest}</div>
+                    <div class="summary-label">Highest Month</div>
+                </div>
+            `;
+        }
+    } else if (chartId === 'serviceDistributionChart') {
+        // Service Distribution Summary
+        const chartInstance = serviceDistributionChartInstance;
+        if (chartInstance) {
+            const data = chartInstance.data.datasets[0].data;
+            const labels = chartInstance.data.labels;
+            const total = data.reduce((a, b) => a + b, 0);
+            const maxIndex = data.indexOf(Math.max(...data));
+            const mostPopular = labels[maxIndex];
+            summaryHTML = `
+                <div class="summary-item">
+                    <div class="summary-value">${total}</div>
+                    <div class="summary-label">Total Services</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${mostPopular}</div>
+                    <div class="summary-label">Most Popular</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${data[maxIndex]}</div>
+                    <div class="summary-label">Top Count</div>
+                </div>
+            `;
+        }
+    } else if (chartId === 'revenueTrendsChart') {
+        // Stipendium Trends Summary
+        const chartInstance = revenueTrendsChartInstance;
+        if (chartInstance) {
+            const data = chartInstance.data.datasets[0].data;
+            const total = data.reduce((a, b) => a + b, 0);
+            const average = (total / data.length).toFixed(0);
+            const highest = Math.max(...data);
+            summaryHTML = `
+                <div class="summary-item">
+                    <div class="summary-value">₱${total.toLocaleString()}</div>
+                    <div class="summary-label">Total Stipendium</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">₱${parseInt(average).toLocaleString()}</div>
+                    <div class="summary-label">Monthly Average</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">₱${highest.toLocaleString()}</div>
+                    <div class="summary-label">Highest Month</div>
+                </div>
+            `;
+        }
+    } else if (chartId === 'attendanceRateChart') {
+        // Attendance Rate Summary
+        const chartInstance = attendanceRateChartInstance;
+        if (chartInstance) {
+            const data = chartInstance.data.datasets[0].data;
+            const labels = chartInstance.data.labels;
+            const total = data.reduce((a, b) => a + b, 0);
+            const attendedIndex = labels.indexOf('Attended');
+            const attended = data[attendedIndex] || 0;
+            const rate = total > 0 ? ((attended / total) * 100).toFixed(1) : 0;
+            summaryHTML = `
+                <div class="summary-item">
+                    <div class="summary-value">${total}</div>
+                    <div class="summary-label">Total Records</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${attended}</div>
+                    <div class="summary-label">Attended</div>
+                </div>
+                <div class="summary-item">
+                    <div class="summary-value">${rate}%</div>
+                    <div class="summary-label">Attendance Rate</div>
+                </div>
+            `;
+        }
+    }
+    
+    // Create hidden iframe for printing
+    const iframe = document.createElement('iframe');
+    iframe.style.position = 'fixed';
+    iframe.style.right = '0';
+    iframe.style.bottom = '0';
+    iframe.style.width = '0';
+    iframe.style.height = '0';
+    iframe.style.border = 'none';
+    document.body.appendChild(iframe);
+    
+    const iframeDoc = iframe.contentWindow.document;
+    
+    // Write HTML content to iframe
+    iframeDoc.open();
+    iframeDoc.write(`
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>${chartTitle} - ChurchEase Report</title>
+            <style>
+                @page {
+                    size: A4 portrait;
+                    margin: 15mm;
+                }
+                
+                * {
+                    margin: 0;
+                    padding: 0;
+                    box-sizing: border-box;
+                }
+                
+                body {
+                    font-family: 'Times New Roman', Times, serif;
+                    background: white;
+                    color: #000;
+                }
+                
+                .document {
+                    max-width: 210mm;
+                    margin: 0 auto;
+                    padding: 0;
+                }
+                
+                /* Official Header */
+                .official-header {
+                    text-align: center;
+                    border-bottom: 4px double #000;
+                    padding-bottom: 10px;
+                    margin-bottom: 15px;
+                }
+                
+                .church-logo {
+                    width: 50px;
+                    height: 50px;
+                    margin: 0 auto 8px;
+                }
+                
+                .church-name {
+                    font-size: 18px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-bottom: 3px;
+                    letter-spacing: 1px;
+                }
+                
+                .church-address {
+                    font-size: 9px;
+                    color: #333;
+                    margin: 1px 0;
+                }
+                
+                .document-title {
+                    font-size: 14px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-top: 8px;
+                    text-transform: uppercase;
+                    letter-spacing: 1.5px;
+                    border-top: 1px solid #000;
+                    border-bottom: 1px solid #000;
+                    padding: 6px 0;
+                }
+                
+                /* Document Info */
+                .document-info {
+                    margin: 12px 0;
+                    font-size: 9px;
+                    border: 1px solid #ddd;
+                    padding: 8px;
+                    background: #f9f9f9;
+                }
+                
+                .info-row {
+                    display: flex;
+                    justify-content: space-between;
+                    margin: 4px 0;
+                }
+                
+                .info-label {
+                    font-weight: bold;
+                    color: #333;
+                }
+                
+                .info-value {
+                    color: #000;
+                }
+                
+                /* Summary Section */
+                .summary-section {
+                    margin: 12px 0;
+                    border: 2px solid #000;
+                    padding: 10px;
+                }
+                
+                .summary-title {
+                    font-size: 12px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-bottom: 8px;
+                    text-align: center;
+                    text-transform: uppercase;
+                    letter-spacing: 1px;
+                    border-bottom: 1px solid #000;
+                    padding-bottom: 5px;
+                }
+                
+                .summary-grid {
+                    display: grid;
+                    grid-template-columns: repeat(3, 1fr);
+                    gap: 8px;
+                    margin-top: 8px;
+                }
+                
+                .summary-item {
+                    text-align: center;
+                    padding: 8px;
+                    border: 1px solid #ddd;
+                    background: #fff;
+                }
+                
+                .summary-value {
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-bottom: 3px;
+                }
+                
+                .summary-label {
+                    font-size: 9px;
+                    color: #666;
+                    text-transform: uppercase;
+                    letter-spacing: 0.5px;
+                }
+                
+                /* Chart Section */
+                .chart-section {
+                    margin: 12px 0;
+                    page-break-inside: avoid;
+                }
+                
+                .section-title {
+                    font-size: 11px;
+                    font-weight: bold;
+                    color: #000;
+                    margin-bottom: 10px;
+                    text-align: center;
+                    text-transform: uppercase;
+                    letter-spacing: 1px;
+                    border-bottom: 2px solid #000;
+                    padding-bottom: 5px;
+                }
+                
+                .chart-container {
+                    text-align: center;
+                    border: 2px solid #000;
+                    padding: 10px;
+                    background: #fff;
+                }
+                
+                .chart-image {
+                    max-width: 100%;
+                    height: auto;
+                    display: block;
+                    margin: 0 auto;
+                }
+                
+                /* Signature Section */
+                .signature-section {
+                    margin-top: 20px;
+                    display: grid;
+                    grid-template-columns: 1fr 1fr;
+                    gap: 30px;
+                    page-break-inside: avoid;
+                }
+                
+                .signature-box {
+                    text-align: center;
+                }
+                
+                .signature-line {
+                    border-top: 2px solid #000;
+                    margin-top: 30px;
+                    padding-top: 5px;
+                    font-size: 10px;
+                    font-weight: bold;
+                }
+                
+                .signature-title {
+                    font-size: 8px;
+                    color: #666;
+                    margin-top: 2px;
+                    text-transform: uppercase;
+                }
+                
+                /* Footer */
+                .document-footer {
+                    margin-top: 15px;
+                    padding-top: 10px;
+                    border-top: 2px solid #000;
+                    text-align: center;
+                    font-size: 8px;
+                    color: #666;
+                }
+                
+                .footer-note {
+                    margin: 2px 0;
+                    font-style: italic;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="document">
+                <!-- Official Header -->
+                <div class="official-header">
+                    <div class="church-logo">
+                        <img src="/static/img/ChurchLogo-128.png" alt="Church Logo" style="width: 100%; height: 100%; object-fit: contain;">
+                    </div>
+                    <div class="church-name">SAINT ANDREW THE APOSTLE PARISH</div>
+                    <div class="church-address">Norzagaray, Bulacan</div>
+                    <div class="church-address">H. Bernabe Street, Poblacion, Norzagaray, 3013 Bulacan</div>
+                    <div class="church-address">Tel: 0995 770 5637</div>
+                    <div class="church-address">Office Hours: Tuesday - Sunday, 8:00 AM - 5:00 PM (Closed Mondays)</div>
+                    <div class="document-title">Official Report - ${chartTitle}</div>
+                </div>
+                
+                <!-- Document Information -->
+                <div class="document-info">
+                    <div class="info-row">
+                        <span class="info-label">Document Type:</span>
+                        <span class="info-value">Statistical Report</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Report Category:</span>
+                        <span class="info-value">${chartTitle}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Generated Date:</span>
+                        <span class="info-value">${dateStr}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Generated Time:</span>
+                        <span class="info-value">${timeStr}</span>
+                    </div>
+                    <div class="info-row">
+                        <span class="info-label">Prepared By:</span>
+                        <span class="info-value">ChurchEase Management System</span>
+                    </div>
+                </div>
+                
+                <!-- Summary Statistics -->
+                <div class="summary-section">
+                    <div class="summary-title">Report Summary</div>
+                    <div class="summary-grid">
+                        ${summaryHTML}
+                    </div>
+                </div>
+                
+                <!-- Chart Section -->
+                <div class="chart-section">
+                    <div class="section-title">${chartTitle} - Detailed Analysis</div>
+                    <div class="chart-container">
+                        <img src="${chartImage}" alt="${chartTitle}" class="chart-image">
+                    </div>
+                </div>
+                
+                <!-- Signature Section -->
+                <div class="signature-section">
+                    <div class="signature-box">
+                        <div class="signature-line">_______________________</div>
+                        <div class="signature-title">Administrator</div>
+                        <div class="signature-title">Prepared By</div>
+                    </div>
+                    <div class="signature-box">
+                        <div class="signature-line">_______________________</div>
+                        <div class="signature-title">Parish Priest</div>
+                        <div class="signature-title">Reviewed & Approved By</div>
+                    </div>
+                </div>
+                
+                <!-- Footer -->
+                <div class="document-footer">
+                    <p class="footer-note">This is an official computer-generated report from Saint Andrew the Apostle Parish.</p>
+                    <p class="footer-note">No signature is required for system-generated documents.</p>
+                    <p style="margin-top: 8px;"><strong>Saint Andrew the Apostle Parish © 2024. All Rights Reserved.</strong></p>
+                </div>
+            </div>
+        </body>
+        </html>
+    `);
+    iframeDoc.close();
+    
+    // Wait for content to load, then print
+    iframe.onload = function() {
+        setTimeout(function() {
+            iframe.contentWindow.focus();
+            iframe.contentWindow.print();
+            
+            // Remove iframe after printing
+            setTimeout(function() {
+                document.body.removeChild(iframe);
+            }, 1000);
+        }, 250);
+    };
+}
+
+
+// Load Popular Services Table
+async function loadPopularServicesTable() {
+    try {
+        const response = await fetch('/api/reports/service-distribution');
+        const result = await response.json();
+        
+        if (result.success) {
+            const data = result.data;
+            const tableBody = document.querySelector('#financialReportsModule .data-table tbody');
+            
+            if (tableBody) {
+                tableBody.innerHTML = '';
+                
+                // Combine service data with revenue
+                const services = data.labels.map((label, index) => ({
+                    name: label,
+                    count: data.counts[index],
+                    revenue: data.revenue ? data.revenue[index] : 0
+                }));
+                
+                // Sort by count descending
+                services.sort((a, b) => b.count - a.count);
+                
+                services.forEach(service => {
+                    const row = document.createElement('tr');
+                    const serviceClass = service.name.toLowerCase();
+                    row.innerHTML = `
+                        <td><span class="service-badge ${serviceClass}">${service.name}</span></td>
+                        <td>${service.count}</td>
+                        <td>₱${service.revenue.toLocaleString()}</td>
+                    `;
+                    tableBody.appendChild(row);
+                });
+                
+                console.log('✅ Popular services table loaded');
+            }
+        }
+    } catch (error) {
+        console.error('Error loading popular services table:', error);
+    }
+}
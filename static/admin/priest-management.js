@@ -0,0 +1,576 @@
+// ChurchEase Admin - Priest Management
+// Loaded the first time the tab is opened, right after templates/admin/priest-management.html
+// has been inserted into the page.
+
+// ============================================================================
+// PRIEST MANAGEMENT FUNCTIONALITY
+// ============================================================================
+
+// Initialize Priest Management
+function initializePriestManagement() {
+    console.log('Initializing Priest Management...');
+    
+    // Add Priest Modal Event Listeners
+    const addPriestBtn = document.getElementById('addPriestBtn');
+    const addPriestModal = document.getElementById('addPriestModal');
+    const closeAddPriest = document.getElementById('closeAddPriest');
+    const cancelAddPriest = document.getElementById('cancelAddPriest');
+    const confirmAddPriest = document.getElementById('confirmAddPriest');
+
+    if (addPriestBtn) {
+        addPriestBtn.addEventListener('click', function() {
+            document.getElementById('addPriestForm').reset();
+            addPriestModal.style.display = 'flex';
+        });
+    }
+
+    if (closeAddPriest) {
+        closeAddPriest.addEventListener('click', function() {
+            addPriestModal.style.display = 'none';
+        });
+    }
+
+    if (cancelAddPriest) {
+        cancelAddPriest.addEventListener('click', function() {
+            addPriestModal.style.display = 'none';
+        });
+    }
+
+    if (confirmAddPriest) {
+        confirmAddPriest.addEventListener('click', function() {
+            addNewPriest();
+        });
+    }
+
+    // Edit Priest Modal Event Listeners
+    const editPriestModal = document.getElementById('editPriestModal');
+    const closeEditPriest = document.getElementById('closeEditPriest');
+    const cancelEditPriest = document.getElementById('cancelEditPriest');
+    const confirmEditPriest = document.getElementById('confirmEditPriest');
+
+    if (closeEditPriest) {
+        closeEditPriest.addEventListener('click', function() {
+            editPriestModal.style.display = 'none';
+        });
+    }
+
+    if (cancelEditPriest) {
+        cancelEditPriest.addEventListener('click', function() {
+            editPriestModal.style.display = 'none';
+        });
+    }
+
+    if (confirmEditPriest) {
+        confirmEditPriest.addEventListener('click', function() {
+            updatePriest();
+        });
+    }
+
+    // Delete Priest Modal Event Listeners
+    const deletePriestModal = document.getElementById('deletePriestModal');
+    const closeDeletePriest = document.getElementById('closeDeletePriest');
+    const cancelDeletePriest = document.getElementById('cancelDeletePriest');
+    const confirmDeletePriest = document.getElementById('confirmDeletePriest');
+    const confirmPriestDeletion = document.getElementById('confirmPriestDeletion');
+
+    if (closeDeletePriest) {
+        closeDeletePriest.addEventListener('click', function() {
+            deletePriestModal.style.display = 'none';
+        });
+    }
+
+    if (cancelDeletePriest) {
+        cancelDeletePriest.addEventListener('click', function() {
+            deletePriestModal.style.display = 'none';
+        });
+    }
+
+    if (confirmPriestDeletion) {
+        confirmPriestDeletion.addEventListener('change', function() {
+            confirmDeletePriest.disabled = !this.checked;
+        });
+    }
+
+    if (confirmDeletePriest) {
+        confirmDeletePriest.addEventListener('click', function() {
+            confirmDeletePriestAction();
+        });
+    }
+
+    // Refresh Priests Button
+    const refreshPriestsBtn = document.getElementById('refreshPriestsBtn');
+    if (refreshPriestsBtn) {
+        refreshPriestsBtn.addEventListener('click', function() {
+            refreshPriests();
+        });
+    }
+
+    // Search functionality
+    const priestSearchInput = document.getElementById('priestSearchInput');
+    const clearPriestSearch = document.getElementById('clearPriestSearch');
+
+    if (priestSearchInput) {
+        priestSearchInput.addEventListener('input', function() {
+            const searchTerm = this.value.toLowerCase();
+            filterPriests(searchTerm);
+            
+            if (clearPriestSearch) {
+                clearPriestSearch.style.display = searchTerm ? 'block' : 'none';
+            }
+        });
+    }
+
+    if (clearPriestSearch) {
+        clearPriestSearch.addEventListener('click', function() {
+            priestSearchInput.value = '';
+            filterPriests('');
+            this.style.display = 'none';
+        });
+    }
+}
+
+// Add New Priest Function
+function addNewPriest() {
+    const form = document.getElementById('addPriestForm');
+    const formData = new FormData(form);
+    
+    const priestData = {
+        full_name: formData.get('full_name'),
+        email: formData.get('email'),
+        phone: formData.get('phone'),
+        specialization: formData.get('specialization'),
+        status: formData.get('status') || 'active'
+    };
+
+    console.log('Adding new priest:', priestData);
+    
+    // TODO: Send to backend API
+    // For now, show success message
+    showNotification('Priest added successfully!', 'success');
+    document.getElementById('addPriestModal').style.display = 'none';
+    refreshPriests();
+}
+
+// Edit Priest Function
+function editPriest(priestId) {
+    console.log('Editing priest:', priestId);
+    
+    // TODO: Fetch priest data from backend
+    // For now, populate with current data
+    document.getElementById('editPriestId').value = priestId;
+    document.getElementById('editPriestFullName').value = 'Father Antonio Rodriguez';
+    document.getElementById('editPriestEmail').value = 'antonio.rodriguez@churchease.com';
+    document.getElementById('editPriestPhone').value = '+63 912 345 6789';
+    document.getElementById('editPriestSpecialization').value = 'All church services';
+    document.getElementById('editPriestStatus').value = 'active';
+    
+    document.getElementById('editPriestModal').style.display = 'flex';
+}
+
+// Update Priest Function
+function updatePriest() {
+    const form = document.getElementById('editPriestForm');
+    const formData = new FormData(form);
+    
+    const priestData = {
+        priest_id: formData.get('priest_id'),
+        full_name: formData.get('full_name'),
+        email: formData.get('email'),
+        phone: formData.get('phone'),
+        specialization: formData.get('specialization'),
+        status: formData.get('status')
+    };
+
+    console.log('Updating priest:', priestData);
+    
+    // TODO: Send to backend API
+    // For now, show success message
+    showNotification('Priest updated successfully!', 'success');
+    document.getElementById('editPriestModal').style.display = 'none';
+    refreshPriests();
+}
+
+// Remove Priest Function
+function removePriest(priestId) {
+    console.log('Removing priest:', priestId);
+    
+    // Set priest info in delete modal
+    document.getElementById('deletePriestInfo').textContent = 'This will permanently remove Father Antonio Rodriguez from the system.';
+    
+    // Store priest ID for deletion
+    document.getElementById('deletePriestModal').setAttribute('data-priest-id', priestId);
+    document.getElementById('deletePriestModal').style.display = 'flex';
+    
+    // Reset checkbox
+    document.getElementById('confirmPriestDeletion').checked = false;
+    document.getElementById('confirmDeletePriest').disabled = true;
+}
+
+// Confirm Delete Priest Function
+function confirmDeletePriestAction() {
+    const priestId = document.getElementById('deletePriestModal').getAttribute('data-priest-id');
+    
+    console.log('Confirming priest deletion:', priestId);
+    
+    // TODO: Send delete request to backend API
+    // For now, show success message
+    showNotification('Priest removed successfully!', 'success');
+    document.getElementById('deletePriestModal').style.display = 'none';
+    refreshPriests();
+}
+
+// Refresh Priests Function
+function refreshPriests() {
+    console.log('Refreshing priests data...');
+    
+    const refreshBtn = document.getElementById('refreshPriestsBtn');
+    if (refreshBtn) {
+        refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Refreshing...';
+        refreshBtn.disabled = true;
+        
+        // TODO: Fetch from backend API
+        setTimeout(() => {
+            refreshBtn.innerHTML = '<i class="fas fa-sync-alt"></i> Refresh';
+            refreshBtn.disabled = false;
+            showNotification('Priests data refreshed!', 'success');
+        }, 1000);
+    }
+}
+
+// Filter Priests Function
+function filterPriests(searchTerm) {
+    const tableRows = document.querySelectorAll('#priestsTableBody tr');
+    
+    tableRows.forEach(row => {
+        const priestName = row.querySelector('.user-name')?.textContent.toLowerCase() || '';
+        const priestEmail = row.querySelector('.user-email')?.textContent.toLowerCase() || '';
+        const specialization = row.querySelector('.service-badge')?.textContent.toLowerCase() || '';
+        
+        const matches = priestName.includes(searchTerm) || 
+                      priestEmail.includes(searchTerm) || 
+                      specialization.includes(searchTerm);
+        
+        row.style.display = matches ? '' : 'none';
+    });
+}
+
+// Load priests data from database
+function loadPriestsData() {
+    console.log('Loading priests data from database...');
+    
+    fetch('/api/priests/all')
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                console.log('Priests data loaded:', data.data);
+                populatePriestsTable(data.data);
+                updatePriestsCount(data.count);
+            } else {
+                console.error('Failed to load priests:', data.error);
+                showNotification('Failed to load priests data', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading priests:', error);
+            showNotification('Error loading priests data', 'error');
+        });
+}
+
+// Populate priests table with real data
+function populatePriestsTable(priests) {
+    const tableBody = document.getElementById('priestsTableBody');
+    if (!tableBody) return;
+    
+    tableBody.innerHTML = '';
+    
+    if (priests.length === 0) {
+        tableBody.innerHTML = `
+            <tr>
+                <td colspan="6" style="text-align: center; padding: 40px; color: #6b7280;">
+                    <i class="fas fa-church" style="font-size: 48px; margin-bottom: 16px; opacity: 0.3;"></i>
+                    <p>No priests found</p>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+    
+    priests.forEach(priest => {
+        const row = document.createElement('tr');
+        
+        // Get initials for avatar
+        const fullName = priest.full_name || 'Unknown';
+        const nameParts = fullName.split(' ');
+        const initials = nameParts.length >= 2 
+            ? nameParts[0][0] + nameParts[1][0] 
+            : nameParts[0][0] + (nameParts[0][1] || '');
+        
+        // Format date
+        const dateAdded = priest.created_at ? new Date(priest.created_at).toLocaleDateString() : 'N/A';
+        
+        // Get specialization class for badge
+        const specialization = priest.specialization || 'general-services';
+        const specializationClass = specialization.toLowerCase().replace(/\s+/g, '-');
+        const email = priest.email || 'No email';
+        const status = priest.status || 'active';
+        
+        row.innerHTML = `
+            <td>
+                <div class="user-info">
+                    <div class="user-avatar">${initials.toUpperCase()}</div>
+                    <div class="user-details">
+                        <div class="user-name">${fullName}</div>
+                        <div class="user-email">${email}</div>
+                    </div>
+                </div>
+            </td>
+            <td>${email}</td>
+            <td>
+                <span class="service-badge ${specializationClass}">${specialization}</span>
+            </td>
+            <td>
+                <span class="status-badge ${status}">${status.charAt(0).toUpperCase() + status.slice(1)}</span>
+            </td>
+            <td>${dateAdded}</td>
+            <td>
+                <div class="action-buttons">
+                    <button class="action-btn edit" title="Edit Priest" onclick="editPriest('${priest.id}')">
+                        <i class="fas fa-edit"></i>
+                    </button>
+                    <button class="action-btn delete" title="Remove Priest" onclick="removePriest('${priest.id}')">
+                        <i class="fas fa-trash"></i>
+                    </button>
+                </div>
+            </td>
+        `;
+        
+        tableBody.appendChild(row);
+    });
+}
+
+// Update priests count
+function updatePriestsCount(count) {
+    const countElement = document.getElementById('priestsCount');
+    if (countElement) {
+        countElement.textContent = `${count} ${count === 1 ? 'Priest' : 'Priests'}`;
+    }
+}
+
+// Add New Priest Function - Updated to use API
+function addNewPriest() {
+    const form = document.getElementById('addPriestForm');
+    const formData = new FormData(form);
+    
+    const priestData = {
+        full_name: formData.get('full_name'),
+        email: formData.get('email'),
+        phone: formData.get('phone'),
+        specialization: formData.get('specialization'),
+        status: formData.get('status') || 'active'
+    };
+
+    console.log('Adding new priest:', priestData);
+    
+    // Show loading state
+    const confirmBtn = document.getElementById('confirmAddPriest');
+    const originalText = confirmBtn.innerHTML;
+    confirmBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Adding...';
+    confirmBtn.disabled = true;
+    
+    fetch('/api/priests', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(priestData)
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            showNotification('Priest added successfully!', 'success');
+            document.getElementById('addPriestModal').style.display = 'none';
+            loadPriestsData(); // Reload data
+        } else {
+            showNotification(data.error || 'Failed to add priest', 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error adding priest:', error);
+        showNotification('Error adding priest', 'error');
+    })
+    .finally(() => {
+        confirmBtn.innerHTML = originalText;
+        confirmBtn.disabled = false;
+    });
+}
+
+// Edit Priest Function - Updated to fetch real data
+function editPriest(priestId) {
+    console.log('Editing priest:', priestId);
+    
+    fetch(`/api/priests/${priestId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                const priest = data.data;
+                
+                // Populate edit form with real data
+                document.getElementById('editPriestId').value = priest.id;
+                document.getElementById('editPriestFullName').value = priest.full_name;
+                document.getElementById('editPriestEmail').value = priest.email;
+                document.getElementById('editPriestPhone').value = priest.phone || '';
+                document.getElementById('editPriestSpecialization').value = priest.specialization;
+                document.getElementById('editPriestStatus').value = priest.status;
+                
+                document.getElementById('editPriestModal').style.display = 'flex';
+            } else {
+                showNotification(data.error || 'Failed to load priest data', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading priest data:', error);
+            showNotification('Error loading priest data', 'error');
+        });
+}
+
+// Update Priest Function - Updated to use API
+function updatePriest() {
+    const form = document.getElementById('editPriestForm');
+    const formData = new FormData(form);
+    
+    const priestId = formData.get('priest_id');
+    const priestData = {
+        full_name: formData.get('full_name'),
+        email: formData.get('email'),
+        phone: formData.get('phone'),
+        specialization: formData.get('specialization'),
+        status: formData.get('status')
+    };
+
+    console.log('Updating priest:', priestData);
+    
+    // Show loading state
+    const confirmBtn = document.getElementById('confirmEditPriest');
+    const originalText = confirmBtn.innerHTML;
+    confirmBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Saving...';
+    confirmBtn.disabled = true;
+    
+    fetch(`/api/priests/${priestId}`, {
+        method: 'PUT',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify(priestData)
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            showNotification('Priest updated successfully!', 'success');
+            document.getElementById('editPriestModal').style.display = 'none';
+            loadPriestsData(); // Reload data
+        } else {
+            showNotification(data.error || 'Failed to update priest', 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error updating priest:', error);
+        showNotification('Error updating priest', 'error');
+    })
+    .finally(() => {
+        confirmBtn.innerHTML = originalText;
+        confirmBtn.disabled = false;
+    });
+}
+
+// Remove Priest Function - Updated to use API
+function removePriest(priestId) {
+    console.log('Removing priest:', priestId);
+    
+    // Fetch priest data to show in confirmation
+    fetch(`/api/priests/${priestId}`)
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                const priest = data.data;
+                
+                // Set priest info in delete modal
+                document.getElementById('deletePriestInfo').textContent = 
+                    `This will permanently remove ${priest.full_name} from the system.`;
+                
+                // Store priest ID for deletion
+                document.getElementById('deletePriestModal').setAttribute('data-priest-id', priestId);
+                document.getElementById('deletePriestModal').style.display = 'flex';
+                
+                // Reset checkbox
+                document.getElementById('confirmPriestDeletion').checked = false;
+                document.getElementById('confirmDeletePriest').disabled = true;
+            } else {
+                showNotification('Failed to load priest data', 'error');
+            }
+        })
+        .catch(error => {
+            console.error('Error loading priest data:', error);
+            showNotification('Error loading priest data', 'error');
+        });
+}
+
+// Confirm Delete Priest Function - Updated to use API
+function confirmDeletePriestAction() {
+    const priestId = document.getElementById('deletePriestModal').getAttribute('data-priest-id');
+    
+    console.log('Confirming priest deletion:', priestId);
+    
+    // Show loading state
+    const confirmBtn = document.getElementById('confirmDeletePriest');
+    const originalText = confirmBtn.innerHTML;
+    confirmBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Removing...';
+    confirmBtn.disabled = true;
+    
+    fetch(`/api/priests/${priestId}`, {
+        method: 'DELETE'
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            showNotification('Priest removed successfully!', 'success');
+            document.getElementById('deletePriestModal').style.display = 'none';
+            loadPriestsData(); // Reload data
+        } else {
+            showNotification(data.error || 'Failed to remove priest', 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Error removing priest:', error);
+        showNotification('Error removing priest', 'error');
+    })
+    .finally(() => {
+        confirmBtn.innerHTML = originalText;
+        confirmBtn.disabled = false;
+    });
+}
+
+// Refresh Priests Function - Updated to reload from database
+function refreshPriests() {
+    console.log('Refreshing priests data...');
+    
+    const refreshBtn = document.getElementById('refreshPriestsBtn');
+    if (refreshBtn) {
+        refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Refreshing...';
+        refreshBtn.disabled = true;
+        
+        loadPriestsData();
+        
+        setTimeout(() => {
+            refreshBtn.innerHTML = '<i class="fas fa-sync-alt"></i> Refresh';
+            refreshBtn.disabled = false;
+        }, 1000);
+    }
+}
+
+// Initialize priest management when the module is shown
+(function() {
+    initializePriestManagement();
+    
+    // Load priests data when the section loads
+    loadPriestsData();
+})();
@@ -0,0 +1,218 @@
+// ChurchEase Admin - Reports & Analytics
+// Loaded the first time the tab is opened, right after templates/admin/reports.html
+// has been inserted into the page.
+
+// ============================================================================
+// REPORTS MODULE FUNCTIONALITY
+// ============================================================================
+
+let reportsCharts = {
+    monthlyReservations: null,
+    serviceDistribution: null,
+    revenueTrends: null,
+    paymentStatus: null
+};
+
+// loadReportsSummary() and the chart loaders are shared with the Financial
+// Reports tab and live in financial-reports.js, which is loaded first.
+
+// Load recent activity data
+async function loadRecentActivity() {
+    try {
+        // Get recent reservations and payments
+        const [reservationsResponse, paymentsResponse] = await Promise.all([
+            fetch('/api/reservations'),
+            fetch('/api/stipendium/payments?per_page=5')
+        ]);
+        
+        const reservationsData = await reservationsResponse.json();
+        const paymentsData = await paymentsResponse.json();
+        
+        const tableBody = document.getElementById('reportsActivityTableBody');
+        if (tableBody) {
+            tableBody.innerHTML = '';
+            
+            // Combine and sort activities
+            const activities = [];
+            
+            // Add recent reservations
+            if (reservationsData.success) {
+                reservationsData.data.slice(0, 5).forEach(reservation => {
+                    activities.push({
+                        date: new Date(reservation.created_at),
+                        type: 'Reservation',
+                        service: reservation.service_type,
+                        client: reservation.contact_name || 'N/A',
+                        amount: '-',
+                        status: reservation.status
+                    });
+                });
+            }
+            
+            // Add recent payments
+            if (paymentsData.success) {
+                paymentsData.data.slice(0, 5).forEach(payment => {
+                    activities.push({
+                        date: new Date(payment.created_at),
+                        type: 'Payment',
+                        service: payment.service_type,
+                        client: payment.client_name || 'N/A',
+                        amount: `₱${payment.amount_paid.toLocaleString()}`,
+                        status: payment.payment_status
+                    });
+                });
+            }
+            
+            // Sort by date (newest first)
+            activities.sort((a, b) => b.date - a.date);
+            
+            // Display top 10 activities
+            activities.slice(0, 10).forEach(activity => {
+                const row = document.createElement('tr');
+                
+                const statusClass = activity.status === 'approved' || activity.status === 'Paid' ? 'status-confirmed' :
+                                  activity.status === 'pending' || activity.status === 'Pending' ? 'status-pending' :
+                                  activity.status === 'Partial' ? 'status-warning' : 'status-cancelled';
+                
+                row.innerHTML = `
+                    <td>${activity.date.toLocaleDateString()}</td>
+                    <td>${activity.type}</td>
+                    <td><span class="service-badge ${activity.service.toLowerCase()}">${activity.service.charAt(0).toUpperCase() + activity.service.slice(1)}</span></td>
+                    <td>${activity.client}</td>
+                    <td>${activity.amount}</td>
+                    <td><span class="status-badge ${statusClass}">${activity.status}</span></td>
+                `;
+                
+                tableBody.appendChild(row);
+            });
+            
+            if (activities.length === 0) {
+                tableBody.innerHTML = `
+                    <tr>
+                        <td colspan="6" style="text-align: center; padding: 40px; color: #64748b;">
+                            No recent activity found
+                        </td>
+                    </tr>
+                `;
+            }
+        }
+    } catch (error) {
+        console.error('Error loading recent activity:', error);
+        const tableBody = document.getElementById('reportsActivityTableBody');
+        if (tableBody) {
+            tableBody.innerHTML = `
+                <tr>
+                    <td colspan="6" style="text-align: center; padding: 40px; color: #ef4444;">
+                        Error loading activity data
+                    </td>
+                </tr>
+            `;
+        }
+    }
+}
+
+// Generate insights
+async function generateInsights() {
+    try {
+        const [summaryResponse, serviceResponse] = await Promise.all([
+            fetch('/api/reports/summary'),
+            fetch('/api/reports/service-distribution')
+        ]);
+        
+        const summaryData = await summaryResponse.json();
+        const serviceData = await serviceResponse.json();
+        
+        if (summaryData.success && serviceData.success) {
+            const summary = summaryData.data;
+            const services = serviceData.data;
+            
+            // Growth insight
+            const growthInsight = summary.reservation_growth >= 10 ? 
+                `Excellent growth! Reservations increased by ${summary.reservation_growth}% this month.` :
+                summary.reservation_growth >= 0 ?
+                `Steady progress with ${summary.reservation_growth}% growth in reservations.` :
+                `Reservations decreased by ${Math.abs(summary.reservation_growth)}%. Consider promotional activities.`;
+            
+            document.getElementById('growth-insight').textContent = growthInsight;
+            
+            // Popular services insight
+            const maxIndex = services.counts.indexOf(Math.max(...services.counts));
+            const popularService = services.labels[maxIndex];
+            const popularCount = services.counts[maxIndex];
+            
+            document.getElementById('popular-services-insight').textContent = 
+                `${popularService} is the most popular service with ${popularCount} reservations.`;
+            
+            // Revenue insight
+            const revenueInsight = summary.revenue_growth >= 15 ?
+                `Outstanding revenue growth of ${summary.revenue_growth}%! Financial performance is excellent.` :
+                summary.revenue_growth >= 0 ?
+                `Revenue increased by ${summary.revenue_growth}%. Continue current strategies.` :
+                `Revenue declined by ${Math.abs(summary.revenue_growth)}%. Review pricing and collection processes.`;
+            
+            document.getElementById('revenue-insight').textContent = revenueInsight;
+        }
+    } catch (error) {
+        console.error('Error generating insights:', error);
+    }
+}
+
+// Refresh all reports data
+async function refreshReportsData() {
+    const refreshBtn = document.getElementById('refreshReportsBtn');
+    if (refreshBtn) {
+        const originalContent = refreshBtn.innerHTML;
+        refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Refreshing...';
+        refreshBtn.disabled = true;
+        
+        try {
+            await Promise.all([
+                loadReportsSummary(),
+                loadMonthlyReservationsChart(),
+                loadServiceDistributionChart(),
+                loadRevenueTrendsChart(),
+                loadPaymentStatusChart(),
+                loadRecentActivity(),
+                generateInsights()
+            ]);
+            
+            // Show success state
+            refreshBtn.innerHTML = '<i class="fas fa-check"></i> Updated!';
+            refreshBtn.style.background = 'linear-gradient(135deg, #10b981 0%, #059669 100%)';
+            
+            setTimeout(() => {
+                refreshBtn.innerHTML = originalContent;
+                refreshBtn.style.background = '';
+                refreshBtn.disabled = false;
+            }, 2000);
+            
+        } catch (error) {
+            console.error('Error refreshing reports data:', error);
+            refreshBtn.innerHTML = '<i class="fas fa-exclamation-triangle"></i> Error';
+            refreshBtn.style.background = 'linear-gradient(135deg, #ef4444 0%, #dc2626 100%)';
+            
+            setTimeout(() => {
+                refreshBtn.innerHTML = originalContent;
+                refreshBtn.style.background = '';
+                refreshBtn.disabled = false;
+            }, 3000);
+        }
+    }
+}
+
+// Initialize reports when module is shown
+function initializeReports() {
+    loadReportsSummary();
+    loadMonthlyReservationsChart();
+    loadServiceDistributionChart();
+    loadRevenueTrendsChart();
+    loadPaymentStatusChart();
+    loadRecentActivity();
+    generateInsights();
+    
+    // Add refresh button event listener
+    const refreshBtn = document.getElementById('refreshReportsBtn');
+    if (refreshBtn) {
+        refreshBtn.addEventListener('click', refreshReportsData);
+    }
+}
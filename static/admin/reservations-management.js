@@ -0,0 +1,239 @@
+// ChurchEase Admin - Reservations Management
+// Loaded the first time the tab is opened, right after templates/admin/reservations-management.html
+// has been inserted into the page.
+
+// Reservations Management Module Functions
+let allAdminReservations = []; // Store all reservations for filtering
+
+async function loadRecentReservationsTable() {
+    try {
+        console.log('Loading recent reservations table...');
+        const response = await fetch('/api/reservations/all');
+        const result = await response.json();
+        
+        if (result.success) {
+            allAdminReservations = result.data; // Store all reservations
+            displayAdminReservations(allAdminReservations.slice(0, 10)); // Show latest 10
+            updateAdminSearchCount(allAdminReservations.length, allAdminReservations.length);
+            
+            // Load stats cards for Reservations Management module
+            loadReservationsMgmtStats(result.data);
+        } else {
+            console.error('Failed to load reservations:', result.error);
+        }
+    } catch (error) {
+        console.error('Error loading recent reservations table:', error);
+        const tableBody = document.getElementById('recentReservationsTableBody');
+        if (tableBody) {
+            tableBody.innerHTML = `
+                <tr>
+                    <td colspan="9" style="text-align: center; padding: 40px; color: #ef4444;">
+                        <i class="fas fa-exclamation-triangle" style="font-size: 24px;"></i>
+                        <p style="margin-top: 12px;">Failed to load reservations. Please try again.</p>
+                    </td>
+                </tr>
+            `;
+        }
+    }
+}
+
+// Load Reservations Management Stats Cards
+function loadReservationsMgmtStats(reservations) {
+    const now = new Date();
+    const currentMonth = now.getMonth();
+    const currentYear = now.getFullYear();
+    
+    // Calculate week start (Sunday)
+    const weekStart = new Date(now);
+    weekStart.setDate(now.getDate() - now.getDay());
+    weekStart.setHours(0, 0, 0, 0);
+    
+    // Total reservations
+    const totalReservations = reservations.length;
+    
+    // Pending approvals
+    const pendingApprovals = reservations.filter(r => r.status === 'pending').length;
+    
+    // Confirmed this month
+    const confirmedThisMonth = reservations.filter(r => {
+        const resDate = new Date(r.reservation_date || r.date);
+        return (r.status === 'approved' || r.status === 'confirmed') &&
+               resDate.getMonth() === currentMonth &&
+               resDate.getFullYear() === currentYear;
+    }).length;
+    
+    // This week's upcoming reservations
+    const thisWeekReservations = reservations.filter(r => {
+        const resDate = new Date(r.reservation_date || r.date);
+        return resDate >= weekStart && resDate >= now;
+    }).length;
+    
+    // Calculate growth (current month vs previous month)
+    const prevMonth = currentMonth === 0 ? 11 : currentMonth - 1;
+    const prevYear = currentMonth === 0 ? currentYear - 1 : currentYear;
+    
+    const currentMonthCount = reservations.filter(r => {
+        if (!r.created_at) return false;
+        const createdDate = new Date(r.created_at);
+        return createdDate.getMonth() === currentMonth && createdDate.getFullYear() === currentYear;
+    }).length;
+    
+    const prevMonthCount = reservations.filter(r => {
+        if (!r.created_at) return false;
+        const createdDate = new Date(r.created_at);
+        return createdDate.getMonth() === prevMonth && createdDate.getFullYear() === prevYear;
+    }).length;
+    
+    const growthRate = prevMonthCount > 0 ? 
+        ((currentMonthCount - prevMonthCount) / prevMonthCount * 100).toFixed(1) : 0;
+    
+    // Update stat cards
+    document.getElementById('reservationsMgmt-total').textContent = totalReservations;
+    document.getElementById('reservationsMgmt-pending').textContent = pendingApprovals;
+    document.getElementById('reservationsMgmt-confirmed').textContent = confirmedThisMonth;
+    document.getElementById('reservationsMgmt-thisWeek').textContent = thisWeekReservations;
+    
+    // Update growth indicator
+    const growthElement = document.getElementById('reservationsMgmt-growth');
+    if (growthElement) {
+        growthElement.textContent = `${growthRate > 0 ? '+' : ''}${growthRate}%`;
+        growthElement.className = `stat-trend ${growthRate >= 0 ? 'trend-up' : 'trend-down'}`;
+    }
+    
+    console.log('✅ Reservations Management stats loaded from database');
+}
+
+function displayAdminReservations(reservations) {
+    const tableBody = document.getElementById('recentReservationsTableBody');
+    
+    if (!tableBody) return;
+    
+    tableBody.innerHTML = '';
+    
+    if (reservations.length === 0) {
+        tableBody.innerHTML = `
+            <tr>
+                <td colspan="9" style="text-align: center; padding: 40px; color: #6b7280;">
+                    <i class="fas fa-search" style="font-size: 24px;"></i>
+                    <p style="margin-top: 12px;">No matching reservations found</p>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+    
+    reservations.forEach(reservation => {
+        const row = document.createElement('tr');
+        row.innerHTML = `
+            <td>${reservation.reservation_id || reservation.id}</td>
+            <td>${reservation.contact_name}</td>
+            <td><span class="service-badge ${reservation.service_type}">${reservation.service_type}</span></td>
+            <td>${new Date(reservation.date).toLocaleDateString()}</td>
+            <td>${reservation.time_slot || reservation.time}</td>
+            <td>${reservation.priest_name || 'Not Assigned'}</td>
+            <td><span class="status-badge status-${reservation.status}">${reservation.status.toUpperCase()}</span></td>
+            <td><strong>${reservation.created_by_secretary || 'System'}</strong></td>
+            <td class="table-actions">
+                <button class="action-btn" data-action="view" data-reservation-id="${reservation.id}" title="View Details">
+                    <i class="fas fa-eye"></i>
+                </button>
+                <button class="action-btn" data-action="edit" data-reservation-id="${reservation.id}" title="Edit">
+                    <i class="fas fa-edit"></i>
+                </button>
+            </td>
+        `;
+        tableBody.appendChild(row);
+    });
+    
+    console.log(`✅ Displayed ${reservations.length} reservations`);
+}
+
+function updateAdminSearchCount(showing, total) {
+    const countElement = document.getElementById('adminSearchResultCount');
+    if (countElement) {
+        if (showing === total) {
+            countElement.textContent = `Showing ${showing} of ${total} reservations`;
+        } else {
+            countElement.textContent = `Found ${showing} of ${total} reservations`;
+        }
+    }
+}
+
+function filterAdminReservations(searchTerm) {
+    console.log('🔍 Admin search term:', searchTerm);
+    
+    if (!searchTerm || searchTerm.trim() === '') {
+        // Show all reservations (latest 10)
+        displayAdminReservations(allAdminReservations.slice(0, 10));
+        updateAdminSearchCount(allAdminReservations.length, allAdminReservations.length);
+        return;
+    }
+    
+    const term = searchTerm.toLowerCase().trim();
+    
+    const filtered = allAdminReservations.filter(reservation => {
+        // Search in client name
+        const clientName = (reservation.contact_name || '').toString().toLowerCase();
+        
+        // Search in phone number
+        const phone = (reservation.contact_phone || '').toString().toLowerCase();
+        
+        // Search in service type
+        const serviceType = (reservation.service_type || '').toString().toLowerCase();
+        
+        // Search in reservation ID
+        const reservationId = (reservation.reservation_id || reservation.id || '').toString().toLowerCase();
+        
+        // Search in priest name
+        const priestName = (reservation.priest_name || '').toString().toLowerCase();
+        
+        // Search in created by
+        const createdBy = (reservation.created_by_secretary || '').toString().toLowerCase();
+        
+        return clientName.includes(term) || 
+               phone.includes(term) || 
+               serviceType.includes(term) || 
+               reservationId.includes(term) ||
+               priestName.includes(term) ||
+               createdBy.includes(term);
+    });
+    
+    console.log(`✅ Found ${filtered.length} matching reservations`);
+    displayAdminReservations(filtered);
+    updateAdminSearchCount(filtered.length, allAdminReservations.length);
+}
+
+
+// Search box and buttons (bound once, when this section is loaded)
+(function() {
+    // Admin Dashboard Search Functionality
+    const adminSearchInput = document.getElementById('adminReservationSearch');
+    if (adminSearchInput) {
+        console.log('Admin search input found, adding event listener');
+        adminSearchInput.addEventListener('input', function(e) {
+            const query = e.target.value;
+            console.log('Admin search input:', query);
+            
+            filterAdminReservations(query);
+            
+            // Show/hide clear button
+            const clearBtn = document.getElementById('adminClearSearch');
+            if (clearBtn) {
+                clearBtn.style.display = query.trim() ? 'block' : 'none';
+            }
+        });
+    }
+    
+    // Admin Clear search button
+    const adminClearBtn = document.getElementById('adminClearSearch');
+    if (adminClearBtn) {
+        adminClearBtn.addEventListener('click', function() {
+            const searchInput = document.getElementById('adminReservationSearch');
+            if (searchInput) {
+                searchInput.value = '';
+                filterAdminReservations('');
+                this.style.display = 'none';
+            }
+        });
+    }
+})();
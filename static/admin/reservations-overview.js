@@ -0,0 +1,288 @@
+// ChurchEase Admin - Reservations Overview
+// Loaded the first time the tab is opened, right after templates/admin/reservations-overview.html
+// has been inserted into the page.
+
+// Reservations Overview Module Functions
+let allOverviewReservations = []; // Store all reservations for filtering
+
+async function initializeReservationsOverview() {
+    console.log('Initializing Reservations Overview module...');
+    await loadReservationsOverviewData();
+}
+
+async function loadReservationsOverviewData() {
+    try {
+        // Load dashboard stats for overview cards
+        const statsResponse = await fetch('/api/admin/dashboard-stats');
+        const statsResult = await statsResponse.json();
+        
+        if (statsResult.success) {
+            const data = statsResult.data;
+            document.getElementById('overview-total-reservations').textContent = data.total_reservations;
+            document.getElementById('overview-approved-reservations').textContent = data.approved_reservations;
+            document.getElementById('overview-pending-reservations').textContent = data.pending_reservations;
+        }
+        
+        // Load reservations table data
+        const reservationsResponse = await fetch('/api/reservations/all');
+        const reservationsResult = await reservationsResponse.json();
+        
+        if (reservationsResult.success) {
+            allOverviewReservations = reservationsResult.data; // Store all reservations
+            displayOverviewReservations(allOverviewReservations.slice(0, 20)); // Show latest 20
+            updateOverviewSearchCount(allOverviewReservations.length, allOverviewReservations.length);
+        }
+    } catch (error) {
+        console.error('Error loading reservations overview data:', error);
+    }
+}
+
+function displayOverviewReservations(reservations) {
+    const tableBody = document.getElementById('reservationsOverviewTableBody');
+    
+    if (!tableBody) return;
+    
+    tableBody.innerHTML = '';
+    
+    if (reservations.length === 0) {
+        tableBody.innerHTML = `
+            <tr>
+                <td colspan="11" style="text-align: center; padding: 40px; color: #6b7280;">
+                    <i class="fas fa-search" style="font-size: 24px;"></i>
+                    <p style="margin-top: 12px;">No matching reservations found</p>
+                </td>
+            </tr>
+        `;
+        return;
+    }
+    
+    reservations.forEach(reservation => {
+        const row = document.createElement('tr');
+        
+        // Get stipendium badge
+        const stipendiumBadge = getOverviewStipendiumBadge(reservation);
+        
+        // Get attendance badge
+        const attendanceBadge = getOverviewAttendanceBadge(reservation.attendance_status || 'pending');
+        
+        row.innerHTML = `
+            <td>${reservation.reservation_id || reservation.id}</td>
+            <td>${reservation.contact_name}</td>
+            <td><span class="service-badge ${reservation.service_type}">${reservation.service_type}</span></td>
+            <td>${new Date(reservation.date).toLocaleDateString()}</td>
+            <td>${reservation.time_slot || reservation.time}</td>
+            <td>${reservation.priest_name || 'Not Assigned'}</td>
+            <td><span class="status-badge status-${reservation.status}">${reservation.status.toUpperCase()}</span></td>
+            <td>${stipendiumBadge}</td>
+            <td>${attendanceBadge}</td>
+            <td>${reservation.created_by_secretary || 'System'}</td>
+            <td class="table-actions">
+                <button class="action-btn" data-action="view" data-reservation-id="${reservation.id}" title="View Details">
+                    <i class="fas fa-eye"></i>
+                </button>
+            </td>
+        `;
+        tableBody.appendChild(row);
+    });
+    
+    console.log(`✅ Displayed ${reservations.length} reservations in overview`);
+}
+
+function updateOverviewSearchCount(showing, total) {
+    const countElement = document.getElementById('overviewSearchResultCount');
+    if (countElement) {
+        if (showing === total) {
+            countElement.textContent = `Showing ${showing} of ${total} reservations`;
+        } else {
+            countElement.textContent = `Found ${showing} of ${total} reservations`;
+        }
+    }
+}
+
+// Helper function to get stipendium badge
+function getOverviewStipendiumBadge(reservation) {
+    // Check if this is a Confirmation service - ALWAYS show N/A
+    if (reservation.service_type === 'confirmation') {
+        return `<span class="stipendium-badge stipendium-na"><i class="fas fa-minus"></i> N/A</span>`;
+    }
+    
+    // For other services, check payment information
+    let hasPaymentInfo = false;
+    let stipendiumStatus = 'Pending';
+    let stipendiumClass = 'stipendium-pending';
+    let stipendiumIcon = 'fas fa-clock';
+    
+    if (reservation.payment_status) {
+        hasPaymentInfo = true;
+        stipendiumStatus = reservation.payment_status;
+    } else if (reservation.amount_paid && reservation.total_amount) {
+        hasPaymentInfo = true;
+        const amountPaid = parseFloat(reservation.amount_paid);
+        const totalAmount = parseFloat(reservation.total_amount);
+        
+        if (amountPaid >= totalAmount) {
+            stipendiumStatus = 'Paid';
+        } else if (amountPaid > 0) {
+            stipendiumStatus = 'Partial';
+        }
+    } else if (reservation.payment_method || reservation.payment_type || reservation.gcash_reference) {
+        hasPaymentInfo = true;
+        if (reservation.status === 'confirmed' || reservation.status === 'completed') {
+            stipendiumStatus = 'Paid';
+        }
+    }
+    
+    // Set appropriate class and icon based on status
+    switch (stipendiumStatus.toLowerCase()) {
+        case 'paid':
+            stipendiumClass = 'stipendium-paid';
+            stipendiumIcon = 'fas fa-check-circle';
+            stipendiumStatus = 'FULL STIPENDIUM';
+            break;
+        case 'partial':
+            stipendiumClass = 'stipendium-partial';
+            stipendiumIcon = 'fas fa-exclamation-triangle';
+            stipendiumStatus = 'PARTIAL STIPENDIUM';
+            break;
+        case 'pending':
+        default:
+            stipendiumClass = 'stipendium-pending';
+            stipendiumIcon = 'fas fa-clock';
+            stipendiumStatus = 'PENDING STIPENDIUM';
+            break;
+    }
+    
+    return `<span class="stipendium-badge ${stipendiumClass}"><i class="${stipendiumIcon}"></i> ${stipendiumStatus}</span>`;
+}
+
+// Helper function to get attendance badge
+function getOverviewAttendanceBadge(status) {
+    switch(status) {
+        case 'attended':
+            return '<span class="attendance-badge attended"><i class="fas fa-check"></i> ATTENDED</span>';
+        case 'no_show':
+            return '<span class="attendance-badge no-show"><i class="fas fa-times"></i> NO-SHOW</span>';
+        case 'cancelled':
+            return '<span class="attendance-badge cancelled"><i class="fas fa-ban"></i> CANCELLED</span>';
+        case 'pending':
+        default:
+            return '<span class="attendance-badge pending"><i class="fas fa-clock"></i> PENDING</span>';
+    }
+}
+
+function filterOverviewReservations(searchTerm) {
+    console.log('🔍 Overview search term:', searchTerm);
+    
+    if (!searchTerm || searchTerm.trim() === '') {
+        // Show all reservations (latest 20)
+        displayOverviewReservations(allOverviewReservations.slice(0, 20));
+        updateOverviewSearchCount(allOverviewReservations.length, allOverviewReservations.length);
+        return;
+    }
+    
+    const term = searchTerm.toLowerCase().trim();
+    
+    const filtered = allOverviewReservations.filter(reservation => {
+        // Search in client name
+        const clientName = (reservation.contact_name || '').toString().toLowerCase();
+        
+        // Search in phone number
+        const phone = (reservation.contact_phone || '').toString().toLowerCase();
+        
+        // Search in service type
+        const serviceType = (reservation.service_type || '').toString().toLowerCase();
+        
+        // Search in reservation ID
+        const reservationId = (reservation.reservation_id || reservation.id || '').toString().toLowerCase();
+        
+        // Search in priest name
+        const priestName = (reservation.priest_name || '').toString().toLowerCase();
+        
+        // Search in created by
+        const createdBy = (reservation.created_by_secretary || '').toString().toLowerCase();
+        
+        return clientName.includes(term) || 
+               phone.includes(term) || 
+               serviceType.includes(term) || 
+               reservationId.includes(term) ||
+               priestName.includes(term) ||
+               createdBy.includes(term);
+    });
+    
+    console.log(`✅ Found ${filtered.length} matching reservations`);
+    displayOverviewReservations(filtered);
+    updateOverviewSearchCount(filtered.length, allOverviewReservations.length);
+}
+
+
+// Search box and buttons (bound once, when this section is loaded)
+(function() {
+    
+    // Reservations Overview Search Functionality
+    const overviewSearchInput = document.getElementById('overviewReservationSearch');
+    if (overviewSearchInput) {
+        console.log('Overview search input found, adding event listener');
+        overviewSearchInput.addEventListener('input', function(e) {
+            const query = e.target.value;
+            console.log('Overview search input:', query);
+            
+            filterOverviewReservations(query);
+            
+            // Show/hide clear button
+            const clearBtn = document.getElementById('overviewClearSearch');
+            if (clearBtn) {
+                clearBtn.style.display = query.trim() ? 'block' : 'none';
+            }
+        });
+    }
+    
+    // Overview Clear search button
+    const overviewClearBtn = document.getElementById('overviewClearSearch');
+    if (overviewClearBtn) {
+        overviewClearBtn.addEventListener('click', function() {
+            const searchInput = document.getElementById('overviewReservationSearch');
+            if (searchInput) {
+                searchInput.value = '';
+                filterOverviewReservations('');
+                this.style.display = 'none';
+            }
+        });
+    }
+    
+    // Reservations Overview Refresh Button
+    const refreshOverviewBtn = document.getElementById('refreshReservationsOverviewBtn');
+    if (refreshOverviewBtn) {
+        refreshOverviewBtn.addEventListener('click', async function() {
+            const icon = this.querySelector('i');
+            const originalHTML = this.innerHTML;
+            
+            // Show loading state
+            this.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Refreshing...';
+            this.disabled = true;
+            
+            try {
+                await loadReservationsOverviewData();
+                
+                // Show success state
+                this.innerHTML = '<i class="fas fa-check"></i> Updated!';
+                this.style.background = 'linear-gradient(135deg, #10b981 0%, #059669 100%)';
+                
+                setTimeout(() => {
+                    this.innerHTML = originalHTML;
+                    this.style.background = '';
+                    this.disabled = false;
+                }, 2000);
+            } catch (error) {
+                console.error('Error refreshing overview:', error);
+                this.innerHTML = '<i class="fas fa-exclamation-triangle"></i> Error';
+                this.style.background = 'linear-gradient(135deg, #ef4444 0%, #dc2626 100%)';
+                
+                setTimeout(() => {
+                    this.innerHTML = originalHTML;
+                    this.style.background = '';
+                    this.disabled = false;
+                }, 2000);
+            }
+        });
+    }
+})();
@@ -0,0 +1,12 @@
+// ChurchEase Admin - Settings
+// Loaded the first time the tab is opened, right after templates/admin/settings.html
+// has been inserted into the page.
+
+// Settings Module Functions
+function initializeSettings() {
+    console.log('Initializing Settings module...');
+    // Settings initialization can be added here
+}
+
+// Settings tabs
+initializeReservationTabs(document.getElementById('settingsModule'));
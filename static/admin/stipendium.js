@@ -0,0 +1,372 @@
+// ChurchEase Admin - Stipendium Tracking
+// Loaded the first time the tab is opened (the section has no markup of its own).
+
+// ============================================================================
+// STIPENDIUM TRACKING FUNCTIONALITY
+// ============================================================================
+
+let stipendiumChart = null;
+
+// Load stipendium summary data
+async function loadStipendiumSummary() {
+    try {
+        const response = await fetch('/api/stipendium/summary');
+        const data = await response.json();
+        
+        if (data.success) {
+            const summary = data.data;
+            
+            // Update summary cards
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(1) .stat-value').textContent = `₱${summary.total_stipendium.toLocaleString()}`;
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(1) .stat-trend').textContent = `${summary.stipendium_growth >= 0 ? '+' : ''}${summary.stipendium_growth}%`;
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(1) .stat-trend').className = `stat-trend ${summary.stipendium_growth >= 0 ? 'trend-up' : 'trend-down'}`;
+            
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(2) .stat-value').textContent = summary.paid_reservations;
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(3) .stat-value').textContent = summary.pending_payments;
+            document.querySelector('#stipendiumTrackingModule .stat-card:nth-child(4) .stat-value').textContent = `₱${summary.average_payment.toLocaleString()}`;
+        }
+    } catch (error) {
+        console.error('Error loading stipendium summary:', error);
+    }
+}
+
+// The payments ledger is served a page at a time; filters, sorting and the
+// totals over every matching payment are all worked out by the server.
+const stipendiumLedger = {
+    page: 1,
+    perPage: 50,
+    filters: {
+        start_date: '',
+        end_date: '',
+        service_type: '',
+        payment_status: '',
+        payment_method: ''
+    }
+};
+
+function formatPeso(amount) {
+    return `₱${Number(amount || 0).toLocaleString()}`;
+}
+
+// Filter bar above the ledger table and pager below it, created once
+function ensureStipendiumLedgerControls(tableBody) {
+    const table = tableBody.closest('table');
+    if (!table || document.getElementById('stipendiumLedgerFilters')) return;
+    
+    const filters = document.createElement('div');
+    filters.id = 'stipendiumLedgerFilters';
+    filters.className = 'table-controls';
+    filters.innerHTML = `
+        <input type="date" name="start_date" title="Recorded from">
+        <input type="date" name="end_date" title="Recorded until">
+        <select name="service_type">
+            <option value="">All Services</option>
+            <option value="wedding">Wedding</option>
+            <option value="baptism">Baptism</option>
+            <option value="funeral">Funeral</option>
+            <option value="confirmation">Confirmation</option>
+        </select>
+        <select name="payment_status">
+            <option value="">All Statuses</option>
+            <option value="Paid">Fully Paid</option>
+            <option value="Partial">Partial Payment</option>
+            <option value="Pending">Pending Payment</option>
+        </select>
+        <select name="payment_method">
+            <option value="">All Methods</option>
+            <option value="Cash">Cash</option>
+            <option value="GCash">GCash</option>
+        </select>
+    `;
+    table.parentNode.insertBefore(filters, table);
+    filters.addEventListener('change', (event) => {
+        const name = event.target.name;
+        if (name in stipendiumLedger.filters) {
+            stipendiumLedger.filters[name] = event.target.value;
+            stipendiumLedger.page = 1;
+            loadStipendiumPayments();
+        }
+    });
+    
+    const pager = document.createElement('div');
+    pager.id = 'stipendiumLedgerPager';
+    pager.className = 'table-pagination';
+    pager.innerHTML = `
+        <div class="pagination-info" id="stipendiumLedgerInfo"></div>
+        <div class="pagination-controls">
+            <button class="pagination-btn" data-page="prev" title="Previous page">
+                <i class="fas fa-chevron-left"></i>
+            </button>
+            <span class="pagination-info" id="stipendiumLedgerPage"></span>
+            <button class="pagination-btn" data-page="next" title="Next page">
+                <i class="fas fa-chevron-right"></i>
+            </button>
+            <select id="stipendiumLedgerPerPage" title="Rows per page">
+                <option value="25">25 / page</option>
+                <option value="50" selected>50 / page</option>
+                <option value="100">100 / page</option>
+                <option value="200">200 / page</option>
+            </select>
+        </div>
+    `;
+    table.parentNode.insertBefore(pager, table.nextSibling);
+    pager.addEventListener('click', (event) => {
+        const button = event.target.closest('[data-page]');
+        if (!button || button.disabled) return;
+        stipendiumLedger.page += button.dataset.page === 'next' ? 1 : -1;
+        loadStipendiumPayments();
+    });
+    pager.querySelector('#stipendiumLedgerPerPage').addEventListener('change', (event) => {
+        stipendiumLedger.perPage = Number(event.target.value);
+        stipendiumLedger.page = 1;
+        loadStipendiumPayments();
+    });
+}
+
+// Page position and the server's totals for everything the filters match
+function renderStipendiumLedgerFooter(pagination, totals) {
+    const info = document.getElementById('stipendiumLedgerInfo');
+    const pageLabel = document.getElementById('stipendiumLedgerPage');
+    const pager = document.getElementById('stipendiumLedgerPager');
+    if (!info || !pager) return;
+    
+    const first = pagination.total ? (pagination.page - 1) * pagination.per_page + 1 : 0;
+    const last = Math.min(pagination.page * pagination.per_page, pagination.total);
+    info.textContent = `Showing ${first}-${last} of ${pagination.total} payments · ` +
+        `Due ${formatPeso(totals.amount_due)} · Paid ${formatPeso(totals.amount_paid)} · ` +
+        `Outstanding ${formatPeso(totals.outstanding)}`;
+    pageLabel.textContent = `Page ${pagination.page} of ${Math.max(pagination.pages, 1)}`;
+    pager.querySelector('[data-page="prev"]').disabled = pagination.page <= 1;
+    pager.querySelector('[data-page="next"]').disabled = pagination.page >= pagination.pages;
+}
+
+// Load payment records table
+async function loadStipendiumPayments() {
+    const tableBody = document.getElementById('stipendiumTableBody');
+    if (!tableBody) return;
+    ensureStipendiumLedgerControls(tableBody);
+    
+    const params = new URLSearchParams({ page: stipendiumLedger.page, per_page: stipendiumLedger.perPage });
+    Object.entries(stipendiumLedger.filters).forEach(([name, value]) => {
+        if (value) params.set(name, value);
+    });
+    
+    try {
+        const response = await fetch(`/api/stipendium/payments?${params}`);
+        const data = await response.json();
+        
+        if (data.success) {
+            const payments = data.data;
+            
+            // Past the last page (e.g. after rows were deleted): show the last one instead
+            if (!payments.length && data.pagination.page > 1 && data.pagination.pages) {
+                stipendiumLedger.page = data.pagination.pages;
+                return loadStipendiumPayments();
+            }
+            
+            tableBody.innerHTML = '';
+            
+            payments.forEach(payment => {
+                const row = document.createElement('tr');
+                
+                // Format payment status
+                let statusClass = 'status-pending';
+                let statusText = payment.payment_status;
+                
+                if (payment.payment_status === 'Paid') {
+                    statusClass = 'status-confirmed';
+                    statusText = 'Fully Paid';
+                } else if (payment.payment_status === 'Partial') {
+                    statusClass = 'status-pending';
+                    statusText = 'Partial Payment';
+                } else {
+                    statusClass = 'status-cancelled';
+                    statusText = 'Pending Payment';
+                }
+                
+                // Format service badge
+                const serviceBadge = `<span class="service-badge ${payment.service_type.toLowerCase()}">${payment.service_type.charAt(0).toUpperCase() + payment.service_type.slice(1)}</span>`;
+                
+                // Format date
+                const date = new Date(payment.created_at).toLocaleDateString('en-US', {
+                    year: 'numeric',
+                    month: 'short',
+                    day: 'numeric'
+                });
+                
+                row.innerHTML = `
+                    <td>#${payment.payment_id.substring(0, 8)}</td>
+                    <td>${payment.client_name || 'N/A'}</td>
+                    <td>${serviceBadge}</td>
+                    <td>₱${payment.amount_paid.toLocaleString()}</td>
+                    <td>₱${payment.amount_due.toLocaleString()}</td>
+                    <td><span class="status-badge ${statusClass}">${statusText}</span></td>
+                    <td>${payment.payment_method || '-'}</td>
+                    <td>${date}</td>
+                    <td class="table-actions">
+                        <button class="action-btn" data-action="view" title="View Details">
+                            <i class="fas fa-eye"></i>
+                        </button>
+                        <button class="action-btn" data-action="receipt" title="Print Receipt">
+                            <i class="fas fa-receipt"></i>
+                        </button>
+                        <button class="action-btn" data-action="edit" title="Edit Payment">
+                            <i class="fas fa-edit"></i>
+                        </button>
+                    </td>
+                `;
+                
+                tableBody.appendChild(row);
+            });
+            
+            renderStipendiumLedgerFooter(data.pagination, data.totals);
+        }
+    } catch (error) {
+        console.error('Error loading stipendium payments:', error);
+    }
+}
+
+// Load service breakdown chart
+async function loadStipendiumChart() {
+    try {
+        const response = await fetch('/api/stipendium/service-breakdown');
+        const data = await response.json();
+        
+        if (data.success) {
+            const chartData = data.data;
+            const ctx = document.getElementById('stipendiumServiceChart');
+            
+            if (ctx) {
+                // Destroy existing chart if it exists
+                if (stipendiumChart) {
+                    stipendiumChart.destroy();
+                }
+                
+                stipendiumChart = new Chart(ctx, {
+                    type: 'doughnut',
+                    data: {
+                        labels: chartData.labels,
+                        datasets: [{
+                            data: chartData.amounts,
+                            backgroundColor: [
+                                '#fbbf24', // Wedding - Gold
+                                '#60a5fa', // Baptism - Blue
+                                '#9ca3af', // Funeral - Gray
+                                '#c084fc'  // Confirmation - Purple
+                            ],
+                            borderWidth: 2,
+                            borderColor: '#ffffff'
+                        }]
+                    },
+                    options: {
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        plugins: {
+                            legend: {
+                                position: 'bottom',
+                                labels: {
+                                    padding: 20,
+                                    usePointStyle: true
+                                }
+                            },
+                            tooltip: {
+                                callbacks: {
+                                    label: function(context) {
+                                        const label = context.label || '';
+                                        const value = context.parsed;
+                                        return `${label}: ₱${value.toLocaleString()}`;
+                                    }
+                                }
+                            }
+                        }
+                    }
+                });
+            }
+        }
+    } catch (error) {
+        console.error('Error loading stipendium chart:', error);
+    }
+}
+
+// Load payment summary
+async function loadPaymentSummary() {
+    try {
+        const [serviceResponse, collectionResponse] = await Promise.all([
+            fetch('/api/stipendium/service-breakdown'),
+            fetch('/api/stipendium/collection-rate')
+        ]);
+        
+        const serviceData = await serviceResponse.json();
+        const collectionData = await collectionResponse.json();
+        
+        if (serviceData.success && collectionData.success) {
+            const services = serviceData.data;
+            const collection = collectionData.data;
+            
+            // Update payment summary
+            const summaryItems = document.querySelectorAll('#stipendiumTrackingModule .summary-item');
+            if (summaryItems.length >= 4) {
+                summaryItems[0].querySelector('.summary-value').textContent = `₱${services.amounts[0].toLocaleString()}`;
+                summaryItems[1].querySelector('.summary-value').textContent = `₱${services.amounts[1].toLocaleString()}`;
+                summaryItems[2].querySelector('.summary-value').textContent = `₱${services.amounts[2].toLocaleString()}`;
+                summaryItems[3].querySelector('.summary-value').textContent = `${collection.collection_rate}%`;
+            }
+        }
+    } catch (error) {
+        console.error('Error loading payment summary:', error);
+    }
+}
+
+// Refresh stipendium data
+async function refreshStipendiumData() {
+    const refreshBtn = document.getElementById('refreshStipendiumBtn');
+    if (refreshBtn) {
+        const originalContent = refreshBtn.innerHTML;
+        refreshBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> <span>Refreshing...</span>';
+        refreshBtn.disabled = true;
+        
+        try {
+            await Promise.all([
+                loadStipendiumSummary(),
+                loadStipendiumPayments(),
+                loadStipendiumChart(),
+                loadPaymentSummary()
+            ]);
+            
+            // Show success state
+            refreshBtn.innerHTML = '<i class="fas fa-check"></i> <span>Updated!</span>';
+            refreshBtn.style.background = 'linear-gradient(135deg, #10b981 0%, #059669 100%)';
+            
+            setTimeout(() => {
+                refreshBtn.innerHTML = originalContent;
+                refreshBtn.style.background = '';
+                refreshBtn.disabled = false;
+            }, 2000);
+            
+        } catch (error) {
+            console.error('Error refreshing stipendium data:', error);
+            refreshBtn.innerHTML = '<i class="fas fa-exclamation-triangle"></i> <span>Error</span>';
+            refreshBtn.style.background = 'linear-gradient(135deg, #ef4444 0%, #dc2626 100%)';
+            
+            setTimeout(() => {
+                refreshBtn.innerHTML = originalContent;
+                refreshBtn.style.background = '';
+                refreshBtn.disabled = false;
+            }, 3000);
+        }
+    }
+}
+
+// Initialize stipendium tracking when module is shown
+function initializeStipendiumTracking() {
+    loadStipendiumSummary();
+    loadStipendiumPayments();
+    loadStipendiumChart();
+    loadPaymentSummary();
+    
+    // Add refresh button event listener
+    const refreshBtn = document.getElementById('refreshStipendiumBtn');
+    if (refreshBtn) {
+        refreshBtn.addEventListener('click', refreshStipendiumData);
+    }
+}
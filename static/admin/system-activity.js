@@ -0,0 +1,48 @@
+// ChurchEase Admin - System Activity
+// Loaded the first time the tab is opened, right after templates/admin/system-activity.html
+// has been inserted into the page.
+
+// System Activity Module Functions
+async function initializeSystemActivity() {
+    console.log('Initializing System Activity module...');
+    await loadSystemActivity();
+}
+
+async function loadSystemActivity() {
+    try {
+        const response = await fetch('/api/admin/recent-activity');
+        const result = await response.json();
+        
+        if (result.success) {
+            const activities = result.data;
+            const activityList = document.getElementById('activityList');
+            
+            if (activityList) {
+                activityList.innerHTML = '';
+                
+                activities.forEach(activity => {
+                    const activityItem = document.createElement('div');
+                    activityItem.className = 'activity-item';
+                    activityItem.innerHTML = `
+                        <div class="activity-icon">
+                            <i class="fas fa-calendar-check"></i>
+                        </div>
+                        <div class="activity-content">
+                            <div class="activity-title">${activity.action}</div>
+                            <div class="activity-meta">
+                                <span class="activity-user">${activity.user}</span>
+                                <span class="activity-time">${new Date(activity.timestamp).toLocaleString()}</span>
+                            </div>
+                        </div>
+                        <div class="activity-status">
+                            <span class="status-badge status-${activity.status}">${activity.status}</span>
+                        </div>
+                    `;
+                    activityList.appendChild(activityItem);
+                });
+            }
+        }
+    } catch (error) {
+        console.error('Error loading system activity:', error);
+    }
+}
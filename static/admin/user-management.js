@@ -0,0 +1,709 @@
+// ChurchEase Admin - User Management
+// Loaded the first time the tab is opened, right after templates/admin/user-management.html
+// has been inserted into the page.
+
+// Toggle password visibility function
+function togglePasswordVisibility(inputId, button) {
+    const input = document.getElementById(inputId);
+    const icon = button.querySelector('i');
+    
+    if (input.type === 'password') {
+        input.type = 'text';
+        icon.classList.remove('fa-eye');
+        icon.classList.add('fa-eye-slash');
+        button.style.color = '#667eea';
+    } else {
+        input.type = 'password';
+        icon.classList.remove('fa-eye-slash');
+        icon.classList.add('fa-eye');
+        button.style.color = '#9ca3af';
+    }
+}
+
+// Add focus styles for password inputs
+(function() {
+    const passwordInputs = document.querySelectorAll('#resetNewPassword, #confirmNewPassword');
+    passwordInputs.forEach(input => {
+        input.addEventListener('focus', function() {
+            this.style.borderColor = '#667eea';
+            this.style.boxShadow = '0 0 0 3px rgba(102, 126, 234, 0.1)';
+        });
+        input.addEventListener('blur', function() {
+            this.style.borderColor = '#e5e7eb';
+            this.style.boxShadow = 'none';
+        });
+    });
+})();
+
+// User Management CRUD JavaScript
+(function() {
+    // Load users when page loads
+    loadUsers();
+    
+    // Add User Modal
+    const addUserBtn = document.getElementById('addUserBtn');
+    const addUserModal = document.getElementById('addUserModal');
+    const closeAddUserModal = document.getElementById('closeAddUserModal');
+    const cancelAddUser = document.getElementById('cancelAddUser');
+    const saveNewUser = document.getElementById('saveNewUser');
+
+    if (addUserBtn) {
+        addUserBtn.addEventListener('click', function() {
+            document.getElementById('addUserForm').reset();
+            addUserModal.style.display = 'flex';
+        });
+    }
+
+    if (closeAddUserModal) {
+        closeAddUserModal.addEventListener('click', function() {
+            addUserModal.style.display = 'none';
+        });
+    }
+
+    if (cancelAddUser) {
+        cancelAddUser.addEventListener('click', function() {
+            addUserModal.style.display = 'none';
+        });
+    }
+
+    if (saveNewUser) {
+        saveNewUser.addEventListener('click', function() {
+            createUser();
+        });
+    }
+
+    // View User Modal
+    const viewUserModal = document.getElementById('viewUserModal');
+    const closeViewUserModal = document.getElementById('closeViewUserModal');
+    const closeViewUser = document.getElementById('closeViewUser');
+    
+    if (closeViewUserModal) {
+        closeViewUserModal.addEventListener('click', function() {
+            viewUserModal.style.display = 'none';
+        });
+    }
+    
+    if (closeViewUser) {
+        closeViewUser.addEventListener('click', function() {
+            viewUserModal.style.display = 'none';
+        });
+    }
+
+    // Edit User Modal
+    const editUserModal = document.getElementById('editUserModal');
+    const closeEditUserModal = document.getElementById('closeEditUserModal');
+    const cancelEditUser = document.getElementById('cancelEditUser');
+    const saveEditUser = document.getElementById('saveEditUser');
+    
+    if (closeEditUserModal) {
+        closeEditUserModal.addEventListener('click', function() {
+            editUserModal.style.display = 'none';
+        });
+    }
+    
+    if (cancelEditUser) {
+        cancelEditUser.addEventListener('click', function() {
+            editUserModal.style.display = 'none';
+        });
+    }
+    
+    if (saveEditUser) {
+        saveEditUser.addEventListener('click', function() {
+            updateUser();
+        });
+    }
+
+    // Delete User Modal
+    const deleteUserModal = document.getElementById('deleteUserModal');
+    const closeDeleteUserModal = document.getElementById('closeDeleteUserModal');
+    const cancelDeleteUser = document.getElementById('cancelDeleteUser');
+    const confirmDeleteUserBtn = document.getElementById('confirmDeleteUser');
+    
+    if (closeDeleteUserModal) {
+        closeDeleteUserModal.addEventListener('click', function() {
+            deleteUserModal.style.display = 'none';
+        });
+    }
+    
+    if (cancelDeleteUser) {
+        cancelDeleteUser.addEventListener('click', function() {
+            deleteUserModal.style.display = 'none';
+        });
+    }
+    
+    if (confirmDeleteUserBtn) {
+        confirmDeleteUserBtn.addEventListener('click', function() {
+            confirmDeleteUser();
+        });
+    }
+
+    // Reset Password Modal
+    const resetPasswordModal = document.getElementById('resetPasswordModal');
+    const closeResetPasswordModal = document.getElementById('closeResetPasswordModal');
+    const cancelResetPassword = document.getElementById('cancelResetPassword');
+    const confirmResetPassword = document.getElementById('confirmResetPassword');
+    
+    if (closeResetPasswordModal) {
+        closeResetPasswordModal.addEventListener('click', function() {
+            resetPasswordModal.style.display = 'none';
+        });
+    }
+    
+    if (cancelResetPassword) {
+        cancelResetPassword.addEventListener('click', function() {
+            resetPasswordModal.style.display = 'none';
+        });
+    }
+    
+    if (confirmResetPassword) {
+        confirmResetPassword.addEventListener('click', function() {
+            confirmResetPassword();
+        });
+    }
+
+    // Close modals when clicking outside
+    window.addEventListener('click', function(e) {
+        if (e.target === addUserModal) {
+            addUserModal.style.display = 'none';
+        }
+        if (e.target === viewUserModal) {
+            viewUserModal.style.display = 'none';
+        }
+        if (e.target === editUserModal) {
+            editUserModal.style.display = 'none';
+        }
+        if (e.target === deleteUserModal) {
+            deleteUserModal.style.display = 'none';
+        }
+        if (e.target === resetPasswordModal) {
+            resetPasswordModal.style.display = 'none';
+        }
+    });
+
+
+
+    // User Search Functionality
+    const userSearchInput = document.getElementById('userSearchInput');
+    const clearUserSearch = document.getElementById('clearUserSearch');
+
+    if (userSearchInput) {
+        userSearchInput.addEventListener('input', function() {
+            const searchTerm = this.value.toLowerCase();
+            filterUsers(searchTerm);
+            
+            if (clearUserSearch) {
+                clearUserSearch.style.display = searchTerm ? 'block' : 'none';
+            }
+        });
+    }
+
+    if (clearUserSearch) {
+        clearUserSearch.addEventListener('click', function() {
+            userSearchInput.value = '';
+            filterUsers('');
+            this.style.display = 'none';
+        });
+    }
+
+    // Role Filter Functionality
+    document.querySelectorAll('.role-filter-tab').forEach(tab => {
+        tab.addEventListener('click', function() {
+            document.querySelectorAll('.role-filter-tab').forEach(t => t.classList.remove('active'));
+            this.classList.add('active');
+            
+            const filter = this.getAttribute('data-filter');
+            filterUsersByRole(filter);
+        });
+    });
+})();
+
+// API Functions
+async function loadUsers() {
+    try {
+        const response = await fetch('/api/users');
+        const data = await response.json();
+        
+        if (data.success) {
+            displayUsers(data.users);
+        } else {
+            console.error('Failed to load users:', data.error);
+            showNotification('Failed to load users', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading users:', error);
+        showNotification('Error loading users', 'error');
+    }
+}
+
+function displayUsers(users) {
+    const tbody = document.getElementById('usersTableBody');
+    tbody.innerHTML = '';
+    
+    users.forEach((user, index) => {
+        const row = document.createElement('tr');
+        const formattedDate = user.created_at ? new Date(user.created_at).toLocaleDateString('en-US', { 
+            year: 'numeric', 
+            month: 'short', 
+            day: 'numeric' 
+        }) : 'N/A';
+        
+        const roleClass = user.role === 'admin' ? 'status-confirmed' : 
+                         user.role === 'priest' ? 'status-info' : 'status-pending';
+        
+        row.innerHTML = `
+            <td>#${String(index + 1).padStart(3, '0')}</td>
+            <td>${user.full_name}</td>
+            <td>${user.username}</td>
+            <td>${user.email}</td>
+            <td><span class="status-badge ${roleClass}">${user.role.charAt(0).toUpperCase() + user.role.slice(1)}</span></td>
+            <td><span class="status-badge status-confirmed">${user.status.charAt(0).toUpperCase() + user.status.slice(1)}</span></td>
+            <td>${formattedDate}</td>
+            <td class="table-actions">
+                <button class="action-btn" data-action="view" data-user-id="${user.id}" title="View Details">
+                    <i class="fas fa-eye"></i>
+                </button>
+                <button class="action-btn" data-action="edit" data-user-id="${user.id}" title="Edit User">
+                    <i class="fas fa-edit"></i>
+                </button>
+                <button class="action-btn" data-action="reset-password" data-user-id="${user.id}" title="Reset Password">
+                    <i class="fas fa-key"></i>
+                </button>
+                ${user.role !== 'admin' ? `
+                <button class="action-btn action-btn-danger" data-action="delete" data-user-id="${user.id}" title="Delete User">
+                    <i class="fas fa-trash"></i>
+                </button>
+                ` : ''}
+            </td>
+        `;
+        tbody.appendChild(row);
+    });
+}
+
+async function createUser() {
+    const form = document.getElementById('addUserForm');
+    const formData = new FormData(form);
+    
+    // Get form values
+    const fullName = formData.get('full_name');
+    const username = formData.get('username');
+    const email = formData.get('email');
+    const password = formData.get('password');
+    const confirmPassword = formData.get('confirm_password');
+    const role = formData.get('role');
+    
+    // Validate required fields
+    if (!fullName || !username || !email || !password || !confirmPassword || !role) {
+        showNotification('Please fill in all required fields', 'error');
+        return;
+    }
+    
+    // Validate password confirmation
+    if (password !== confirmPassword) {
+        showNotification('Passwords do not match', 'error');
+        return;
+    }
+    
+    // Validate password strength
+    if (password.length < 6) {
+        showNotification('Password must be at least 6 characters long', 'error');
+        return;
+    }
+    
+    // Validate email format
+    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    if (!emailRegex.test(email)) {
+        showNotification('Please enter a valid email address', 'error');
+        return;
+    }
+    
+    const userData = {
+        full_name: fullName.trim(),
+        username: username.trim(),
+        email: email.trim(),
+        password: password,
+        role: role
+    };
+    
+    try {
+        // Show loading state
+        const saveButton = document.getElementById('saveNewUser');
+        const originalText = saveButton.innerHTML;
+        saveButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Creating...';
+        saveButton.disabled = true;
+        
+        console.log('Creating new user:', userData.username, userData.email, userData.role);
+        
+        const response = await fetch('/api/users', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(userData)
+        });
+        
+        const data = await response.json();
+        console.log('User creation response:', data);
+        
+        // Restore button state
+        saveButton.innerHTML = originalText;
+        saveButton.disabled = false;
+        
+        if (data.success) {
+            document.getElementById('addUserModal').style.display = 'none';
+            showNotification(`User "${userData.full_name}" created successfully! They can now login with username "${userData.username}".`, 'success');
+            form.reset(); // Clear the form
+            loadUsers(); // Reload users table
+        } else {
+            showNotification(data.error || 'Failed to create user', 'error');
+        }
+    } catch (error) {
+        console.error('Error creating user:', error);
+        showNotification('Network error: Unable to create user', 'error');
+        
+        // Restore button state on error
+        const saveButton = document.getElementById('saveNewUser');
+        saveButton.innerHTML = '<i class="fas fa-save"></i> Create User';
+        saveButton.disabled = false;
+    }
+}
+
+
+async function viewUser(userId) {
+    try {
+        const response = await fetch(`/api/users/${userId}`);
+        const data = await response.json();
+        
+        if (data.success) {
+            const user = data.user;
+            
+            // Populate view modal with user data
+            document.getElementById('viewUserFullName').textContent = user.full_name || '-';
+            document.getElementById('viewUserUsername').textContent = user.username || '-';
+            document.getElementById('viewUserEmail').textContent = user.email || '-';
+            
+            // Format role with proper styling
+            const roleElement = document.getElementById('viewUserRole');
+            roleElement.textContent = user.role ? user.role.charAt(0).toUpperCase() + user.role.slice(1) : '-';
+            roleElement.className = 'form-display role-badge';
+            
+            // Format status with proper styling
+            const statusElement = document.getElementById('viewUserStatus');
+            statusElement.textContent = user.status ? user.status.charAt(0).toUpperCase() + user.status.slice(1) : '-';
+            statusElement.className = 'form-display status-badge';
+            
+            // Format created date
+            const createdDate = user.created_at ? new Date(user.created_at).toLocaleDateString('en-US', {
+                year: 'numeric',
+                month: 'long',
+                day: 'numeric',
+                hour: '2-digit',
+                minute: '2-digit'
+            }) : 'Not Available';
+            document.getElementById('viewUserCreated').textContent = createdDate;
+            
+            // Add email styling
+            const emailElement = document.getElementById('viewUserEmail');
+            emailElement.className = 'form-display email-display';
+            
+            document.getElementById('viewUserModal').style.display = 'flex';
+        } else {
+            showNotification(data.error || 'Failed to load user details', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading user:', error);
+        showNotification('Error loading user details', 'error');
+    }
+}
+
+async function editUser(userId) {
+    try {
+        const response = await fetch(`/api/users/${userId}`);
+        const data = await response.json();
+        
+        if (data.success) {
+            const user = data.user;
+            
+            document.getElementById('editUserId').value = user.id;
+            document.getElementById('editUserFullName').value = user.full_name;
+            document.getElementById('editUserUsername').value = user.username;
+            document.getElementById('editUserEmail').value = user.email;
+            document.getElementById('editUserRole').value = user.role;
+            document.getElementById('editUserStatus').value = user.status;
+            
+            document.getElementById('editUserModal').style.display = 'flex';
+        } else {
+            showNotification(data.error || 'Failed to load user details', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading user:', error);
+        showNotification('Error loading user details', 'error');
+    }
+}
+
+async function deleteUser(userId) {
+    try {
+        const response = await fetch(`/api/users/${userId}`);
+        const data = await response.json();
+        
+        if (data.success) {
+            const user = data.user;
+            
+            document.getElementById('deleteUserId').value = user.id;
+            document.getElementById('deleteUserName').textContent = user.full_name;
+            document.getElementById('deleteUserUsername').textContent = user.username;
+            document.getElementById('deleteUserRole').textContent = user.role.charAt(0).toUpperCase() + user.role.slice(1);
+            
+            document.getElementById('deleteUserModal').style.display = 'flex';
+        } else {
+            showNotification(data.error || 'Failed to load user details', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading user:', error);
+        showNotification('Error loading user details', 'error');
+    }
+}
+
+async function resetPassword(userId) {
+    try {
+        const response = await fetch(`/api/users/${userId}`);
+        const data = await response.json();
+        
+        if (data.success) {
+            const user = data.user;
+            
+            document.getElementById('resetPasswordUserId').value = user.id;
+            document.getElementById('resetPasswordUserName').textContent = user.full_name;
+            
+            document.getElementById('resetPasswordModal').style.display = 'flex';
+        } else {
+            showNotification(data.error || 'Failed to load user details', 'error');
+        }
+    } catch (error) {
+        console.error('Error loading user:', error);
+        showNotification('Error loading user details', 'error');
+    }
+}
+
+// Additional CRUD Operations
+async function updateUser() {
+    const userId = document.getElementById('editUserId').value;
+    const form = document.getElementById('editUserForm');
+    const formData = new FormData(form);
+    
+    // Validate required fields
+    const fullName = formData.get('full_name');
+    const username = formData.get('username');
+    const email = formData.get('email');
+    const role = formData.get('role');
+    
+    if (!fullName || !username || !email || !role) {
+        showNotification('Please fill in all required fields', 'error');
+        return;
+    }
+    
+    // Validate email format
+    const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+    if (!emailRegex.test(email)) {
+        showNotification('Please enter a valid email address', 'error');
+        return;
+    }
+    
+    const userData = {
+        full_name: fullName.trim(),
+        username: username.trim(),
+        email: email.trim(),
+        role: role,
+        status: formData.get('status') || 'active'
+    };
+    
+    try {
+        // Show loading state
+        const saveButton = document.getElementById('saveEditUser');
+        const originalText = saveButton.innerHTML;
+        saveButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Updating...';
+        saveButton.disabled = true;
+        
+        const response = await fetch(`/api/users/${userId}`, {
+            method: 'PUT',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(userData)
+        });
+        
+        const data = await response.json();
+        
+        // Restore button state
+        saveButton.innerHTML = originalText;
+        saveButton.disabled = false;
+        
+        if (data.success) {
+            document.getElementById('editUserModal').style.display = 'none';
+            showNotification('User updated successfully!', 'success');
+            loadUsers(); // Reload users table
+        } else {
+            showNotification(data.error || 'Failed to update user', 'error');
+        }
+    } catch (error) {
+        console.error('Error updating user:', error);
+        showNotification('Network error: Unable to update user', 'error');
+        
+        // Restore button state on error
+        const saveButton = document.getElementById('saveEditUser');
+        saveButton.innerHTML = '<i class="fas fa-save"></i> Update User';
+        saveButton.disabled = false;
+    }
+}
+
+async function confirmDeleteUser() {
+    const userId = document.getElementById('deleteUserId').value;
+    
+    try {
+        const response = await fetch(`/api/users/${userId}`, {
+            method: 'DELETE'
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            document.getElementById('deleteUserModal').style.display = 'none';
+            showNotification('User deleted successfully', 'success');
+            loadUsers(); // Reload users table
+        } else {
+            showNotification(data.error || 'Failed to delete user', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting user:', error);
+        showNotification('Error deleting user', 'error');
+    }
+}
+
+async function confirmResetPassword() {
+    const userId = document.getElementById('resetPasswordUserId').value;
+    const form = document.getElementById('resetPasswordForm');
+    const formData = new FormData(form);
+    
+    const newPassword = formData.get('new_password');
+    const confirmPassword = formData.get('confirm_new_password');
+    
+    // Validate required fields
+    if (!newPassword || !confirmPassword) {
+        showNotification('Please fill in all password fields', 'error');
+        return;
+    }
+    
+    // Validate password match
+    if (newPassword !== confirmPassword) {
+        showNotification('Passwords do not match', 'error');
+        return;
+    }
+    
+    // Validate password strength
+    if (newPassword.length < 6) {
+        showNotification('Password must be at least 6 characters long', 'error');
+        return;
+    }
+    
+    const resetData = {
+        new_password: newPassword
+    };
+    
+    try {
+        // Show loading state
+        const resetButton = document.getElementById('confirmResetPassword');
+        const originalText = resetButton.innerHTML;
+        resetButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Resetting...';
+        resetButton.disabled = true;
+        
+        console.log('Sending password reset request for user:', userId);
+        
+        const response = await fetch(`/api/users/${userId}/reset-password`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(resetData)
+        });
+        
+        const data = await response.json();
+        console.log('Password reset response:', data);
+        
+        // Restore button state
+        resetButton.innerHTML = originalText;
+        resetButton.disabled = false;
+        
+        if (data.success) {
+            document.getElementById('resetPasswordModal').style.display = 'none';
+            showNotification('Password reset successfully! User can now login with the new password.', 'success');
+            form.reset();
+            
+            // Refresh users table to show updated timestamp
+            loadUsers();
+        } else {
+            showNotification(data.error || 'Failed to reset password', 'error');
+        }
+    } catch (error) {
+        console.error('Error resetting password:', error);
+        showNotification('Network error: Unable to reset password', 'error');
+        
+        // Restore button state on error
+        const resetButton = document.getElementById('confirmResetPassword');
+        resetButton.innerHTML = '<i class="fas fa-key"></i> Reset Password';
+        resetButton.disabled = false;
+    }
+}
+
+
+// Refresh functionality
+function refreshUsers() {
+    loadUsers();
+    showNotification('Users refreshed', 'success');
+}
+
+function filterUsers(searchTerm) {
+    const rows = document.querySelectorAll('#usersTableBody tr');
+    rows.forEach(row => {
+        const text = row.textContent.toLowerCase();
+        row.style.display = text.includes(searchTerm) ? '' : 'none';
+    });
+}
+
+function filterUsersByRole(role) {
+    const rows = document.querySelectorAll('#usersTableBody tr');
+    rows.forEach(row => {
+        if (role === 'all') {
+            row.style.display = '';
+        } else {
+            const roleCell = row.querySelector('td:nth-child(5)');
+            const userRole = roleCell ? roleCell.textContent.toLowerCase() : '';
+            row.style.display = userRole.includes(role) ? '' : 'none';
+        }
+    });
+}
+
+// Event Listeners for Modal Actions
+(function() {
+    // Save Edit User
+    const saveEditUser = document.getElementById('saveEditUser');
+    if (saveEditUser) {
+        saveEditUser.addEventListener('click', updateUser);
+    }
+    
+    // Confirm Delete User
+    const confirmDeleteUserBtn = document.getElementById('confirmDeleteUser');
+    if (confirmDeleteUserBtn) {
+        confirmDeleteUserBtn.addEventListener('click', confirmDeleteUser);
+    }
+    
+    // Confirm Reset Password
+    const confirmResetPasswordBtn = document.getElementById('confirmResetPassword');
+    if (confirmResetPasswordBtn) {
+        confirmResetPasswordBtn.addEventListener('click', confirmResetPassword);
+    }
+    
+    // Refresh Users Button
+    const refreshUsersBtn = document.getElementById('refreshUsersBtn');
+    if (refreshUsersBtn) {
+        refreshUsersBtn.addEventListener('click', refreshUsers);
+    }
+})();
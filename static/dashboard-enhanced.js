@@ -624,8 +624,15 @@ class CalendarManager {
         });
     }
 
-    // Refresh every 30 seconds
-    setInterval(refreshDashboardData, 30000);
+    // Refresh on live updates; poll every 30 seconds only while the stream is down
+    if (window.ChurchEaseLive) {
+        window.ChurchEaseLive.on('', refreshDashboardData);
+    }
+    setInterval(() => {
+        if (!window.ChurchEaseLive || !window.ChurchEaseLive.connected) {
+            refreshDashboardData();
+        }
+    }, 30000);
 
     // Responsive adjustments
     function handleResponsive() {
@@ -0,0 +1,69 @@
+// ChurchEase Live Updates
+// Listens to /api/stream (Server-Sent Events) and tells the dashboard what changed.
+// Polling loops check ChurchEaseLive.connected and only run while the stream is down.
+window.ChurchEaseLive = (function() {
+    const handlers = [];
+    let source = null;
+    let everConnected = false;
+
+    const live = {
+        connected: false,
+
+        // handler(change) is called for every change whose type starts with prefix
+        // ('reservation', 'payment', 'event', or '' for everything)
+        on(prefix, handler) {
+            handlers.push({ prefix, handler });
+        }
+    };
+
+    function dispatch(change) {
+        handlers.forEach(({ prefix, handler }) => {
+            if (!prefix || change.type === prefix || change.type.startsWith(prefix + '.')) {
+                try {
+                    handler(change);
+                } catch (error) {
+                    console.error('Live update handler failed:', error);
+                }
+            }
+        });
+    }
+
+    function connect() {
+        if (!window.EventSource) {
+            console.log('ℹ️ EventSource not supported, staying on polling');
+            return;
+        }
+
+        source = new EventSource('/api/stream');
+
+        source.addEventListener('ready', () => {
+            live.connected = true;
+            console.log('🔴 Live updates connected');
+            // After a reconnect, pick up anything missed while the stream was down
+            if (everConnected) {
+                dispatch({ type: 'resync' });
+            }
+            everConnected = true;
+        });
+
+        source.addEventListener('change', (e) => {
+            try {
+                dispatch(JSON.parse(e.data));
+            } catch (error) {
+                console.error('Invalid live update:', error);
+            }
+        });
+
+        source.addEventListener('resync', () => {
+            dispatch({ type: 'resync' });
+        });
+
+        source.onerror = () => {
+            // EventSource reconnects by itself; poll until the next 'ready'
+            live.connected = false;
+        };
+    }
+
+    document.addEventListener('DOMContentLoaded', connect);
+    return live;
+})();
@@ -5,12 +5,31 @@ class ReservationTableManager {
         this.filteredReservations = [];
         this.currentFilter = 'all';
         this.sortDirection = 'none'; // 'asc', 'desc', 'none'
+        this.syncCursor = null; // cursor for /api/sync delta refreshes
         this.init();
     }
 
     init() {
         this.loadReservations();
         this.setupEventListeners();
+        
+        // Live updates push changes; the 30-second delta poll only runs while the stream is down
+        if (window.ChurchEaseLive) {
+            ['reservation', 'payment', 'resync'].forEach(type => {
+                window.ChurchEaseLive.on(type, () => this.scheduleSync());
+            });
+        }
+        setInterval(() => {
+            if (!window.ChurchEaseLive || !window.ChurchEaseLive.connected) {
+                this.syncReservations();
+            }
+        }, 30000);
+    }
+
+    // Coalesce bursts of live notifications into one delta sync
+    scheduleSync() {
+        clearTimeout(this.syncTimer);
+        this.syncTimer = setTimeout(() => this.syncReservations(), 300);
     }
 
     async loadReservations() {
@@ -34,6 +53,7 @@ class ReservationTableManager {
             
             if (result.success) {
                 this.reservations = result.data;
+                this.syncCursor = result.sync_cursor || null;
                 console.log(`✅ Loaded ${this.reservations.length} reservations`);
                 
                 // Process auto-completion for past reservations
@@ -603,6 +623,61 @@ class ReservationTableManager {
         this.loadReservations();
     }
 
+    // /api/reservations/all queries newest-first, then re-sorts its response
+    // oldest-first before numbering display_id; merged rows must keep that
+    // order. Compares code points like Python's sort, not localeCompare.
+    sortByCreatedAt(reservations) {
+        return reservations.sort((a, b) => {
+            const createdA = String(a.created_at || '');
+            const createdB = String(b.created_at || '');
+            return createdA < createdB ? -1 : (createdA > createdB ? 1 : 0);
+        });
+    }
+
+    // Merge reservations changed or deleted since the last load (see /api/sync)
+    async syncReservations() {
+        if (!this.syncCursor) {
+            return this.loadReservations();
+        }
+        
+        try {
+            const response = await fetch(`/api/sync?since=${encodeURIComponent(this.syncCursor)}`, { cache: 'no-store' });
+            const result = await response.json();
+            
+            if (!result.success) {
+                console.error('Failed to sync reservations:', result.error);
+                return;
+            }
+            
+            this.syncCursor = result.cursor;
+            const changed = result.data.reservations || [];
+            const deletedIds = new Set((result.deleted.reservations || []).map(String));
+            if (changed.length === 0 && deletedIds.size === 0) {
+                return;
+            }
+            
+            const byId = new Map();
+            this.reservations.forEach(reservation => {
+                if (!deletedIds.has(String(reservation.id))) {
+                    byId.set(String(reservation.id), reservation);
+                }
+            });
+            changed.forEach(reservation => byId.set(String(reservation.id), reservation));
+            
+            this.reservations = Array.from(byId.values());
+            this.sortByCreatedAt(this.reservations);
+            console.log(`🔄 Synced ${changed.length} changed, ${deletedIds.size} deleted reservations`);
+            
+            // Same post-processing as a full load
+            this.processAutoCompletion();
+            
+            // Re-render keeping the active service filter and sort
+            this.filterReservations(this.currentFilter);
+        } catch (error) {
+            console.error('Error syncing reservations:', error);
+        }
+    }
+
     toggleDateSort() {
         const sortIcon = document.querySelector('.sort-icon');
         
@@ -721,7 +796,7 @@ class ReservationTableManager {
                     <div class="loading-container" style="display: flex; flex-direction: column; align-items: center; gap: 20px;">
                         <!-- ChurchEase Logo -->
                         <div class="loading-logo" style="animation: pulse 2s ease-in-out infinite;">
-                            <img src="/static/ChurchLogo.jpg" alt="ChurchEase" style="
+                            <img src="/static/img/ChurchLogo-128.png" alt="ChurchEase" style="
                                 width: 120px;
                                 height: 120px;
                                 object-fit: contain;
@@ -918,13 +993,9 @@ async function populateViewModal(reservation) {
     } else {
         // Fetch stipendium information from database for other services
         try {
-            const paymentLookupKey = reservation.reservation_id || reservation.id;
-            console.log('Fetching stipendium using identifier:', paymentLookupKey, '(code:', reservation.reservation_id, 'db id:', reservation.id, ')');
-            const paymentResponse = await fetch(`/api/payments/${paymentLookupKey}`);
-            console.log('Stipendium response status:', paymentResponse.status);
+            const paymentResult = await loadReservationPayment(reservation);
             
-            if (paymentResponse.ok) {
-                const paymentResult = await paymentResponse.json();
+            if (paymentResult) {
                 console.log('Stipendium API result:', paymentResult);
                 
                 if (paymentResult.success) {
@@ -970,6 +1041,21 @@ async function populateViewModal(reservation) {
     setupAttendanceTracking(reservation);
 }
 
+/**
+ * Stipendium for a reservation as {success, data}, or null if the request failed.
+ * GET /api/reservations/<id> already includes it as `payment`; rows from the
+ * table data do not, so those still ask /api/payments.
+ */
+async function loadReservationPayment(reservation) {
+    if ('payment' in reservation) {
+        return { success: Boolean(reservation.payment), data: reservation.payment };
+    }
+    const paymentLookupKey = reservation.reservation_id || reservation.id;
+    console.log('Fetching stipendium using identifier:', paymentLookupKey, '(code:', reservation.reservation_id, 'db id:', reservation.id, ')');
+    const paymentResponse = await fetch(`/api/payments/${paymentLookupKey}`);
+    return paymentResponse.ok ? paymentResponse.json() : null;
+}
+
 function setDefaultPaymentInfo(reservation) {
     // Find the stipendium section in View Modal
     const stipendiumSection = document.querySelector('#viewReservationModal .reservation-section:has(#detail-payment-status)');
@@ -1985,12 +2071,9 @@ async function populateEditPaymentInfo(reservation) {
     
     // Fetch payment information from API
     try {
-        const paymentLookupKey = reservation.reservation_id || reservation.id;
-        const paymentResponse = await fetch(`/api/payments/${paymentLookupKey}`);
+        const paymentResult = await loadReservationPayment(reservation);
         
-        if (paymentResponse.ok) {
-            const paymentResult = await paymentResponse.json();
-            
+        if (paymentResult) {
             if (paymentResult.success && paymentResult.data) {
                 const payment = paymentResult.data;
                 